@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "accounts"
+
+    def ready(self):
+        # 인증 cache 가 User 변경을 놓치지 않도록 첫 요청 전에 signal receiver 를 연결한다.
+        import common.authentication  # noqa: F401
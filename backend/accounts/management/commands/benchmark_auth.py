@@ -0,0 +1,52 @@
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from common.authentication import TEAM_CLAIM, TeamClaimJWTAuthentication
+from common.cache import TTLLRUCache
+from common.models import Base
+
+
+class Command(BaseCommand):
+    help = "같은 access token 으로 반복 인증할 때 요청당 인증 시간을 token cache 사용 전후로 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20000)
+
+    def handle(self, *args, iterations: int, **options):
+        # DB 조회 없이 인증 자체의 비용만 측정하도록 team claim 이 있는 token 을 사용한다.
+        token = AccessToken()
+        token[api_settings.USER_ID_CLAIM] = 0
+        token[TEAM_CLAIM] = Base.TeamChoices.DANBIE
+
+        request = APIRequestFactory().get(
+            "/",
+            HTTP_AUTHORIZATION=f"Bearer {token}",
+        )
+
+        caches = {
+            "without token cache": TTLLRUCache(maxsize=0, ttl=0),
+            "with token cache": TTLLRUCache(
+                maxsize=settings.AUTH_TOKEN_CACHE["MAXSIZE"],
+                ttl=settings.SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"].total_seconds(),
+            ),
+        }
+
+        for label, token_cache in caches.items():
+            authentication = TeamClaimJWTAuthentication()
+            authentication.token_cache = token_cache
+            authentication.authenticate(request)
+
+            started_at = perf_counter()
+            for _ in range(iterations):
+                authentication.authenticate(request)
+            elapsed = perf_counter() - started_at
+
+            self.stdout.write(
+                f"{label:<20} {elapsed / iterations * 1e6:8.2f} us/request "
+                f"{iterations / elapsed:10.0f} requests/sec",
+            )
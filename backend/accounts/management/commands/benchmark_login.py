@@ -0,0 +1,68 @@
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from django.utils.module_loading import import_string
+
+
+class Command(BaseCommand):
+    help = (
+        "hasher 별로 로그인 시 비밀번호 검증에 걸리는 시간을 측정하여 core 당 초당 로그인 수를 출력합니다. "
+        "--set 으로 PASSWORD_HASHER_OPTIONS 의 비용 값을 바꿔 측정할 수 있습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hashers",
+            nargs="+",
+            choices=list(settings.PASSWORD_HASHER_CLASSES),
+            default=list(settings.PASSWORD_HASHER_CLASSES),
+        )
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument(
+            "--set",
+            action="append",
+            default=[],
+            metavar="OPTION=VALUE",
+            help="예: --set SCRYPT_WORK_FACTOR=32768",
+        )
+
+    def handle(self, *args, hashers: list, iterations: int, **options):
+        hasher_options = dict(settings.PASSWORD_HASHER_OPTIONS)
+
+        for option in options["set"]:
+            name, _, value = option.partition("=")
+            if name not in hasher_options or not value.isdigit():
+                raise CommandError(f"Invalid option: {option}")
+            hasher_options[name] = int(value)
+
+        with override_settings(PASSWORD_HASHER_OPTIONS=hasher_options):
+            for name in hashers:
+                self.benchmark(name, iterations)
+
+    def benchmark(self, name: str, iterations: int) -> None:
+        hasher = import_string(settings.PASSWORD_HASHER_CLASSES[name])()
+        password = "benchmark-password"
+
+        try:
+            encoded = hasher.encode(password, hasher.salt())
+        except ValueError as error:
+            # argon2-cffi 처럼 설치되지 않은 library 가 필요한 경우
+            self.stdout.write(f"{name:<8} skipped: {error}")
+            return
+
+        started_at = perf_counter()
+        for _ in range(iterations):
+            hasher.verify(password, encoded)
+        elapsed = perf_counter() - started_at
+
+        summary = ", ".join(
+            f"{key}={value}"
+            for key, value in hasher.safe_summary(encoded).items()
+            if key not in ("salt", "hash")
+        )
+        self.stdout.write(
+            f"{name:<8} {elapsed / iterations * 1000:8.1f} ms/login "
+            f"{iterations / elapsed:8.1f} logins/sec/core ({summary})",
+        )
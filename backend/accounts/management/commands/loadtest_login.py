@@ -0,0 +1,131 @@
+from time import perf_counter
+from uuid import uuid4
+import asyncio
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils.module_loading import import_string
+
+from accounts.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "ASGI handler 로 sync 로그인 뷰와 async 로그인 뷰에 동시 요청을 보내 처리량을 비교합니다. "
+        "로그인 요청과 함께 다른 sync 뷰(잘못된 회원가입 요청)의 응답 시간도 측정합니다. "
+        "--username, --password 로 측정에 사용할 기존 계정을 지정합니다. "
+        "지정하지 않으면 DEBUG 에서만 측정용 유저를 만들었다가 끝나면 삭제합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument("--requests", type=int, default=64)
+        parser.add_argument("--username")
+        parser.add_argument("--password")
+
+    def handle(
+        self,
+        *args,
+        concurrency: int,
+        requests: int,
+        username: str,
+        password: str,
+        **options,
+    ):
+        if username is not None:
+            if password is None:
+                raise CommandError("--username 과 함께 --password 를 지정해야 합니다.")
+            if not User.objects.filter(username=username).exists():
+                raise CommandError(f"{username} 유저가 없습니다.")
+        elif not settings.DEBUG:
+            # 설정된 DB 에 유저를 만들고 지우므로 운영 DB 에서는 실행하지 않는다.
+            raise CommandError(
+                "DEBUG 가 아니면 --username, --password 로 기존 계정을 지정해야 합니다.",
+            )
+
+        # async 를 지원하지 않는 middleware 가 하나라도 있으면 async 뷰도 sync thread 에서 실행된다.
+        sync_only_middleware = [
+            path
+            for path in settings.MIDDLEWARE
+            if not getattr(import_string(path), "async_capable", False)
+        ]
+        if sync_only_middleware:
+            self.stderr.write(
+                "async 를 지원하지 않는 middleware 가 있어 async 뷰도 sync 로 실행됩니다: "
+                + ", ".join(sync_only_middleware),
+            )
+
+        if username is not None:
+            login_data = {"username": username, "password": password}
+            user = None
+        else:
+            login_data = {
+                "username": f"loadtest-{uuid4().hex[:12]}",
+                "password": uuid4().hex,
+            }
+            user = User.objects.create_user(
+                team=User.TeamChoices.DANBIE,
+                **login_data,
+            )
+
+        try:
+            for name in ("login", "async_login"):
+                elapsed, failures, probe_latency = asyncio.run(
+                    self.load(reverse(name), login_data, concurrency, requests),
+                )
+                self.stdout.write(
+                    f"{name:<12} {requests / elapsed:8.1f} req/sec "
+                    f"{elapsed / requests * 1000:8.1f} ms/req "
+                    f"other requests {probe_latency * 1000:8.1f} ms/req "
+                    f"(concurrency={concurrency}, failures={failures}, "
+                    f"workers={settings.PASSWORD_HASHING_WORKERS})",
+                )
+        finally:
+            if user is not None:
+                user.delete()
+
+    async def load(
+        self,
+        url: str,
+        login_data: dict,
+        concurrency: int,
+        requests: int,
+    ) -> tuple:
+        client = AsyncClient()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def login() -> int:
+            async with semaphore:
+                response = await client.post(
+                    url,
+                    login_data,
+                    content_type="application/json",
+                )
+                return response.status_code
+
+        async def probe(done: asyncio.Event) -> float:
+            # sync 뷰는 ASGI 에서 하나의 thread 를 공유하므로 sync 로그인이 끝나기를 기다린다.
+            latencies = []
+            while not done.is_set():
+                started_at = perf_counter()
+                await client.post(reverse("signup"), {})
+                latencies.append(perf_counter() - started_at)
+            return sum(latencies) / len(latencies)
+
+        done = asyncio.Event()
+        probe_task = asyncio.create_task(probe(done))
+
+        started_at = perf_counter()
+        status_codes = await asyncio.gather(*(login() for _ in range(requests)))
+        elapsed = perf_counter() - started_at
+
+        done.set()
+        probe_latency = await probe_task
+
+        return (
+            elapsed,
+            sum(status_code != 200 for status_code in status_codes),
+            probe_latency,
+        )
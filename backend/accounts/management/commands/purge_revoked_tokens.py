@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from accounts.models import RevokedToken
+
+
+class Command(BaseCommand):
+    help = (
+        "만료된 폐기 token 내역을 revoked_tokens 테이블에서 삭제합니다. "
+        "만료된 token 은 폐기 여부와 상관없이 거부되므로 cron 등으로 주기적으로 실행합니다. "
+        "한 번에 오래 잠그지 않도록 --batch-size 개씩 나누어 삭제합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, batch_size: int, **options):
+        now = timezone.now()
+        deleted = 0
+
+        while True:
+            expired_ids = list(
+                RevokedToken.objects.filter(expires_at__lte=now).values_list(
+                    "pk",
+                    flat=True,
+                )[:batch_size],
+            )
+
+            if not expired_ids:
+                break
+
+            count, _ = RevokedToken.objects.filter(pk__in=expired_ids).delete()
+            deleted += count
+
+        self.stdout.write(f"deleted {deleted} expired revoked tokens")
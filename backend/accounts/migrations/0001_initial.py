@@ -0,0 +1,81 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:19
+
+import django.contrib.auth.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="User",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("password", models.CharField(max_length=128, verbose_name="password")),
+                (
+                    "last_login",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="last login"
+                    ),
+                ),
+                (
+                    "team",
+                    models.CharField(
+                        choices=[
+                            ("Danbie", "단비"),
+                            ("Darae", "다래"),
+                            ("Blabla", "블라블라"),
+                            ("Cheollo", "철로"),
+                            ("Dangi", "땅이"),
+                            ("Haetae", "해태"),
+                            ("Supi", "수피"),
+                        ],
+                        max_length=10,
+                        verbose_name="팀 소속",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "modified_at",
+                    models.DateTimeField(auto_now=True, verbose_name="생성일"),
+                ),
+                (
+                    "username",
+                    models.CharField(
+                        error_messages={
+                            "unique": "A user with that username already exists."
+                        },
+                        help_text=(
+                            "Required. 150 characters or fewer. "
+                            "Letters, digits and @/./+/-/_ only."
+                        ),
+                        max_length=150,
+                        unique=True,
+                        validators=[
+                            django.contrib.auth.validators.UnicodeUsernameValidator()
+                        ],
+                        verbose_name="username",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "직원",
+                "verbose_name_plural": "직원 목록",
+                "db_table": "users",
+            },
+        ),
+    ]
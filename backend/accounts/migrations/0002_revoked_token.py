@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RevokedToken",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "jti",
+                    models.CharField(
+                        max_length=255, unique=True, verbose_name="token 식별자"
+                    ),
+                ),
+                ("expires_at", models.DateTimeField(db_index=True, verbose_name="만료일")),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, db_index=True, verbose_name="폐기일"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "폐기된 토큰",
+                "verbose_name_plural": "폐기된 토큰 목록",
+                "db_table": "revoked_tokens",
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-18 08:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0002_revoked_token"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="revokedtoken",
+            name="user_id",
+            field=models.BigIntegerField(blank=True, null=True, verbose_name="유저 식별자"),
+        ),
+        migrations.AlterField(
+            model_name="revokedtoken",
+            name="jti",
+            field=models.CharField(
+                blank=True,
+                max_length=255,
+                null=True,
+                unique=True,
+                verbose_name="token 식별자",
+            ),
+        ),
+    ]
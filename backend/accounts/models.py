@@ -3,6 +3,7 @@ from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.utils.translation import gettext_lazy as _
 from django.db import models
 
+from common.executors import run_in_password_executor
 from common.models import Base
 
 
@@ -23,6 +24,23 @@ class UserManager(BaseUserManager):
 
         return user
 
+    async def acreate_user(self, username: str, password: str, team, **kwargs):
+        """create_user 의 async 버전. 비밀번호 hash 는 event loop 밖의 thread 에서 계산한다."""
+        if not username:
+            raise ValueError("Please enter your username")
+        if not password:
+            raise ValueError("Please enter your password")
+
+        user = self.model(
+            username=username,
+            team=team,
+            **kwargs,
+        )
+        await run_in_password_executor(user.set_password, password)
+        await user.asave(using=self._db)
+
+        return user
+
 
 class User(AbstractBaseUser, Base):
     username_validator = UnicodeUsernameValidator()
@@ -42,12 +60,64 @@ class User(AbstractBaseUser, Base):
     )
 
     USERNAME_FIELD = "username"
+    # 업무 응답에 작성자 정보로 함께 담기는 필드
+    RENDERED_FIELDS = ("username", "team")
     objects = UserManager()
 
     def __str__(self) -> str:
         return f"User(username={self.username}, team={self.team})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """조회 시점의 RENDERED_FIELDS 값을 기록해 두고, 저장 시 응답 cache 를 무효화할지 판단하는 데 사용한다."""
+        instance = super().from_db(db, field_names, values)
+        instance.remember_rendered_fields()
+        return instance
+
+    def remember_rendered_fields(self) -> None:
+        self._loaded_rendered_fields = self.get_rendered_fields()
+
+    def get_rendered_fields(self) -> dict:
+        return {name: self.__dict__.get(name) for name in self.RENDERED_FIELDS}
+
     class Meta:
         db_table = "users"
         verbose_name = "직원"
         verbose_name_plural = "직원 목록"
+
+
+class RevokedToken(models.Model):
+    """폐기된 token 내역.
+    jti 가 있으면 해당 token 하나를, user_id 가 있으면 그 유저의 access token 중
+    created_at 이전에 발급된 token 을 모두 폐기한다.
+    """
+
+    jti = models.CharField(
+        verbose_name="token 식별자",
+        max_length=255,
+        unique=True,
+        null=True,
+        blank=True,
+    )
+    user_id = models.BigIntegerField(
+        verbose_name="유저 식별자",
+        null=True,
+        blank=True,
+    )
+    expires_at = models.DateTimeField(verbose_name="만료일", db_index=True)
+    created_at = models.DateTimeField(
+        verbose_name="폐기일",
+        auto_now_add=True,
+        db_index=True,
+    )
+
+    def __str__(self) -> str:
+        return (
+            f"RevokedToken(jti={self.jti}, user_id={self.user_id}, "
+            f"expires_at={self.expires_at})"
+        )
+
+    class Meta:
+        db_table = "revoked_tokens"
+        verbose_name = "폐기된 토큰"
+        verbose_name_plural = "폐기된 토큰 목록"
@@ -1,6 +1,15 @@
+from django.conf import settings
 from django.contrib.auth import password_validation
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
 
+from common.authentication import TEAM_CLAIM
+from common.revocation import revocation_list
 from accounts.models import User
 
 
@@ -17,6 +26,16 @@ class SignupSerializer(serializers.ModelSerializer):
         )
         return user
 
+    async def asave(self) -> User:
+        """save 의 async 버전. 비밀번호 hash 는 event loop 밖의 thread 에서 계산한다."""
+        validated_data = self.validated_data
+        self.instance = await User.objects.acreate_user(
+            username=validated_data.get("username"),
+            password=validated_data.get("password"),
+            team=validated_data.get("team"),
+        )
+        return self.instance
+
     def validate_password(self, data):
         password_validation.validate_password(data, self.instance)
         return data
@@ -32,3 +51,62 @@ class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ["id", "username", "team"]
+
+
+class TeamTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user: User):
+        """AUTH_TOKEN_TEAM_CLAIM 이 켜져 있으면 token 에 유저의 팀을 담는다.
+        refresh token 의 claim 은 access token 에도 복사된다.
+        """
+        token = super().get_token(user)
+
+        if settings.AUTH_TOKEN_TEAM_CLAIM:
+            token[TEAM_CLAIM] = user.team
+
+        return token
+
+
+class TeamTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs: dict) -> dict:
+        """refresh token 으로 access token 을 다시 발급한다.
+        AUTH_TOKEN_TEAM_CLAIM 이 켜져 있으면 현재 팀을 DB 에서 다시 읽어 담으므로,
+        팀이 바뀌어 거부된 access token 도 이 과정으로 갱신된다.
+
+        Raises:
+
+            - HTTPException (401 UNAUTHORIZED): refresh token 이 폐기되었거나 유저가 없는 경우
+        """
+        refresh = self.token_class(attrs["refresh"])
+
+        if revocation_list.is_revoked(refresh[api_settings.JTI_CLAIM]):
+            raise InvalidToken("Token is revoked")
+
+        if settings.AUTH_TOKEN_TEAM_CLAIM:
+            team = (
+                User.objects.filter(
+                    **{api_settings.USER_ID_FIELD: refresh[api_settings.USER_ID_CLAIM]},
+                )
+                .values_list("team", flat=True)
+                .first()
+            )
+
+            if team is None:
+                raise InvalidToken("User not found")
+
+            refresh[TEAM_CLAIM] = team
+
+        access = refresh.access_token
+        # refresh token 의 발급 시각이 복사되므로 현재 시각으로 다시 지정한다.
+        access.set_iat()
+
+        data = {"access": str(access)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+
+            data["refresh"] = str(refresh)
+
+        return data
@@ -1,11 +1,15 @@
+from io import StringIO
+
+from asgiref.sync import iscoroutinefunction
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth.hashers import check_password
-from django.urls import reverse
+from django.core.management import CommandError, call_command
+from django.urls import resolve, reverse
 import pytest
 
 from common.utils import random_lower_string
-from accounts.models import User
+from accounts.models import RevokedToken, User
 
 
 @pytest.mark.django_db
@@ -79,6 +83,73 @@ def test_login_if_success(client: APIClient(), fake_user: dict):
     assert "refresh_token" in token_data
 
 
+@pytest.mark.django_db
+@pytest.mark.login
+def test_login_rehashes_password_with_preferred_hasher(
+    client: APIClient(),
+    fake_user: dict,
+    settings,
+):
+    user = fake_user["user_object"]
+    assert user.password.startswith("pbkdf2_sha256$")
+
+    # 새 hasher 를 우선으로 설정하면 로그인에 성공할 때 기존 hash 가 새 hasher 로 다시 저장된다.
+    settings.PASSWORD_HASHERS = [
+        settings.PASSWORD_HASHER_CLASSES["scrypt"],
+        settings.PASSWORD_HASHER_CLASSES["pbkdf2"],
+    ]
+
+    response = client.post(reverse("login"), fake_user["login_data"])
+
+    assert response.status_code == status.HTTP_200_OK
+
+    rehashed_password = User.objects.get(id=user.id).password
+
+    assert rehashed_password.startswith("scrypt$")
+
+    # 다시 저장된 hash 로도 로그인할 수 있고, 비용이 같으면 다시 저장하지 않는다.
+    response = client.post(reverse("login"), fake_user["login_data"])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert User.objects.get(id=user.id).password == rehashed_password
+
+
+@pytest.mark.django_db
+@pytest.mark.login
+def test_login_after_lowering_scrypt_work_factor(
+    client: APIClient(),
+    fake_user: dict,
+    settings,
+):
+    user = fake_user["user_object"]
+
+    settings.PASSWORD_HASHERS = [
+        settings.PASSWORD_HASHER_CLASSES["scrypt"],
+        settings.PASSWORD_HASHER_CLASSES["pbkdf2"],
+    ]
+    # hashlib.scrypt 의 기본 메모리 한도(32MB)를 넘는 비용으로 저장한다.
+    settings.PASSWORD_HASHER_OPTIONS = {
+        **settings.PASSWORD_HASHER_OPTIONS,
+        "SCRYPT_WORK_FACTOR": 2**16,
+    }
+
+    response = client.post(reverse("login"), fake_user["login_data"])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert User.objects.get(id=user.id).password.startswith("scrypt$65536$")
+
+    # 비용을 낮춰도 기존 hash 는 저장된 비용으로 검증되고, 낮춘 비용으로 다시 저장된다.
+    settings.PASSWORD_HASHER_OPTIONS = {
+        **settings.PASSWORD_HASHER_OPTIONS,
+        "SCRYPT_WORK_FACTOR": 2**14,
+    }
+
+    response = client.post(reverse("login"), fake_user["login_data"])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert User.objects.get(id=user.id).password.startswith("scrypt$16384$")
+
+
 @pytest.mark.django_db
 @pytest.mark.login
 def test_login_if_not_registered_user(
@@ -114,6 +185,199 @@ def test_login_if_wrong_password(
     assert response.data["detail"].code == "WRONG_PASSWORD_ERROR"
 
 
+@pytest.mark.django_db
+@pytest.mark.signup
+def test_async_signup_if_success(
+    client: APIClient(),
+):
+    data_to_be_created = {
+        "username": f"user-{random_lower_string(k=10)}",
+        "password": random_lower_string(k=10),
+        "team": User.TeamChoices.DANBIE,
+    }
+
+    response = client.post(
+        reverse("async_signup"),
+        data_to_be_created,
+        content_type="application/json",
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+
+    user = User.objects.get(username=data_to_be_created["username"])
+
+    assert response.json()["username"] == user.username
+    assert check_password(data_to_be_created["password"], user.password) is True
+    assert data_to_be_created["team"] == user.team
+
+
+@pytest.mark.django_db
+@pytest.mark.signup
+def test_async_signup_if_not_success(
+    client: APIClient(),
+    fake_user: dict,
+):
+    response = client.post(
+        reverse("async_signup"),
+        {"username": f"user-{random_lower_string(k=10)}"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "password" in response.json()
+
+    # 이미 있는 username 은 DB 조회로 확인된다.
+    response = client.post(
+        reverse("async_signup"),
+        {**fake_user["login_data"], "team": User.TeamChoices.DANBIE},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "username" in response.json()
+
+
+@pytest.mark.django_db
+@pytest.mark.login
+def test_async_login_returns_same_response_as_login(
+    client: APIClient(),
+    fake_user: dict,
+):
+    user = fake_user["user_object"]
+
+    response = client.post(
+        reverse("async_login"),
+        fake_user["login_data"],
+        content_type="application/json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    data = response.json()
+
+    assert data["user_data"] == {"user_id": user.id, "username": user.username}
+    assert data["message"] == "LOGIN_SUCCESS"
+    assert response.cookies["access_token"].value == data["token"]["access_token"]
+    assert response.cookies["refresh_token"].value == data["token"]["refresh_token"]
+
+    # 발급받은 access token 으로 인증할 수 있다.
+    response = client.get(
+        reverse("task_list"),
+        HTTP_AUTHORIZATION=f"Bearer {data['token']['access_token']}",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.login
+def test_async_login_if_failed(
+    client: APIClient(),
+    fake_user: dict,
+):
+    response = client.post(
+        reverse("async_login"),
+        {"username": "abcddefdef", "password": "abcdefd"},
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "해당되는 유저를 찾을 수 없습니다."
+
+    response = client.post(
+        reverse("async_login"),
+        {**fake_user["login_data"], "password": "abcdefg"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "입력한 비밀번호가 기존 비밀번호와 일치하지 않습니다."
+
+    response = client.post(
+        reverse("async_login"),
+        "{",
+        content_type="application/json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+@pytest.mark.login
+def test_async_views_share_drf_responses(
+    client: APIClient(),
+    fake_user: dict,
+):
+    # ASGI 에서는 event loop 에서 실행되는 async 뷰이다.
+    assert iscoroutinefunction(resolve(reverse("async_login")).func) is True
+    assert iscoroutinefunction(resolve(reverse("async_signup")).func) is True
+
+    # 검증과 에러 응답은 sync 뷰와 같은 DRF 의 serializer 와 exception handler 를 사용한다.
+    requests = [
+        ("signup", {"username": f"user-{random_lower_string(k=10)}"}),
+        ("signup", {**fake_user["login_data"], "team": User.TeamChoices.DANBIE}),
+        ("login", {"username": "abcddefdef", "password": "abcdefd"}),
+        ("login", {**fake_user["login_data"], "password": "abcdefg"}),
+    ]
+
+    for name, data in requests:
+        response = client.post(reverse(name), data, content_type="application/json")
+        async_response = client.post(
+            reverse(f"async_{name}"),
+            data,
+            content_type="application/json",
+        )
+
+        assert async_response.status_code == response.status_code
+        assert async_response.json() == response.json()
+
+
+@pytest.mark.django_db
+def test_loadtest_login_requires_existing_account(
+    fake_user: dict,
+    settings,
+):
+    settings.DEBUG = False
+    user_count = User.objects.count()
+
+    # 측정용 유저를 만들고 지우는 것은 DEBUG 에서만 한다.
+    with pytest.raises(CommandError):
+        call_command("loadtest_login", requests=1, stdout=StringIO())
+
+    with pytest.raises(CommandError):
+        call_command(
+            "loadtest_login",
+            username="not-exist-user",
+            password="password",
+            stdout=StringIO(),
+        )
+
+    with pytest.raises(CommandError):
+        call_command(
+            "loadtest_login",
+            username=fake_user["login_data"]["username"],
+            stdout=StringIO(),
+        )
+
+    assert User.objects.count() == user_count
+
+
+@pytest.mark.django_db
+@pytest.mark.login
+def test_async_login_rehashes_password_with_preferred_hasher(
+    client: APIClient(),
+    fake_user: dict,
+    settings,
+):
+    user = fake_user["user_object"]
+
+    settings.PASSWORD_HASHERS = [
+        settings.PASSWORD_HASHER_CLASSES["scrypt"],
+        settings.PASSWORD_HASHER_CLASSES["pbkdf2"],
+    ]
+
+    response = client.post(reverse("async_login"), fake_user["login_data"])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert User.objects.get(id=user.id).password.startswith("scrypt$")
+
+
 @pytest.mark.django_db
 @pytest.mark.logout
 def test_logout_if_success(
@@ -137,3 +401,37 @@ def test_logout_if_success(
     response = client.delete(logout_url, headers=header)
 
     assert response.status_code == status.HTTP_202_ACCEPTED
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.logout
+def test_logout_revokes_tokens(
+    client: APIClient(),
+    fake_user: dict,
+    django_assert_num_queries,
+):
+    response = client.post(reverse("login"), fake_user["login_data"])
+
+    access_token = response.data["token"]["access_token"]
+    refresh_token = response.data["token"]["refresh_token"]
+    header = {"Authorization": f"Bearer {access_token}"}
+
+    # 폐기 여부 확인에는 DB 조회가 필요 없다. (인증 유저 조회와 count 만 실행)
+    with django_assert_num_queries(2):
+        response = client.get(reverse("subtask_list"), headers=header)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    response = client.delete(reverse("logout"), headers=header)
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert RevokedToken.objects.count() == 2
+
+    # 로그아웃한 access token 과 refresh token 은 만료 전이라도 사용할 수 없다.
+    response = client.get(reverse("subtask_list"), headers=header)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = client.post(reverse("token_refresh"), {"refresh": refresh_token})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
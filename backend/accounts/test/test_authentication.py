@@ -0,0 +1,236 @@
+from datetime import timedelta
+from io import StringIO
+import time
+
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from django.core.management import call_command
+from django.db import DatabaseError, transaction
+from django.db.models import QuerySet
+from django.urls import reverse
+from django.utils import timezone
+import pytest
+
+from accounts.enums import TokenInformation
+from accounts.models import RevokedToken, User
+from common.authentication import (
+    CachedJWTAuthentication,
+    TeamClaimJWTAuthentication,
+    TokenTeamUser,
+    user_cache,
+    verified_token_cache,
+)
+from common.cache import TTLLRUCache
+from common.revocation import BloomFilter, TokenRevocationList, revocation_list
+from common.models import Base
+
+
+def test_ttl_lru_cache_evicts_and_expires():
+    now = [0.0]
+    cache = TTLLRUCache(maxsize=2, ttl=10, timer=lambda: now[0])
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    # 가장 오래 사용하지 않은 항목부터 제거된다.
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    now[0] = 10
+    assert cache.get("a") is None
+    assert cache.stats() == {"hits": 2, "misses": 2, "size": 1, "maxsize": 2}
+
+
+@pytest.mark.django_db
+def test_authentication_serves_user_from_cache(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_user: dict,
+    django_assert_num_queries,
+):
+    user_cache.clear()
+    url = reverse("subtask_list")
+
+    # 처음에는 users 를 조회하고, 이후에는 cache 에서 조회한다. (하위 업무가 없어 count 만 실행)
+    with django_assert_num_queries(2):
+        client.get(url, headers=fake_authorization_header)
+
+    # 같은 목록 응답도 팀별 cache 에서 반환되므로 query 를 실행하지 않는다.
+    with django_assert_num_queries(0):
+        response = client.get(url, headers=fake_authorization_header)
+
+    assert response.status_code == 200
+    assert user_cache.stats()["hits"] == 1
+    assert user_cache.stats()["misses"] == 1
+
+    # User 가 저장되면 cache 에서 제거되어 변경된 팀이 바로 반영된다.
+    user = fake_user["user_object"]
+    user.team = Base.TeamChoices.SUPI
+    user.save()
+
+    assert len(user_cache) == 0
+
+    with django_assert_num_queries(2):
+        client.get(url, headers=fake_authorization_header)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_team_claim_authentication_without_db(
+    client: APIClient(),
+    fake_user: dict,
+    settings,
+    django_assert_num_queries,
+):
+    settings.AUTH_TOKEN_TEAM_CLAIM = True
+
+    response = client.post(reverse("login"), fake_user["login_data"])
+    tokens = response.data[TokenInformation.token]
+
+    authentication = TeamClaimJWTAuthentication()
+    request = APIRequestFactory().get(
+        "/",
+        HTTP_AUTHORIZATION=f"Bearer {tokens[TokenInformation.access_token]}",
+    )
+
+    with django_assert_num_queries(0):
+        user, _ = authentication.authenticate(request)
+
+    assert isinstance(user, TokenTeamUser)
+    assert user.id == fake_user["user_object"].id
+    assert user.team == Base.TeamChoices.DANBIE
+
+    # 팀이 바뀌면 이전 access token 은 거부된다.
+    selected_user = User.objects.get(id=user.id)
+    selected_user.team = Base.TeamChoices.SUPI
+    selected_user.save()
+
+    with pytest.raises(AuthenticationFailed):
+        authentication.authenticate(request)
+
+    # 폐기 내역은 DB 에 저장되므로 process 를 다시 시작하거나 다른 process 에서도 거부된다.
+    revocation_list.clear()
+
+    with pytest.raises(AuthenticationFailed):
+        authentication.authenticate(request)
+
+    another_process = TokenRevocationList(
+        capacity=100,
+        error_rate=0.01,
+        sync_interval=30,
+    )
+
+    assert another_process.is_user_revoked(user.id, time.time() - 1) is True
+
+    # refresh token 으로 다시 발급받으면 바뀐 팀이 담긴다.
+    # 팀이 바뀐 시각과 같은 초에 발급된 token 도 거부되므로 1초 뒤에 다시 발급받는다.
+    time.sleep(1)
+
+    response = client.post(
+        reverse("token_refresh"),
+        {"refresh": tokens[TokenInformation.refresh_token]},
+    )
+    request = APIRequestFactory().get(
+        "/",
+        HTTP_AUTHORIZATION=f"Bearer {response.data['access']}",
+    )
+
+    user, _ = authentication.authenticate(request)
+
+    assert user.team == Base.TeamChoices.SUPI
+
+    # 유저가 삭제되면 발급된 모든 token 이 거부된다.
+    User.objects.filter(id=user.id).delete()
+
+    with pytest.raises(AuthenticationFailed):
+        authentication.authenticate(request)
+
+
+@pytest.mark.django_db
+def test_verified_token_is_served_from_cache(
+    client: APIClient(),
+    fake_user: dict,
+):
+    response = client.post(reverse("login"), fake_user["login_data"])
+    access_token = response.data[TokenInformation.token][TokenInformation.access_token]
+
+    verified_token_cache.clear()
+    authentication = CachedJWTAuthentication()
+
+    first = authentication.get_validated_token(access_token.encode())
+    second = authentication.get_validated_token(access_token.encode())
+
+    # 두 번째 요청은 서명 검증 없이 검증된 token 을 그대로 사용한다.
+    assert second is first
+    assert verified_token_cache.stats()["hits"] == 1
+
+    # 변조된 token 은 cache 에 없으므로 검증에 실패한다.
+    with pytest.raises(InvalidToken):
+        authentication.get_validated_token(access_token[:-2].encode())
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    values = [f"jti-{index}" for index in range(1000)]
+
+    for value in values:
+        bloom.add(value)
+
+    assert all(value in bloom for value in values)
+
+    false_positives = sum(f"other-{index}" in bloom for index in range(10000))
+
+    assert false_positives < 300
+
+
+@pytest.mark.django_db(transaction=True)
+def test_revocation_list_sync_only_reads(
+    monkeypatch,
+    django_assert_num_queries,
+):
+    now = [0.0]
+    revocations = TokenRevocationList(
+        capacity=100,
+        error_rate=0.01,
+        sync_interval=30,
+        timer=lambda: now[0],
+    )
+    expired = RevokedToken.objects.create(
+        jti="expired",
+        expires_at=timezone.now() - timedelta(seconds=1),
+    )
+
+    # 요청 중의 동기화는 조회만 하고, 만료된 내역은 테이블에서 삭제하지 않는다.
+    with django_assert_num_queries(1):
+        assert revocations.is_revoked("expired") is False
+
+    assert RevokedToken.objects.filter(id=expired.id).exists() is True
+
+    # transaction 안에서 폐기한 token 은 commit 된 뒤에 저장된다.
+    with transaction.atomic():
+        revocation_list.revoke({"jti": "revoked", "exp": time.time() + 60})
+
+        assert RevokedToken.objects.filter(jti="revoked").exists() is False
+
+    revoked = RevokedToken.objects.get(jti="revoked")
+
+    now[0] = 30
+    assert revocations.is_revoked("revoked") is True
+
+    # 조회에 실패해도 인증은 실패하지 않고 현재 목록으로 확인한 뒤, 다음 동기화에서 다시 조회한다.
+    def fail(*args, **kwargs):
+        raise DatabaseError
+
+    monkeypatch.setattr(QuerySet, "values_list", fail)
+    now[0] = 60
+
+    assert revocations.is_revoked("revoked") is True
+    assert revocations.is_revoked("unknown") is False
+
+    monkeypatch.undo()
+
+    # 만료된 내역은 purge_revoked_tokens 명령으로 삭제한다.
+    call_command("purge_revoked_tokens", batch_size=1, stdout=StringIO())
+
+    assert list(RevokedToken.objects.values_list("id", flat=True)) == [revoked.id]
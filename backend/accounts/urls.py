@@ -1,8 +1,16 @@
 from django.urls import path
-from accounts.views import SignupView, LoginView, LogoutView
+from accounts.views import (
+    SignupView,
+    LoginView,
+    LogoutView,
+    AsyncSignupView,
+    AsyncLoginView,
+)
 
 urlpatterns = [
     path("/signup", SignupView.as_view(), name="signup"),
     path("/login", LoginView.as_view(), name="login"),
+    path("/async/signup", AsyncSignupView.as_view(), name="async_signup"),
+    path("/async/login", AsyncLoginView.as_view(), name="async_login"),
     path("/logout", LogoutView.as_view(), name="logout"),
 ]
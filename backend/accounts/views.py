@@ -1,22 +1,75 @@
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-from drf_spectacular.utils import extend_schema
+from asgiref.sync import sync_to_async
 from django.contrib.auth.hashers import check_password
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
+from drf_spectacular.utils import extend_schema
 from rest_framework.generics import CreateAPIView
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework import status
 
+from common.executors import run_in_password_executor
 from common.http_exceptions import CommonHttpException, WrongPasswordError
+from common.revocation import revocation_list
+from common.views import AsyncAPIView
 from accounts.serializers import (
     SignupSerializer,
     LoginSerializer,
     UserSerializer,
+    TeamTokenObtainPairSerializer,
 )
 from accounts.enums import UserInformation, TokenInformation
 from accounts.models import User
 
 
+def build_login_response(user: User) -> Response:
+    """로그인한 유저의 token 을 발급하여 응답을 만들고, token 을 cookie 에도 담는다.
+
+    Args:
+
+        - user (User): 로그인한 유저
+
+    Returns:
+
+        - Response (200 OK): user_data, token 정보, 성공 메세지
+    """
+    token = TeamTokenObtainPairSerializer.get_token(user)
+    refresh_token = str(token)
+    access_token = str(token.access_token)
+
+    user_data = {
+        UserInformation.user_id: user.id,
+        UserInformation.username: LoginSerializer(user).data.get(
+            UserInformation.username,
+        ),
+    }
+
+    response = Response(
+        {
+            "user_data": user_data,
+            "message": "LOGIN_SUCCESS",
+            TokenInformation.token: {
+                TokenInformation.access_token: access_token,
+                TokenInformation.refresh_token: refresh_token,
+            },
+        },
+        status=status.HTTP_200_OK,
+    )
+
+    response.set_cookie(
+        TokenInformation.access_token,
+        access_token,
+        httponly=True,
+    )
+    response.set_cookie(
+        TokenInformation.refresh_token,
+        refresh_token,
+        httponly=True,
+    )
+    return response
+
+
 class SignupView(CreateAPIView):
     serializer_class = SignupSerializer
 
@@ -102,43 +155,11 @@ class LoginView(APIView):
         if user is None:
             raise CommonHttpException.USER_NOT_FOUND_ERROR
 
-        if not check_password(password, user.password):
+        # 기존 hash 의 hasher 나 비용이 설정과 다르면 검증에 성공한 비밀번호로 다시 저장된다.
+        if not user.check_password(password):
             raise WrongPasswordError
 
-        token = TokenObtainPairSerializer.get_token(user)
-        refresh_token = str(token)
-        access_token = str(token.access_token)
-
-        user_data = {
-            UserInformation.user_id: user.id,
-            UserInformation.username: LoginSerializer(user).data.get(
-                UserInformation.username,
-            ),
-        }
-
-        response = Response(
-            {
-                "user_data": user_data,
-                "message": "LOGIN_SUCCESS",
-                TokenInformation.token: {
-                    TokenInformation.access_token: access_token,
-                    TokenInformation.refresh_token: refresh_token,
-                },
-            },
-            status=status.HTTP_200_OK,
-        )
-
-        response.set_cookie(
-            TokenInformation.access_token,
-            access_token,
-            httponly=True,
-        )
-        response.set_cookie(
-            TokenInformation.refresh_token,
-            refresh_token,
-            httponly=True,
-        )
-        return response
+        return build_login_response(user)
 
 
 class LogoutView(APIView):
@@ -150,11 +171,31 @@ class LogoutView(APIView):
     )
     def delete(self, request: Request) -> Response:
         """로그아웃 하여 인증 정보인 토큰을 삭제합니다.
+        인증에 사용한 access token 과 요청 본문 또는 cookie 의 refresh token 은 폐기되어
+        만료 전이라도 더 이상 사용할 수 없습니다.
+
+        Args:
+
+            - refresh (str): 폐기할 refresh token (없으면 cookie 의 refresh token 사용)
 
         Returns:
 
             Response (202 ACCEPTED): 로그아웃 처리가 성공하면 202 accepted를 반환
         """
+        if request.auth is not None:
+            revocation_list.revoke(request.auth)
+
+        raw_refresh_token = request.data.get("refresh") or request.COOKIES.get(
+            TokenInformation.refresh_token,
+        )
+
+        if raw_refresh_token:
+            try:
+                revocation_list.revoke(RefreshToken(raw_refresh_token))
+            except TokenError:
+                # 이미 만료되었거나 올바르지 않은 token 은 폐기할 필요가 없다.
+                pass
+
         response = Response(
             {"message": "LOGOUT_SUCCESS"},
             status=status.HTTP_202_ACCEPTED,
@@ -162,3 +203,97 @@ class LogoutView(APIView):
         response.delete_cookie(TokenInformation.access_token)
         response.delete_cookie(TokenInformation.refresh_token)
         return response
+
+
+class AsyncSignupView(AsyncAPIView):
+    """SignupView 의 async 버전. ASGI 로 배포할 때 사용한다.
+    검증과 응답은 SignupView 와 같으며, 비밀번호 hash 는 event loop 밖의 thread 에서 계산하므로
+    그동안 다른 요청을 처리할 수 있다.
+    """
+
+    serializer_class = SignupSerializer
+
+    @extend_schema(
+        tags=["Account"],
+        request=SignupSerializer,
+        responses=SignupSerializer,
+        summary="회원가입 (async) - username, password, team 소속 정보 필요",
+    )
+    async def post(self, request: Request) -> Response:
+        """username, password, team 소속 정보를 입력하여 회원가입을 한다.
+
+        Args:
+
+            - username (str): 로그인 시 입력할 이름
+            - password (str): 로그인 시 입력할 비밀번호
+            - team (str): 소속 팀
+
+        Returns:
+
+            - Response: 성공 시 201 CREATED를 보내고 실패하면 400 BAD_REQUEST 를 보낸다.
+        """
+        serializer = self.serializer_class(data=request.data)
+
+        # username 중복 확인은 DB 조회가 필요하므로 sync 로 실행한다.
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await serializer.asave()
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class AsyncLoginView(AsyncAPIView):
+    """LoginView 의 async 버전. ASGI 로 배포할 때 사용한다.
+    유저는 async ORM 으로 조회하고, 비밀번호 검증과 rehash 는 event loop 밖의 thread 에서 계산한다.
+    """
+
+    @extend_schema(
+        tags=["Account"],
+        request=LoginSerializer,
+        responses=LoginSerializer,
+        summary="로그인 (async) - username, password로 로그인하여 user data, token 정보를 반환",
+    )
+    async def post(self, request: Request) -> Response:
+        """username과 password로 로그인하여 LoginView 와 같은 정보를 받는다.
+
+        Args:
+
+            - username (str): 로그인 시 입력할 이름
+            - password (str): 로그인 시 입력할 비밀번호
+
+        Raises:
+
+            - HTTPException (404 NOT FOUND): username에 해당하는 user를 찾지 못한 경우
+                - code: USER_NOT_FOUND
+
+            - HTTPException (400 BAD REQUEST): username에 해당하는 비밀번호가 아닌 경우
+                - code: WRONG_PASSWORD_ERROR
+
+        Returns:
+
+            - Response (200 OK): user_data, token 정보, 성공 메세지
+        """
+        username = request.data.get(UserInformation.username)
+        password = request.data.get(UserInformation.password)
+
+        user = await User.objects.filter(username=username).alast()
+
+        if user is None:
+            raise CommonHttpException.USER_NOT_FOUND_ERROR
+
+        # rehash 가 필요하면 setter 가 호출되며, 저장은 async ORM 으로 따로 한다.
+        must_update = []
+        is_correct = await run_in_password_executor(
+            check_password,
+            password,
+            user.password,
+            setter=must_update.append,
+        )
+
+        if not is_correct:
+            raise WrongPasswordError
+
+        if must_update:
+            await run_in_password_executor(user.set_password, password)
+            await user.asave(update_fields=["password"])
+
+        return build_login_response(user)
@@ -0,0 +1,165 @@
+from copy import copy
+import hashlib
+import time
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from common.cache import TTLLRUCache
+from common.revocation import revocation_list
+
+# user_id 별로 인증된 User 를 보관한다.
+# User 가 저장되거나 삭제되면 같은 process 의 항목은 바로 제거되고,
+# 다른 process 에서 변경된 내용은 늦어도 TTL 이 지나면 반영된다.
+user_cache = TTLLRUCache(
+    maxsize=settings.AUTH_USER_CACHE["MAXSIZE"],
+    ttl=settings.AUTH_USER_CACHE["TTL"],
+)
+
+
+# 서명과 claim 검증을 마친 access token 을 token digest 별로 보관한다.
+# 각 항목은 token 의 exp 까지만 유지된다.
+verified_token_cache = TTLLRUCache(
+    maxsize=settings.AUTH_TOKEN_CACHE["MAXSIZE"],
+    ttl=settings.SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"].total_seconds(),
+)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication 과 같지만 검증된 token 과 User 를 process 내부 cache 에서 먼저 찾는다.
+    같은 token 이 다시 오면 서명 검증과 claim 해석을 생략하고,
+    User 가 cache 에 있으면 users 테이블을 조회하지 않는다.
+    로그아웃 등으로 폐기된 token 은 거부한다.
+    """
+
+    token_cache = verified_token_cache
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        key = hashlib.sha256(raw_token).digest()
+        validated_token = self.token_cache.get(key)
+
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+
+            # 만료 시각이 지나면 cache 에서도 조회되지 않도록 남은 시간만큼만 보관한다.
+            remaining = validated_token["exp"] - time.time()
+            if remaining > 0:
+                self.token_cache.set(key, validated_token, ttl=remaining)
+
+        # 폐기 여부는 cache 된 token 도 매번 확인한다.
+        if revocation_list.is_revoked(validated_token[api_settings.JTI_CLAIM]):
+            raise InvalidToken(_("Token is revoked"), code="token_revoked")
+
+        return validated_token
+
+    def get_user(self, validated_token: Token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = user_cache.get(user_id)
+
+        if user is None:
+            user = super().get_user(validated_token)
+            user_cache.set(user_id, user)
+        elif api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM,
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."),
+                code="password_changed",
+            )
+
+        # 요청마다 속성을 바꾸어도 cache 된 객체에 영향을 주지 않도록 복사본을 반환한다.
+        return copy(user)
+
+
+TEAM_CLAIM = "team"
+
+
+def force_token_refresh(user_id) -> None:
+    """user_id 의 지금까지 발급된 access token 을 거부하여 다시 발급받게 한다.
+    폐기 내역은 RevokedToken 테이블에 저장되어 다른 process 와 재시작한 process 에도 반영된다.
+    QuerySet.update() 처럼 signal 없이 팀을 바꾼 경우에는 직접 호출해야 한다.
+    """
+    revocation_list.revoke_user(user_id)
+    user_cache.pop(user_id)
+
+
+class TokenTeamUser:
+    """access token 의 claim 만으로 만든 가벼운 유저. 뷰에서 사용하는 id, team 만 가진다."""
+
+    __slots__ = ("id", "team", "token")
+
+    is_active = True
+    is_staff = False
+    is_superuser = False
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, id, team: str, token: Token):
+        self.id = id
+        self.team = team
+        self.token = token
+
+    @property
+    def pk(self):
+        return self.id
+
+    def __str__(self) -> str:
+        return f"TokenTeamUser(id={self.id}, team={self.team})"
+
+    def __eq__(self, other) -> bool:
+        return getattr(other, "pk", None) == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+class TeamClaimJWTAuthentication(CachedJWTAuthentication):
+    """team claim 이 있는 access token 은 DB 조회 없이 TokenTeamUser 로 인증한다.
+    team claim 이 없는 token 은 CachedJWTAuthentication 과 같이 User 를 조회한다.
+
+    팀이 바뀌거나 삭제된 유저의 그 이전에 발급된 token 은 거부되며,
+    refresh token 으로 다시 발급받으면 바뀐 팀이 담긴다.
+    """
+
+    def get_user(self, validated_token: Token):
+        if TEAM_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if revocation_list.is_user_revoked(user_id, validated_token.get("iat", 0)):
+            raise AuthenticationFailed(
+                _("The user's team has been changed. Refresh the token."),
+                code="token_refresh_required",
+            )
+
+        return TokenTeamUser(user_id, validated_token[TEAM_CLAIM], validated_token)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_user(sender, instance, **kwargs):
+    user_id = getattr(instance, api_settings.USER_ID_FIELD)
+    user_cache.pop(user_id)
+
+    if getattr(instance, "_loaded_team", instance.team) != instance.team:
+        force_token_refresh(user_id)
+        instance._loaded_team = instance.team
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_deleted_user(sender, instance, **kwargs):
+    force_token_refresh(getattr(instance, api_settings.USER_ID_FIELD))
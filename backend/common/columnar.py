@@ -0,0 +1,106 @@
+# 목록을 열 단위로 담는 형식.
+# 행마다 같은 key 를 반복하는 대신 필드 이름 목록(fields)과 필드별 값 목록(columns)을 담는다.
+# 하위 업무처럼 목록인 필드는 모든 행의 목록을 이어 붙인 표(tables)로 만들고,
+# 열에는 각 행의 목록이 그 표에서 시작하는 위치를 담는다.
+# i 번째 행의 목록은 표의 columns[i] 부터 columns[i + 1] (마지막 행은 표의 끝) 까지다.
+# 작성자처럼 객체인 필드는 같은 객체를 한 번만 표에 담고, 열에는 표의 위치를 담는다.
+# 표의 kind 는 열의 값이 목록의 시작 위치(offsets)인지 객체의 위치(references)인지 나타낸다.
+# 행이 없으면 필드 이름과 표의 kind 를 알 수 없으므로 serializer 에서 만든 schema 를 사용한다.
+# schema 는 {필드 이름: None 또는 (kind, 표의 schema)} 형식이며, None 은 표가 없는 필드다.
+
+OFFSETS = "offsets"
+REFERENCES = "references"
+
+
+def is_rows(data) -> bool:
+    """열 단위 형식으로 바꿀 수 있는 dict 목록인지 확인한다."""
+    return isinstance(data, list) and all(isinstance(row, dict) for row in data)
+
+
+def to_columnar(rows: list, schema: dict = None) -> dict:
+    """dict 목록을 {"fields": [...], "columns": [...], "tables": {...}} 형식으로 바꾼다.
+    tables 의 각 표는 kind 와 함께 같은 형식으로 담긴다.
+
+    Args:
+        - rows (list): 같은 key 를 가진 dict 목록
+        - schema (dict): 필드별 표의 kind 와 표의 schema. 없으면 행의 값으로 판단한다.
+
+    Returns:
+        dict: 필드 이름 목록, 필드별 값 목록, 목록과 객체 필드의 표
+    """
+    fields = list(rows[0]) if rows else list(schema or ())
+    columns = []
+    tables = {}
+
+    for field in fields:
+        values = [row[field] for row in rows]
+
+        if schema is not None and field in schema:
+            kind, table_schema = schema[field] or (None, None)
+        else:
+            kind, table_schema = guess_kind(values), None
+
+        if kind == OFFSETS:
+            column, table_rows = to_offsets(values)
+        elif kind == REFERENCES:
+            column, table_rows = to_references(values)
+        else:
+            columns.append(values)
+            continue
+
+        columns.append(column)
+        tables[field] = {"kind": kind, **to_columnar(table_rows, table_schema)}
+
+    return {"fields": fields, "columns": columns, "tables": tables}
+
+
+def guess_kind(values: list):
+    # schema 가 없으면 처음으로 None 이 아닌 값으로 표의 kind 를 정한다.
+    sample = next((value for value in values if value is not None), None)
+
+    if isinstance(sample, list) and all(isinstance(item, dict) for item in sample):
+        return OFFSETS
+    if isinstance(sample, dict):
+        return REFERENCES
+    return None
+
+
+def to_offsets(values: list) -> tuple:
+    # 각 행의 목록을 이어 붙이고, 목록이 시작하는 위치를 열에 담는다.
+    offsets = []
+    table_rows = []
+
+    for value in values:
+        offsets.append(len(table_rows))
+        table_rows.extend(value or ())
+
+    return offsets, table_rows
+
+
+def to_references(values: list) -> tuple:
+    # 같은 객체는 표에 한 번만 담고, 표의 위치를 열에 담는다.
+    references = []
+    positions = {}
+    table_rows = []
+
+    for value in values:
+        if value is None:
+            references.append(None)
+            continue
+
+        try:
+            key = tuple(value.items())
+            position = positions.get(key)
+        except TypeError:
+            # 값에 목록처럼 hash 할 수 없는 값이 있으면 같은 객체인지 확인하지 않는다.
+            key, position = None, None
+
+        if position is None:
+            position = len(table_rows)
+            table_rows.append(value)
+            if key is not None:
+                positions[key] = position
+
+        references.append(position)
+
+    return references, table_rows
@@ -0,0 +1,120 @@
+from datetime import datetime
+from typing import Iterable, Optional
+import hashlib
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+# 조건부 GET 을 처리하는 view mixin.
+# If-None-Match, If-Modified-Since 가 현재 validator 와 일치하면 직렬화 없이 304 Not Modified 를 보낸다.
+
+
+def build_etag(parts: Iterable) -> str:
+    """parts 로 strong ETag 를 만든다. 같은 parts 는 같은 응답 본문을 뜻해야 한다."""
+    digest = hashlib.md5(":".join(map(str, parts)).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def not_modified_response(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+) -> Optional[HttpResponse]:
+    """조건부 요청의 validator 가 일치하면 304 응답을, 아니면 None 을 반환한다."""
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+
+    if response is not None:
+        set_validators(response, etag, last_modified)
+
+    return response
+
+
+def set_validators(
+    response: HttpResponse,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+) -> None:
+    response["ETag"] = etag
+
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+
+
+class ConditionalMixin:
+    def get_etag_parts(self, instance) -> tuple:
+        """응답에 담기는 객체의 내용이 바뀌면 함께 바뀌는 값을 반환한다."""
+        return (instance.pk, instance.modified_at.isoformat())
+
+    def get_last_modified(self, instance) -> datetime:
+        """응답에 담기는 내용이 마지막으로 바뀐 시각. get_etag_parts 에 포함한 객체의 시각도 반영해야 한다."""
+        return instance.modified_at
+
+    def build_response_etag(self, *parts) -> str:
+        # 같은 객체도 renderer 에 따라 본문이 다르므로 응답 형식을 포함한다.
+        return build_etag((self.request.accepted_renderer.format, *parts))
+
+
+class ConditionalRetrieveMixin(ConditionalMixin):
+    """RetrieveModelMixin 의 조회 응답에 (id, modified_at) 으로 만든 ETag 와 Last-Modified 를 담는다.
+    객체는 권한 확인을 위해 조회하지만, validator 가 일치하면 직렬화하지 않는다.
+    """
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        return self.get_conditional_retrieve_response(request, self.get_object())
+
+    def get_conditional_retrieve_response(self, request: Request, instance) -> Response:
+        etag = self.build_response_etag(*self.get_etag_parts(instance))
+        last_modified = self.get_last_modified(instance)
+
+        response = not_modified_response(request, etag, last_modified)
+        if response is not None:
+            return response
+
+        response = Response(self.get_serializer(instance).data)
+        set_validators(response, etag, last_modified)
+        return response
+
+
+class ConditionalListMixin(ConditionalMixin):
+    """ListModelMixin 의 목록 응답에 페이지의 객체들과 pagination 정보로 만든 ETag 를 담는다.
+    페이지는 조회하지만, validator 가 일치하면 직렬화하지 않는다. 추가 query 는 없다.
+
+    삭제된 객체는 남은 객체의 modified_at 에 드러나지 않으므로 목록에는 Last-Modified 를 보내지 않는다.
+    """
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        objects = list(queryset) if page is None else page
+
+        parts = [request.get_full_path()]
+        if page is not None:
+            # count, next, previous 등 results 를 제외한 pagination 정보
+            envelope = self.get_paginated_response([]).data
+            parts.extend(
+                f"{key}={value}" for key, value in envelope.items() if key != "results"
+            )
+        for instance in objects:
+            parts.extend(self.get_etag_parts(instance))
+
+        etag = self.build_response_etag(*parts)
+
+        response = not_modified_response(request, etag)
+        if response is not None:
+            return response
+
+        serializer = self.get_serializer(objects, many=True)
+        if page is None:
+            response = Response(serializer.data)
+        else:
+            response = self.get_paginated_response(serializer.data)
+
+        set_validators(response, etag)
+        return response
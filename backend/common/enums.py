@@ -4,3 +4,10 @@ from enum import StrEnum, auto
 class MarkAsCompletion(StrEnum):
     is_completed = auto()
     completed_at = auto()
+
+
+class CompletionOutcome(StrEnum):
+    completed = auto()
+    already_completed = auto()
+    forbidden = auto()
+    not_found = auto()
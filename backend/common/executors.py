@@ -0,0 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+import asyncio
+
+from django.conf import settings
+
+# 비밀번호 hash 계산처럼 CPU 를 오래 사용하는 작업을 event loop 밖에서 실행한다.
+# worker 수를 제한하여 로그인 요청이 몰려도 CPU 를 모두 차지하지 않도록 한다.
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASHING_WORKERS,
+    thread_name_prefix="password-hashing",
+)
+
+
+async def run_in_password_executor(func: Callable, *args, **kwargs) -> Any:
+    """func 를 password_executor 에서 실행하고 결과를 기다린다.
+
+    Args:
+
+        - func (Callable): 실행할 함수
+        - args, kwargs: func 에 전달할 인자
+
+    Returns:
+
+        - Any: func 의 반환값
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, partial(func, *args, **kwargs))
@@ -0,0 +1,81 @@
+import base64
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+# 비용 값을 바꿔도 algorithm 이름은 그대로이므로 기존 hash 를 검증할 수 있고,
+# 비용이 다른 hash 는 로그인 시 must_update 로 판단되어 새 비용으로 다시 저장된다.
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    @property
+    def iterations(self) -> int:
+        return settings.PASSWORD_HASHER_OPTIONS["PBKDF2_ITERATIONS"]
+
+
+class ConfigurableScryptPasswordHasher(ScryptPasswordHasher):
+    """메모리를 많이 사용하는 scrypt. 표준 라이브러리(hashlib.scrypt)만으로 동작한다."""
+
+    @property
+    def work_factor(self) -> int:
+        return settings.PASSWORD_HASHER_OPTIONS["SCRYPT_WORK_FACTOR"]
+
+    @property
+    def block_size(self) -> int:
+        return settings.PASSWORD_HASHER_OPTIONS["SCRYPT_BLOCK_SIZE"]
+
+    @property
+    def parallelism(self) -> int:
+        return settings.PASSWORD_HASHER_OPTIONS["SCRYPT_PARALLELISM"]
+
+    def encode(
+        self,
+        password: str,
+        salt: str,
+        n: int = None,
+        r: int = None,
+        p: int = None,
+    ) -> str:
+        # 검증할 때는 저장된 hash 의 비용으로 다시 계산하므로, 메모리 한도도 현재 설정이 아닌
+        # 계산에 사용하는 비용으로 정한다. 비용을 낮춘 뒤에도 기존 hash 를 검증할 수 있다.
+        self._check_encode_args(password, salt)
+        n = n or self.work_factor
+        r = r or self.block_size
+        p = p or self.parallelism
+        hash_ = hashlib.scrypt(
+            password.encode(),
+            salt=salt.encode(),
+            n=n,
+            r=r,
+            p=p,
+            maxmem=self.get_maxmem(n, r, p),
+            dklen=64,
+        )
+        hash_ = base64.b64encode(hash_).decode("ascii").strip()
+        return "%s$%d$%s$%d$%d$%s" % (self.algorithm, n, salt, r, p, hash_)
+
+    @staticmethod
+    def get_maxmem(n: int, r: int, p: int) -> int:
+        # hashlib.scrypt 의 기본 메모리 한도(32MB)를 넘는 비용도 사용할 수 있도록 여유를 둔다.
+        return 2 * 128 * n * r * p
+
+
+class ConfigurableArgon2PasswordHasher(Argon2PasswordHasher):
+    """메모리를 많이 사용하는 argon2id. argon2-cffi 가 설치되어 있어야 한다."""
+
+    @property
+    def time_cost(self) -> int:
+        return settings.PASSWORD_HASHER_OPTIONS["ARGON2_TIME_COST"]
+
+    @property
+    def memory_cost(self) -> int:
+        return settings.PASSWORD_HASHER_OPTIONS["ARGON2_MEMORY_COST"]
+
+    @property
+    def parallelism(self) -> int:
+        return settings.PASSWORD_HASHER_OPTIONS["ARGON2_PARALLELISM"]
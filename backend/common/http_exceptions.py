@@ -30,3 +30,10 @@ class CompletedSubtaskError(exceptions.APIException):
     status_code = status.HTTP_400_BAD_REQUEST
     default_detail = "이미 완료된 하위업무이기 때문에 삭제할 수 없습니다."
     default_code = "COMPLETED_SUBTASK_ERROR"
+
+
+# common
+class InvalidFieldSelectionError(exceptions.APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = "fields 또는 expand 에 지정할 수 없는 필드가 있습니다."
+    default_code = "INVALID_FIELD_SELECTION_ERROR"
@@ -22,6 +22,13 @@ class Base(models.Model):
     class Meta:
         abstract = True
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """조회 시점의 팀을 기록해 두고, 저장 시 팀이 바뀌었는지 확인하는 데 사용한다."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_team = instance.__dict__.get("team")
+        return instance
+
 
 class BaseModel(Base):
     is_completed = models.BooleanField(verbose_name="완료 유무", default=False)
@@ -0,0 +1,42 @@
+from common.parsers import MessagePackParser
+from common.renderers import ColumnarRenderer, MessagePackRenderer, msgpack
+
+# 내부 서비스처럼 자주 조회하는 client 는 Accept, Content-Type 헤더로 MessagePack 을 선택할 수 있다.
+# 기본 형식은 그대로 JSON 이며, msgpack 이 설치되어 있지 않으면 MessagePack 은 선택할 수 없다.
+
+
+class MessagePackMixin:
+    """기본 renderer, parser 뒤에 MessagePack renderer, parser 를 추가하는 view mixin."""
+
+    def get_renderers(self) -> list:
+        renderers = super().get_renderers()
+
+        if msgpack is not None:
+            renderers.append(MessagePackRenderer())
+
+        return renderers
+
+    def get_parsers(self) -> list:
+        parsers = super().get_parsers()
+
+        if msgpack is not None:
+            parsers.append(MessagePackParser())
+
+        return parsers
+
+
+class ColumnarMixin:
+    """목록 view 에서 ?format=columnar 로 열 단위 응답을 선택할 수 있게 하는 view mixin.
+    열 단위 응답을 요청하면 CompiledListSerializer 가 행을 만들지 않고 바로 열을 만든다.
+    """
+
+    def get_renderers(self) -> list:
+        return [*super().get_renderers(), ColumnarRenderer()]
+
+    def get_serializer_context(self) -> dict:
+        context = super().get_serializer_context()
+        renderer = getattr(self.request, "accepted_renderer", None)
+        context["columnar"] = (
+            getattr(renderer, "format", None) == ColumnarRenderer.format
+        )
+        return context
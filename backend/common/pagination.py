@@ -0,0 +1,221 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import List, Optional
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """정렬 기준 필드 값의 조합(keyset)을 cursor로 사용하는 pagination.
+
+    OFFSET 없이 직전 페이지의 마지막 row 이후부터 조회하므로 몇 번째 페이지든 조회 비용이 같고,
+    전체 개수를 세는 COUNT query도 실행하지 않는다.
+    cursor는 정렬 기준 값을 담은 opaque 문자열로, next/previous 링크로만 전달된다.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    # 마지막 필드는 unique 해야 정렬 순서가 안정적으로 유지된다.
+    ordering = ("-created_at", "-id")
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view=None,
+    ) -> List:
+        self.request = request
+        self.base_url = remove_query_param(request.build_absolute_uri(), "page")
+        self.model = queryset.model
+
+        position, is_reversed = self.decode_cursor(request)
+        ordering = self.get_reversed_ordering() if is_reversed else self.ordering
+
+        if position is not None:
+            queryset = queryset.filter(self.build_keyset_filter(position, ordering))
+
+        rows = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        has_following = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if is_reversed:
+            rows.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = position is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data) -> Response:
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            },
+        )
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view) -> List[dict]:
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+        ]
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], is_reversed=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], is_reversed=True)
+
+    def get_reversed_ordering(self) -> tuple:
+        return tuple(
+            field[1:] if field.startswith("-") else f"-{field}"
+            for field in self.ordering
+        )
+
+    def build_keyset_filter(self, position: list, ordering: tuple) -> Q:
+        """정렬 순서상 position 다음에 오는 row들만 남기는 조건을 만든다.
+
+        (a, b) 정렬이라면 a 가 다음 값이거나, a 가 같고 b 가 다음 값인 row 들이 해당된다.
+        """
+        keyset_filter = Q()
+        equal_filter = Q()
+
+        for field, value in zip(ordering, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+
+            keyset_filter |= equal_filter & Q(**{f"{name}__{lookup}": value})
+            equal_filter &= Q(**{name: value})
+
+        return keyset_filter
+
+    def encode_cursor(self, row, is_reversed: bool) -> str:
+        position = []
+        for field in self.ordering:
+            value = getattr(row, field.lstrip("-"))
+            position.append(value.isoformat() if isinstance(value, datetime) else value)
+
+        payload = json.dumps({"p": position, "r": is_reversed}, separators=(",", ":"))
+        cursor = urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request: Request) -> tuple:
+        """cursor 파라미터를 (position, is_reversed)로 변환한다. cursor가 없으면 첫 페이지이다.
+
+        Raises:
+
+            - HTTPException (404 NOT FOUND): cursor 형식이 올바르지 않은 경우
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        if not encoded:
+            return None, False
+
+        try:
+            padding = "=" * (-len(encoded) % 4)
+            payload = json.loads(urlsafe_b64decode(encoded + padding))
+
+            position = [
+                self.model._meta.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, payload["p"], strict=True)
+            ]
+            is_reversed = bool(payload["r"])
+        except (
+            binascii.Error,
+            UnicodeDecodeError,
+            ValueError,
+            TypeError,
+            KeyError,
+            ValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        if any(value is None for value in position):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, is_reversed
+
+
+class CursorOptInPagination(PageNumberPagination):
+    """기본은 page 번호 방식이고, 요청 시 keyset(cursor) 방식으로 전환되는 pagination.
+
+    `?pagination=cursor`로 첫 페이지를 요청하거나 `cursor` 파라미터가 있으면 keyset 방식을 사용한다.
+    """
+
+    mode_query_param = "pagination"
+    keyset_pagination_class = KeysetPagination
+
+    keyset_paginator = None
+
+    def is_cursor_requested(self, request: Request) -> bool:
+        cursor_query_param = self.keyset_pagination_class.cursor_query_param
+        return (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view=None,
+    ) -> List:
+        if self.is_cursor_requested(request):
+            self.keyset_paginator = self.keyset_pagination_class()
+            return self.keyset_paginator.paginate_queryset(queryset, request, view)
+
+        self.keyset_paginator = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data) -> Response:
+        if self.keyset_paginator is not None:
+            return self.keyset_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view) -> List[dict]:
+        keyset_paginator = self.keyset_pagination_class()
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "cursor 로 지정하면 keyset 방식으로 조회합니다.",
+                "schema": {"type": "string", "enum": ["page", "cursor"]},
+            },
+            *keyset_paginator.get_schema_operation_parameters(view),
+        ]
@@ -0,0 +1,65 @@
+import codecs
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from common.renderers import FastJSONRenderer, MessagePackRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class FastJSONParser(JSONParser):
+    """orjson 이 설치되어 있으면 JSON 요청 본문을 orjson 으로 읽는 parser.
+    설치되어 있지 않거나 strict 하지 않게 NaN 등을 허용하는 경우에는 DRF 의 JSONParser 를 사용한다.
+
+    Raises:
+
+        - ParseError (400 BAD REQUEST): JSON 본문이 올바르지 않은 경우
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None or not self.strict:
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            content = stream.read()
+            # orjson 은 UTF-8 만 읽으므로 다른 charset 은 먼저 decode 한다.
+            if codecs.lookup(encoding).name != "utf-8":
+                content = content.decode(encoding)
+
+            return orjson.loads(content)
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class MessagePackParser(BaseParser):
+    """MessagePack 요청 본문을 읽는 parser. msgpack 이 설치되어 있어야 한다.
+    timestamp 확장 type 은 UTC datetime 으로 읽는다.
+
+    Raises:
+
+        - ParseError (400 BAD REQUEST): MessagePack 본문이 올바르지 않은 경우
+    """
+
+    media_type = "application/msgpack"
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), timestamp=3)
+        except (ValueError, TypeError, msgpack.UnpackException) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
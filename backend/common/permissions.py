@@ -7,7 +7,7 @@ class IsAuthorized(permissions.BasePermission):
             if request.user.team != obj.team:
                 raise exceptions.PermissionDenied
         elif obj.__class__.__name__ == "Task":
-            if request.user.id != obj.create_user.id:
+            if request.user.id != obj.create_user_id:
                 raise exceptions.PermissionDenied
 
         return True
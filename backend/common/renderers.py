@@ -0,0 +1,162 @@
+from django.utils.dateparse import parse_datetime
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from common.columnar import is_rows, to_columnar
+from common.serializers import get_columnar_schema
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# orjson 이 설치되어 있으면 JSON 응답을 orjson 으로 만든다.
+# datetime, enum(TeamChoices), UUID 를 C 로 직렬화하며, 결과는 DRF 의 JSONRenderer 와 같다.
+# 설치되어 있지 않거나 들여쓰기처럼 orjson 이 지원하지 않는 형식이면 DRF 의 JSONRenderer 를 사용한다.
+
+ORJSON_OPTIONS = (
+    # DRF 의 JSONEncoder 처럼 UTC 는 +00:00 대신 Z 로 표시한다.
+    orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    if orjson is not None
+    else 0
+)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """orjson 으로 JSON 응답을 만드는 renderer. 응답 형식은 DRF 의 JSONRenderer 와 같다.
+
+    orjson 이 직렬화하지 못하는 Decimal, lazy string 등은 encoder_class 의 default 로 변환하고,
+    64 bit 를 넘는 정수처럼 orjson 이 처리하지 못하는 값은 DRF 의 JSONRenderer 로 만든다.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+
+        if not self.can_use_orjson(indent):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=ORJSON_OPTIONS,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # JSONRenderer 처럼 javascript 에서도 안전하도록 U+2028, U+2029 를 escape 한다.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9",
+                b"\\u2029",
+            )
+
+        return ret
+
+    def can_use_orjson(self, indent) -> bool:
+        # orjson 은 공백 없는 UTF-8 출력만 DRF 와 같게 만들 수 있다.
+        return (
+            orjson is not None
+            and indent is None
+            and self.compact
+            and not self.ensure_ascii
+        )
+
+
+class MessagePackRenderer(BaseRenderer):
+    """응답을 MessagePack 으로 만드는 renderer. msgpack 이 설치되어 있어야 한다.
+
+    serializer 는 datetime 을 ISO 8601 문자열로 변환하므로,
+    이름이 _at 으로 끝나는 값은 다시 datetime 으로 읽어 MessagePack 의 timestamp 확장 type 으로 담는다.
+    그 외의 값은 JSON 응답과 같다.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+    encoder_class = JSONRenderer.encoder_class
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+
+        return msgpack.packb(
+            encode_timestamps(data),
+            datetime=True,
+            default=self.encoder_class().default,
+        )
+
+
+def encode_timestamps(data):
+    """data 안에서 이름이 _at 으로 끝나는 ISO 8601 문자열을 timezone 이 있는 datetime 으로 바꾼다."""
+    if isinstance(data, dict):
+        return {
+            key: (
+                parse_timestamp(value)
+                if isinstance(value, str)
+                and isinstance(key, str)
+                and key.endswith("_at")
+                else encode_timestamps(value)
+            )
+            for key, value in data.items()
+        }
+
+    if isinstance(data, (list, tuple)):
+        return [encode_timestamps(item) for item in data]
+
+    return data
+
+
+def parse_timestamp(value: str):
+    try:
+        parsed = parse_datetime(value)
+    except ValueError:
+        return value
+
+    # timezone 이 없는 값은 시각을 정할 수 없으므로 문자열로 담는다.
+    if parsed is None or parsed.utcoffset() is None:
+        return value
+
+    return parsed
+
+
+class ColumnarRenderer(FastJSONRenderer):
+    """목록 응답을 common.columnar 의 열 단위 형식으로 담는 JSON renderer. ?format=columnar 로 선택한다.
+    CompiledListSerializer 가 이미 열 단위로 만든 results 는 그대로 담고,
+    dict 목록이 아닌 응답은 JSON 응답과 같다.
+    빈 목록도 compile_columns 와 같은 형식이 되도록 필드 이름과 표는 view 의 serializer 에서 가져온다.
+    """
+
+    media_type = "application/vnd.columnar+json"
+    format = "columnar"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if is_rows(data):
+            data = to_columnar(data, self.get_schema(renderer_context))
+        elif isinstance(data, dict) and is_rows(data.get("results")):
+            data = {
+                **data,
+                "results": to_columnar(
+                    data["results"],
+                    self.get_schema(renderer_context),
+                ),
+            }
+
+        return super().render(data, accepted_media_type, renderer_context)
+
+    def get_schema(self, renderer_context) -> dict:
+        view = (renderer_context or {}).get("view")
+
+        if not hasattr(view, "get_serializer"):
+            return None
+
+        serializer = view.get_serializer()
+        return get_columnar_schema(getattr(serializer, "child", serializer))
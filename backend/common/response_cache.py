@@ -0,0 +1,253 @@
+from typing import Iterable, Optional, Type
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.db.models import Model
+from django.utils.http import urlencode
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from common.conditional import (
+    ConditionalRetrieveMixin,
+    not_modified_response,
+    set_validators,
+)
+from common.single_flight import SingleFlight
+
+# 응답은 데이터의 version 을 key 에 포함하여 저장한다.
+# 목록은 팀별로, 상세 정보는 객체별로 version 을 두며, 데이터가 바뀌면 version 만 올린다.
+# 이전 version 의 응답은 조회되지 않다가 TIMEOUT 이 지나면 사라지므로 무효화할 때 key 를 찾아 지울 필요가 없고,
+# 어떤 cache backend 에서도 같은 방식으로 동작한다.
+# 응답을 만드는 중에 version 이 바뀌면 이전 version 으로 저장되므로 바뀌기 전의 데이터는 조회되지 않는다.
+# version 도 VERSION_TIMEOUT 이 지나면 사라지며, 다시 만든 version 은 이전 version 과 겹치지 않으므로
+# 그 version 으로 저장된 응답을 조회하지 못할 뿐이다.
+
+
+# 같은 목록 응답을 동시에 만드는 요청은 process 안에서 1번만 DB 를 조회한다.
+list_single_flight = SingleFlight(
+    timeout=settings.RESPONSE_CACHE["SINGLE_FLIGHT_TIMEOUT"],
+)
+
+
+def get_response_cache() -> BaseCache:
+    return caches[settings.RESPONSE_CACHE["ALIAS"]]
+
+
+def get_version_timeout() -> int:
+    return settings.RESPONSE_CACHE["VERSION_TIMEOUT"]
+
+
+def new_version() -> int:
+    # version 이 cache 에서 지워진 뒤 다시 만들어도 이전 version 과 겹치지 않도록 현재 시각을 사용한다.
+    return time.time_ns()
+
+
+def get_version(key: str) -> int:
+    cache = get_response_cache()
+    version = cache.get(key)
+
+    if version is None:
+        # 동시에 만드는 경우에도 먼저 저장된 값을 함께 사용한다.
+        cache.add(key, new_version(), timeout=get_version_timeout())
+        version = cache.get(key)
+
+    return version
+
+
+def create_version(key: str) -> Optional[int]:
+    """version 이 없을 때 새로 만든다. 그 사이 다른 요청이 만들었거나 올렸다면 None 을 반환한다."""
+    version = new_version()
+
+    if not get_response_cache().add(key, version, timeout=get_version_timeout()):
+        return None
+
+    return version
+
+
+def bump_versions(keys: Iterable[str]) -> None:
+    """keys 의 version 을 올려 이전에 저장된 응답이 더 이상 조회되지 않게 한다."""
+    cache = get_response_cache()
+
+    for key in set(keys):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 아직 version 이 없으면 저장된 응답도 없다.
+            cache.add(key, new_version(), timeout=get_version_timeout())
+
+
+def team_version_key(team: str) -> str:
+    return f"list-response:version:{team}"
+
+
+def get_team_version(team: str) -> int:
+    return get_version(team_version_key(team))
+
+
+def bump_team_versions(teams: Iterable[str]) -> None:
+    bump_versions(team_version_key(team) for team in teams)
+
+
+def detail_version_key(model: Type[Model], pk) -> str:
+    return f"detail-response:version:{model._meta.label_lower}:{pk}"
+
+
+def bump_detail_versions(model: Type[Model], pks: Iterable) -> None:
+    bump_versions(detail_version_key(model, pk) for pk in pks)
+
+
+def build_list_cache_key(prefix: str, team: str, request: Request) -> str:
+    """팀, 팀의 version, host, 경로와 정렬한 query params 로 응답 cache key 를 만든다.
+    pagination 의 next, previous 링크가 host 를 포함하므로 host 도 key 에 포함한다.
+    """
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    digest = hashlib.md5(
+        f"{request.get_host()}{request.path}?{query}".encode(),
+    ).hexdigest()
+
+    return f"list-response:{prefix}:{team}:{get_team_version(team)}:{digest}"
+
+
+class TeamListCacheMixin:
+    """ListAPIView 의 목록 응답 data 를 요청한 유저의 팀별로 cache 한다.
+    팀의 version 이 바뀌기 전까지 같은 페이지와 query params 의 요청은 DB 를 조회하지 않는다.
+    응답에 ETag 가 있으면 함께 저장하여, cache 된 응답도 조건부 요청에 304 로 응답한다.
+
+    version 이 바뀌거나 TIMEOUT 이 지나 cache 가 없을 때 같은 key 로 동시에 들어온 요청은
+    list_single_flight 로 1번만 응답을 만들고, 나머지 요청은 그 응답 data 를 함께 사용한다.
+    """
+
+    list_cache_prefix: Optional[str] = None
+
+    def get_list_cache_prefix(self) -> str:
+        return self.list_cache_prefix or type(self).__name__
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        cache = get_response_cache()
+        # 응답을 만드는 중에 version 이 바뀌면 이전 version 으로 저장되어 조회되지 않는다.
+        # ETag 는 응답 형식에 따라 다르므로 응답 형식도 key 에 포함한다.
+        key = build_list_cache_key(
+            f"{self.get_list_cache_prefix()}:{request.accepted_renderer.format}",
+            request.user.team,
+            request,
+        )
+
+        cached = cache.get(key)
+        if cached is not None:
+            return self.get_cached_list_response(request, *cached)
+
+        own_response = None
+
+        def render() -> Optional[tuple]:
+            nonlocal own_response
+            own_response = super(TeamListCacheMixin, self).list(
+                request,
+                *args,
+                **kwargs,
+            )
+
+            if own_response.status_code != status.HTTP_200_OK:
+                return None
+
+            entry = (own_response.data, own_response.get("ETag"))
+            cache.set(key, entry, settings.RESPONSE_CACHE["LIST_TIMEOUT"])
+            return entry
+
+        entry = list_single_flight.do(key, render)
+
+        if own_response is not None:
+            return own_response
+
+        if entry is None:
+            # 먼저 요청한 응답이 304 처럼 함께 사용할 수 없는 응답이면 직접 만든다.
+            return super().list(request, *args, **kwargs)
+
+        return self.get_cached_list_response(request, *entry)
+
+    def get_cached_list_response(
+        self,
+        request: Request,
+        data,
+        etag: Optional[str],
+    ) -> Response:
+        if etag is None:
+            return Response(data)
+
+        response = not_modified_response(request, etag)
+        if response is not None:
+            return response
+
+        response = Response(data)
+        set_validators(response, etag)
+        return response
+
+
+class DetailCacheMixin(ConditionalRetrieveMixin):
+    """조회 응답 data 를 객체별 version 과 함께 cache 하는 RetrieveAPIView mixin.
+
+    권한 확인에 필요한 detail_cache_fields 의 값을 함께 저장하여,
+    cache 된 응답도 그 값으로 만든 model 객체로 DB 조회 없이 권한을 확인한다.
+    객체가 바뀌면 bump_detail_versions 로 version 을 올려야 한다.
+    """
+
+    # 권한 확인에 필요한 필드의 attname
+    detail_cache_fields = ("id", "modified_at")
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        model = self.get_queryset().model
+        pk = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+
+        cache = get_response_cache()
+        version_key = detail_version_key(model, pk)
+        # 존재하지 않는 객체의 version 을 만들지 않도록, version 이 없으면 객체를 조회한 뒤에 만든다.
+        version = cache.get(version_key)
+        # fields 처럼 응답 내용을 바꾸는 query params 도 key 에 포함한다.
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        digest = hashlib.md5(query.encode()).hexdigest()
+
+        def build_key(version: int) -> str:
+            return f"detail-response:{model._meta.label_lower}:{pk}:{version}:{digest}"
+
+        cached = cache.get(build_key(version)) if version is not None else None
+        if cached is not None:
+            fields, etag_parts, last_modified, data = cached
+
+            instance = model(**fields)
+            self.check_object_permissions(request, instance)
+
+            etag = self.build_response_etag(*etag_parts)
+            response = not_modified_response(request, etag, last_modified)
+            if response is not None:
+                return response
+
+            response = Response(data)
+            set_validators(response, etag, last_modified)
+            return response
+
+        instance = self.get_object()
+        response = self.get_conditional_retrieve_response(request, instance)
+
+        if version is None:
+            # 조회한 뒤 다른 요청이 version 을 만들었다면 조회한 데이터가 이전 데이터일 수 있으므로 저장하지 않는다.
+            version = create_version(version_key)
+
+        if version is not None and response.status_code == status.HTTP_200_OK:
+            cache.set(
+                build_key(version),
+                (
+                    {
+                        field: getattr(instance, field)
+                        for field in self.detail_cache_fields
+                    },
+                    self.get_etag_parts(instance),
+                    self.get_last_modified(instance),
+                    response.data,
+                ),
+                settings.RESPONSE_CACHE["DETAIL_TIMEOUT"],
+            )
+
+        return response
@@ -0,0 +1,264 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Callable, Dict, Optional, Tuple
+import hashlib
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from accounts.models import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """고정 크기 bit 배열로 원소의 포함 여부를 확인하는 확률적 자료구조.
+    없다고 판단한 원소는 반드시 없고, 있다고 판단한 원소는 error_rate 확률로 틀릴 수 있다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: str):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+
+        for index in range(self.hash_count):
+            yield (first + index * second) % self.size
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+class TokenRevocationList:
+    """폐기된 token 의 jti 를 process 메모리에 보관하여 DB 조회 없이 폐기 여부를 확인한다.
+
+    Bloom filter 에 없는 jti 는 바로 유효한 것으로 판단하고, 있다고 나온 경우에만
+    jti 별 만료 시각을 담은 dict 로 정확히 확인한다.
+    폐기 내역은 RevokedToken 테이블에 저장되며, 처음 확인할 때 전부 불러오고
+    이후에는 sync_interval 초마다 다른 process 에서 추가된 내역만 불러온다.
+    만료된 token 은 동기화할 때 메모리에서 제거되며,
+    테이블의 만료된 내역은 purge_revoked_tokens 명령으로 삭제한다.
+
+    유저 단위로 폐기한 내역은 user_id 별로 폐기 시각과 만료 시각을 보관하며,
+    폐기 시각 이전에 발급된 그 유저의 access token 을 거부하는 데 사용한다.
+
+    동기화는 background thread 가 아니라 sync_interval 이 지난 뒤 처음 확인하는 요청에서 실행한다.
+    process 마다 sync_interval 초에 한 번, 한 요청이 created_at 구간 조회 query 1번만큼 느려지며,
+    그동안 다른 요청은 기다리지 않고 현재 목록으로 확인한다.
+    thread 로 옮기면 요청 밖에서 연 DB 연결을 Django 가 정리하지 않고,
+    fork 하는 worker 에는 thread 가 복제되지 않으므로 요청에서 실행한다.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        sync_interval: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.timer = timer
+
+        self._expires_at: Dict[str, float] = {}
+        self._users: Dict[int, Tuple[float, float]] = {}
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._synced_at: Optional[datetime] = None
+        self._next_sync = 0.0
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def is_revoked(self, jti: str) -> bool:
+        if self.timer() >= self._next_sync:
+            self.sync()
+
+        if jti not in self._bloom:
+            return False
+
+        expires_at = self._expires_at.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def is_user_revoked(self, user_id: int, issued_at: float) -> bool:
+        """issued_at 에 발급된 user_id 의 token 이 유저 단위로 폐기되었는지 확인한다.
+        iat 는 초 단위로 내림되므로 폐기된 시각과 같은 초에 발급된 token 도 폐기된 것으로 본다.
+        """
+        if self.timer() >= self._next_sync:
+            self.sync()
+
+        revoked = self._users.get(user_id)
+
+        if revoked is None:
+            return False
+
+        revoked_at, expires_at = revoked
+        return issued_at <= revoked_at and expires_at > time.time()
+
+    def revoke_user(self, user_id: int) -> None:
+        """user_id 의 access token 중 지금까지 발급된 token 을 모두 폐기한다.
+        transaction 안에서는 commit 시점에 저장하여, commit 전의 값으로 다시 발급된 token 도 폐기한다.
+        """
+
+        def save():
+            revoked_token = RevokedToken.objects.create(
+                user_id=user_id,
+                expires_at=timezone.now()
+                + settings.SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"],
+            )
+
+            with self._lock:
+                self._add_user(
+                    user_id,
+                    revoked_token.created_at.timestamp(),
+                    revoked_token.expires_at.timestamp(),
+                )
+
+        transaction.on_commit(save)
+
+    def revoke(self, token: Token) -> None:
+        """token 을 폐기한다. 같은 process 에서는 바로 반영되고 다른 process 에는 동기화 시 반영된다.
+        transaction 안에서는 commit 시점에 저장하여, 폐기일이 commit 된 시각과 같아지게 한다.
+        """
+        jti = token[api_settings.JTI_CLAIM]
+        expires_at = token["exp"]
+
+        def save():
+            RevokedToken.objects.bulk_create(
+                [
+                    RevokedToken(
+                        jti=jti,
+                        expires_at=datetime.fromtimestamp(
+                            expires_at,
+                            tz=dt_timezone.utc,
+                        ),
+                    ),
+                ],
+                ignore_conflicts=True,
+            )
+
+            with self._lock:
+                self._add(jti, expires_at)
+
+        transaction.on_commit(save)
+
+    def sync(self) -> None:
+        """테이블에서 마지막 동기화 이후 추가된 폐기 내역을 불러오고 메모리의 만료된 내역을 정리한다.
+
+        한 번에 한 thread 만 조회하며, 다른 thread 는 기다리지 않고 현재 목록으로 확인한다.
+        처음 불러오는 경우에만 다른 thread 도 불러올 때까지 기다린다.
+        조회에 실패하면 현재 목록을 유지하고, 다음 동기화에서 놓친 구간을 다시 조회한다.
+        """
+        if not self._sync_lock.acquire(blocking=self._synced_at is None):
+            return
+
+        try:
+            if self.timer() < self._next_sync:
+                return
+
+            self._next_sync = self.timer() + self.sync_interval
+
+            now = timezone.now()
+            revoked_tokens = RevokedToken.objects.filter(expires_at__gt=now)
+
+            if self._synced_at is not None:
+                # 폐기 내역은 commit 된 뒤에 저장되므로 process 간 시각 차이만큼 구간을 겹쳐 조회한다.
+                revoked_tokens = revoked_tokens.filter(
+                    created_at__gte=self._synced_at
+                    - timedelta(seconds=self.sync_interval),
+                )
+
+            try:
+                rows = list(
+                    revoked_tokens.values_list(
+                        "jti",
+                        "user_id",
+                        "created_at",
+                        "expires_at",
+                    ),
+                )
+            except DatabaseError:
+                logger.exception("Failed to sync revoked tokens")
+                return
+
+            with self._lock:
+                for jti, user_id, created_at, expires_at in rows:
+                    if jti is not None:
+                        self._add(jti, expires_at.timestamp())
+                    if user_id is not None:
+                        self._add_user(
+                            user_id,
+                            created_at.timestamp(),
+                            expires_at.timestamp(),
+                        )
+
+                self._discard_expired(now)
+
+            self._synced_at = now
+        finally:
+            self._sync_lock.release()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expires_at = {}
+            self._users = {}
+            self._bloom = BloomFilter(self.capacity, self.error_rate)
+            self._synced_at = None
+            self._next_sync = 0.0
+
+    def _add(self, jti: str, expires_at: float) -> None:
+        self._expires_at[jti] = expires_at
+        self._bloom.add(jti)
+
+    def _add_user(self, user_id: int, revoked_at: float, expires_at: float) -> None:
+        # 같은 유저가 여러 번 폐기되면 가장 늦게 폐기된 시각을 기준으로 한다.
+        previous = self._users.get(user_id)
+        if previous is None or previous[0] < revoked_at:
+            self._users[user_id] = (revoked_at, expires_at)
+
+    def _discard_expired(self, now: datetime) -> None:
+        self._users = {
+            user_id: revoked
+            for user_id, revoked in self._users.items()
+            if revoked[1] > now.timestamp()
+        }
+
+        expired = [
+            jti
+            for jti, expires_at in self._expires_at.items()
+            if expires_at <= now.timestamp()
+        ]
+
+        if not expired:
+            return
+
+        # Bloom filter 에서는 원소를 뺄 수 없으므로 남은 jti 로 다시 만든다.
+        for jti in expired:
+            del self._expires_at[jti]
+
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        for jti in self._expires_at:
+            self._bloom.add(jti)
+
+
+revocation_list = TokenRevocationList(
+    capacity=settings.TOKEN_REVOCATION["BLOOM_CAPACITY"],
+    error_rate=settings.TOKEN_REVOCATION["BLOOM_ERROR_RATE"],
+    sync_interval=settings.TOKEN_REVOCATION["SYNC_INTERVAL"],
+)
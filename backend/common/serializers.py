@@ -0,0 +1,299 @@
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Callable
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.manager import BaseManager
+from rest_framework import ISO_8601, fields, serializers
+from rest_framework.serializers import ReturnDict
+from rest_framework.settings import api_settings
+
+from common.columnar import OFFSETS, REFERENCES, to_columnar
+
+# 읽기 전용 목록 응답을 직렬화하는 ListSerializer.
+# DRF 의 Serializer 는 객체마다 field 를 순회하며 get_attribute, SkipField 확인 등을 거치므로
+# 객체가 많은 목록에서는 직렬화가 가장 큰 비용이 된다.
+# serializer 의 field 를 한 번 분석하여 field 별 조회 함수와 변환 함수를 만들어 두고,
+# 객체마다 그 함수만 호출하여 같은 구조의 응답을 만든다. 중첩된 serializer 도 같은 방식으로 변환한다.
+
+# 값을 그대로 응답에 담아도 DRF 의 변환 결과와 같은 field 와 값의 type
+IDENTITY_REPRESENTATIONS = {
+    fields.IntegerField: int,
+    fields.CharField: str,
+    fields.BooleanField: bool,
+}
+
+Representation = Callable[[Any], Any]
+
+
+def compile_serializer(serializer: serializers.Serializer) -> Representation:
+    """serializer 의 to_representation 과 같은 결과를 만드는 함수를 반환한다.
+    to_representation 을 재정의한 serializer 는 재정의한 함수를 그대로 사용한다.
+
+    Args:
+        - serializer (Serializer): 변환할 serializer 객체
+
+    Returns:
+        Callable: 객체를 받아 응답 dict 를 반환하는 함수
+    """
+    if (
+        type(serializer).to_representation
+        is not serializers.Serializer.to_representation
+    ):
+        return serializer.to_representation
+
+    accessors = [
+        (field.field_name, compile_attribute(serializer, field), compile_field(field))
+        for field in serializer._readable_fields
+    ]
+
+    def to_representation(instance) -> dict:
+        ret = {}
+
+        for name, get_attribute, represent in accessors:
+            value = get_attribute(instance)
+            ret[name] = None if value is None else represent(value)
+
+        return ret
+
+    return to_representation
+
+
+def compile_attribute(
+    serializer: serializers.Serializer,
+    field: fields.Field,
+) -> Callable[[Any], Any]:
+    # model 의 field 와 관계는 attrgetter 로 바로 읽고,
+    # method, property, source="*" 처럼 DRF 의 처리가 필요한 경우는 field 의 get_attribute 를 사용한다.
+    model = getattr(getattr(serializer, "Meta", None), "model", None)
+
+    if model is None or field.source == "*" or len(field.source_attrs) != 1:
+        return field.get_attribute
+
+    if isinstance(field, (serializers.RelatedField, serializers.ManyRelatedField)):
+        # 관계된 객체를 조회하지 않고 pk 만 읽거나, 관계된 객체 목록을 all() 로 읽는다.
+        return field.get_attribute
+
+    try:
+        model_field = model._meta.get_field(field.source)
+    except FieldDoesNotExist:
+        return field.get_attribute
+
+    if model_field.one_to_one and not model_field.concrete:
+        # 역방향 1:1 관계는 객체가 없으면 예외가 발생하므로 DRF 처럼 None 으로 처리한다.
+        return field.get_attribute
+
+    return attrgetter(field.source)
+
+
+def compile_field(field: fields.Field) -> Representation:
+    if isinstance(field, serializers.ListSerializer):
+        child = compile_serializer(field.child)
+
+        def represent_many(related) -> list:
+            iterable = related.all() if isinstance(related, BaseManager) else related
+            return [child(item) for item in iterable]
+
+        return represent_many
+
+    if isinstance(field, serializers.Serializer):
+        return compile_serializer(field)
+
+    if type(field) is fields.DateTimeField:
+        return compile_datetime_field(field)
+
+    identity_type = IDENTITY_REPRESENTATIONS.get(type(field))
+
+    if identity_type is not None:
+        # 값이 이미 같은 type 이면 변환하지 않는다.
+        def represent(value):
+            if type(value) is identity_type:
+                return value
+            return field.to_representation(value)
+
+        return represent
+
+    return field.to_representation
+
+
+def compile_datetime_field(field: fields.DateTimeField) -> Representation:
+    # DRF 는 값마다 현재 timezone 을 조회하므로, 직렬화하는 동안 같은 timezone 을 미리 조회해 둔다.
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    field_timezone = (
+        field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    )
+
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+
+    if field_timezone is None:
+        return field.to_representation
+
+    def represent(value):
+        if type(value) is not datetime or value.utcoffset() is None:
+            return field.to_representation(value)
+
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return represent
+
+
+def compile_columns(serializer: serializers.Serializer) -> Callable[[list], dict]:
+    """객체 목록을 common.columnar 의 열 단위 형식으로 직렬화하는 함수를 반환한다.
+    행마다 dict 를 만들지 않고 필드별로 값 목록을 만들며, 결과는 to_columnar 로 변환한 결과와 같다.
+
+    Args:
+        - serializer (Serializer): 변환할 serializer 객체
+
+    Returns:
+        Callable: 객체 목록을 받아 열 단위 dict 를 반환하는 함수
+    """
+    if (
+        type(serializer).to_representation
+        is not serializers.Serializer.to_representation
+    ):
+        schema = get_columnar_schema(serializer)
+        return lambda objects: to_columnar(
+            [serializer.to_representation(instance) for instance in objects],
+            schema,
+        )
+
+    builders = [
+        (field.field_name, compile_column(serializer, field))
+        for field in serializer._readable_fields
+    ]
+
+    def to_columns(objects: list) -> dict:
+        columns = []
+        tables = {}
+
+        for name, build in builders:
+            column, table = build(objects)
+            columns.append(column)
+            if table is not None:
+                tables[name] = table
+
+        return {
+            "fields": [name for name, _ in builders],
+            "columns": columns,
+            "tables": tables,
+        }
+
+    return to_columns
+
+
+def get_columnar_schema(serializer: serializers.Serializer) -> dict:
+    """serializer 의 필드로 to_columnar 에 넘길 schema 를 만든다.
+    행이 없어도 compile_columns 와 같은 필드 이름과 표를 담을 수 있다.
+
+    Args:
+        - serializer (Serializer): 변환할 serializer 객체
+
+    Returns:
+        dict: {필드 이름: None 또는 (kind, 표의 schema)}
+    """
+    schema = {}
+
+    for field in serializer._readable_fields:
+        if isinstance(field, serializers.ListSerializer):
+            schema[field.field_name] = (OFFSETS, get_columnar_schema(field.child))
+        elif isinstance(field, serializers.Serializer):
+            schema[field.field_name] = (REFERENCES, get_columnar_schema(field))
+        else:
+            schema[field.field_name] = None
+
+    return schema
+
+
+def compile_column(
+    serializer: serializers.Serializer,
+    field: fields.Field,
+) -> Callable[[list], tuple]:
+    # 객체 목록을 받아 (열, 표) 를 반환하는 함수를 만든다. 표는 목록과 객체 필드에만 있다.
+    get_attribute = compile_attribute(serializer, field)
+
+    if isinstance(field, serializers.ListSerializer):
+        to_table = compile_columns(field.child)
+
+        def build_offsets(objects: list) -> tuple:
+            offsets = []
+            items = []
+
+            for instance in objects:
+                offsets.append(len(items))
+                related = get_attribute(instance)
+                if related is not None:
+                    items.extend(
+                        related.all() if isinstance(related, BaseManager) else related,
+                    )
+
+            return offsets, {"kind": OFFSETS, **to_table(items)}
+
+        return build_offsets
+
+    if isinstance(field, serializers.Serializer):
+        to_table = compile_columns(field)
+
+        def build_references(objects: list) -> tuple:
+            references = []
+            positions = {}
+            items = []
+
+            for instance in objects:
+                value = get_attribute(instance)
+                if value is None:
+                    references.append(None)
+                    continue
+
+                # 같은 객체는 표에 한 번만 담는다.
+                key = getattr(value, "pk", None) or id(value)
+                position = positions.get(key)
+                if position is None:
+                    position = positions[key] = len(items)
+                    items.append(value)
+
+                references.append(position)
+
+            return references, {"kind": REFERENCES, **to_table(items)}
+
+        return build_references
+
+    represent = compile_field(field)
+
+    def build_values(objects: list) -> tuple:
+        return [
+            None if value is None else represent(value)
+            for value in map(get_attribute, objects)
+        ], None
+
+    return build_values
+
+
+class CompiledListSerializer(serializers.ListSerializer):
+    """child serializer 를 compile_serializer 로 변환한 함수로 목록을 직렬화한다.
+    읽기 전용이며, Meta.list_serializer_class 에 지정하여 사용한다.
+    context 의 columnar 가 True 이면 compile_columns 로 열 단위 형식의 dict 를 만든다.
+
+    field 가 context 를 사용할 수 있으므로 변환은 직렬화할 때마다 1번 한다.
+    """
+
+    @property
+    def data(self):
+        if not self.context.get("columnar"):
+            return super().data
+
+        iterable = (
+            self.instance.all()
+            if isinstance(self.instance, BaseManager)
+            else self.instance
+        )
+        return ReturnDict(compile_columns(self.child)(list(iterable)), serializer=self)
+
+    def to_representation(self, data) -> list:
+        iterable = data.all() if isinstance(data, BaseManager) else data
+        child = compile_serializer(self.child)
+
+        return [child(item) for item in iterable]
@@ -0,0 +1,93 @@
+from typing import Any, Callable, Dict, Hashable, Optional
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """같은 key 로 동시에 실행되는 계산을 process 안에서 1번만 실행하고, 결과를 함께 사용한다.
+
+    먼저 요청한 thread 가 계산하는 동안 같은 key 로 요청한 thread 들은 그 결과를 기다린다.
+    timeout 초 안에 계산이 끝나지 않으면 기다리던 thread 도 직접 계산한다.
+    계산 중 발생한 예외는 기다리던 thread 에도 그대로 발생한다.
+
+    결과는 executions, coalesced, timeouts 로 집계된다.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.executions = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.waiting = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """key 로 실행 중인 계산이 있으면 그 결과를, 없으면 func 를 실행한 결과를 반환한다.
+
+        Args:
+            - key (Hashable): 같은 결과를 만드는 계산을 구분하는 값
+            - func (Callable): 결과를 계산하는 함수
+
+        Returns:
+            Any: func 의 반환 값
+        """
+        with self._lock:
+            call = self._calls.get(key)
+
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+                leader = True
+            else:
+                self.waiting += 1
+                leader = False
+
+        if leader:
+            return self._run(key, call, func)
+
+        finished = call.done.wait(self.timeout)
+
+        with self._lock:
+            self.waiting -= 1
+            if finished:
+                self.coalesced += 1
+            else:
+                self.timeouts += 1
+                self.executions += 1
+
+        if not finished:
+            return func()
+
+        if call.error is not None:
+            raise call.error
+
+        return call.result
+
+    def _run(self, key: Hashable, call: _Call, func: Callable[[], Any]) -> Any:
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "timeouts": self.timeouts,
+                "waiting": self.waiting,
+                "in_flight": len(self._calls),
+            }
@@ -0,0 +1,123 @@
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+from rest_framework import serializers
+from rest_framework.request import Request
+
+from common.http_exceptions import InvalidFieldSelectionError
+
+# 조회 응답에 담을 필드를 요청에서 고른다.
+# 응답에 담지 않는 필드는 serializer 에서 빼고, view 의 get_queryset 은 그 필드를 위한 join, prefetch 와
+# column 조회를 생략한다.
+
+FIELDS_QUERY_PARAM = "fields"
+EXPAND_QUERY_PARAM = "expand"
+
+# (fields, expand). None 이면 지정하지 않은 것이다.
+FieldSelection = Tuple[Optional[FrozenSet[str]], Optional[FrozenSet[str]]]
+
+
+def parse_field_names(value: Optional[str]) -> Optional[FrozenSet[str]]:
+    if value is None:
+        return None
+
+    return frozenset(name.strip() for name in value.split(",") if name.strip())
+
+
+class SparseFieldsMixin:
+    """?fields=, ?expand= 로 조회 응답의 필드를 고르는 view mixin. 조회(GET, HEAD) 요청에만 적용된다.
+
+    - fields: 응답에 담을 필드 이름을 쉼표로 구분하여 지정한다. 지정하지 않거나 비어 있으면 모든 필드를 담는다.
+    - expand: expandable_fields 중 객체로 담을 필드를 지정한다. 지정하지 않으면 모두 객체로 담고,
+      지정하면 나머지 관계 필드는 pk 로 담는다.
+
+    get_queryset 은 is_field_selected, is_field_expanded 로
+    join, prefetch 와 조회할 column 을 정한다.
+
+    Raises:
+
+        - InvalidFieldSelectionError (400 BAD REQUEST): 없는 필드나 객체로 담을 수 없는 필드를 지정한 경우
+    """
+
+    expandable_fields: Tuple[str, ...] = ()
+
+    def get_field_selection(self) -> Optional[FieldSelection]:
+        """요청에서 고른 (fields, expand) 를 반환한다. 조회 요청이 아니면 None 을 반환한다."""
+        if not hasattr(self, "_field_selection"):
+            request = getattr(self, "request", None)
+
+            if not isinstance(request, Request) or request.method not in (
+                "GET",
+                "HEAD",
+            ):
+                self._field_selection = None
+            else:
+                self._field_selection = self.parse_field_selection(request)
+
+        return self._field_selection
+
+    def parse_field_selection(self, request: Request) -> FieldSelection:
+        # 빈 fields 는 모든 필드를 빼는 대신 지정하지 않은 것으로 본다.
+        fields = parse_field_names(request.query_params.get(FIELDS_QUERY_PARAM)) or None
+        expand = parse_field_names(request.query_params.get(EXPAND_QUERY_PARAM))
+
+        field_names = set(self.get_serializer_class()().fields)
+        invalid = sorted(
+            (fields or frozenset()) - field_names
+            | (expand or frozenset()) - set(self.expandable_fields),
+        )
+
+        if invalid:
+            detail = InvalidFieldSelectionError.default_detail
+            raise InvalidFieldSelectionError(detail=f"{detail} ({', '.join(invalid)})")
+
+        return fields, expand
+
+    def is_field_selected(self, name: str) -> bool:
+        selection = self.get_field_selection()
+        return selection is None or selection[0] is None or name in selection[0]
+
+    def is_field_expanded(self, name: str) -> bool:
+        if name not in self.expandable_fields or not self.is_field_selected(name):
+            return False
+
+        selection = self.get_field_selection()
+        return selection is None or selection[1] is None or name in selection[1]
+
+    def get_selected_fields(self, names: Iterable[str]) -> List[str]:
+        return [name for name in names if self.is_field_selected(name)]
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+
+        if self.get_field_selection() not in (None, (None, None)):
+            self.prune_fields(getattr(serializer, "child", serializer))
+
+        return serializer
+
+    def prune_fields(self, serializer: serializers.Serializer) -> None:
+        """고르지 않은 필드를 빼고, 객체로 담지 않는 관계 필드는 pk 로 담도록 바꾼다."""
+        for name, field in list(serializer.fields.items()):
+            if not self.is_field_selected(name):
+                serializer.fields.pop(name)
+            elif name in self.expandable_fields and not self.is_field_expanded(name):
+                # 작성자는 create_user_id 로, 하위 업무는 prefetch 한 하위 업무의 pk 로 담는다.
+                kwargs = {} if field.source == name else {"source": field.source}
+                serializer.fields[name] = serializers.PrimaryKeyRelatedField(
+                    read_only=True,
+                    many=isinstance(field, serializers.ListSerializer),
+                    **kwargs,
+                )
+
+    def build_response_etag(self, *parts) -> str:
+        # 같은 객체도 고른 필드에 따라 응답이 다르므로 ETag 에 포함한다.
+        selection = self.get_field_selection()
+
+        if selection is not None:
+            fields, expand = selection
+            parts = (
+                *parts,
+                f"fields={','.join(sorted(fields)) if fields is not None else '*'}",
+                f"expand={','.join(sorted(expand)) if expand is not None else '*'}",
+            )
+
+        return super().build_response_etag(*parts)
@@ -0,0 +1,54 @@
+from functools import partial
+from typing import Any, Callable
+import threading
+
+from django.db import transaction
+
+_local = threading.local()
+
+
+def get_commit_pending(name: str, using: str, factory: Callable[[], Any]) -> Any:
+    """현재 transaction 에서 name 으로 변경 내역을 모으는 pending 객체를 반환한다.
+    처음 요청된 경우 commit 시점에 pending.apply(using) 가 실행되도록 transaction.on_commit 에 등록한다.
+
+    savepoint 가 rollback 되면 그 안에서 등록된 on_commit 도 취소되므로
+    savepoint 별로 따로 모으고, 각각 commit 시점에 한 번씩 반영한다.
+
+    Args:
+
+        - name (str): 모으는 변경 내역의 이름
+        - using (str): DB alias
+        - factory (Callable): 새 pending 객체를 만드는 함수
+
+    Returns:
+
+        - Any: apply(using) 를 가진 pending 객체
+    """
+    connection = transaction.get_connection(using)
+    pendings = _local.__dict__.setdefault("pendings", {})
+    callbacks = [func for _, func, *_ in connection.run_on_commit]
+
+    # 등록한 on_commit 이 대기 목록에 없다면 rollback 되어 반영되지 않을 값이다.
+    # 다른 on_commit 이 대기 중이더라도 이전 transaction 에서 남은 값을 이어서 모으지 않는다.
+    for key in [
+        key
+        for key, (_, callback) in pendings.items()
+        if key[1] == using and callback not in callbacks
+    ]:
+        del pendings[key]
+
+    key = (name, using, tuple(connection.savepoint_ids))
+
+    if key not in pendings:
+        callback = partial(flush_commit_pending, key)
+        pendings[key] = (factory(), callback)
+        transaction.on_commit(callback, using=using)
+
+    return pendings[key][0]
+
+
+def flush_commit_pending(key: tuple) -> None:
+    pending, _ = _local.__dict__.get("pendings", {}).pop(key, (None, None))
+
+    if pending is not None:
+        pending.apply(using=key[1])
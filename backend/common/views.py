@@ -0,0 +1,44 @@
+from inspect import isawaitable
+
+from asgiref.sync import sync_to_async
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """handler 를 async 로 작성하는 APIView. ASGI 로 배포할 때 사용한다.
+    요청 본문 parser, 인증, 권한 확인, 에러 응답 형식과 renderer 는 APIView 와 같다.
+
+    DRF 의 dispatch 는 sync 이므로 같은 순서로 async 로 실행하며,
+    DB 를 조회할 수 있는 인증과 권한 확인은 sync thread 에서 실행한다.
+    """
+
+    async def dispatch(self, request, *args, **kwargs) -> Response:
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self,
+                    request.method.lower(),
+                    self.http_method_not_allowed,
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            # options, http_method_not_allowed 는 APIView 의 sync 구현을 그대로 사용한다.
+            response = handler(request, *args, **kwargs)
+            if isawaitable(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -107,6 +107,65 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/4.2/topics/auth/passwords/
+# PASSWORD_HASHER 로 새 비밀번호에 사용할 hasher 를 고르고, 나머지는 기존 hash 검증에 사용한다.
+# 로그인에 성공하면 기존 hash 는 선택한 hasher 와 비용으로 다시 저장된다.
+# - pbkdf2: Django 기본값
+# - scrypt: 메모리를 많이 사용하는 hasher (표준 라이브러리)
+# - argon2: 메모리를 많이 사용하는 hasher (argon2-cffi 설치 필요)
+# 비용은 `manage.py benchmark_login` 으로 측정하여 정한다.
+
+PASSWORD_HASHER_CLASSES = {
+    "pbkdf2": "common.hashers.ConfigurablePBKDF2PasswordHasher",
+    "scrypt": "common.hashers.ConfigurableScryptPasswordHasher",
+    "argon2": "common.hashers.ConfigurableArgon2PasswordHasher",
+}
+PASSWORD_HASHER = env("PASSWORD_HASHER", default="pbkdf2")
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_CLASSES[PASSWORD_HASHER],
+    *(
+        hasher
+        for name, hasher in PASSWORD_HASHER_CLASSES.items()
+        if name != PASSWORD_HASHER
+    ),
+]
+PASSWORD_HASHER_OPTIONS = {
+    "PBKDF2_ITERATIONS": env.int("PBKDF2_ITERATIONS", default=600000),
+    "SCRYPT_WORK_FACTOR": env.int("SCRYPT_WORK_FACTOR", default=2**14),
+    "SCRYPT_BLOCK_SIZE": env.int("SCRYPT_BLOCK_SIZE", default=8),
+    "SCRYPT_PARALLELISM": env.int("SCRYPT_PARALLELISM", default=1),
+    "ARGON2_TIME_COST": env.int("ARGON2_TIME_COST", default=2),
+    "ARGON2_MEMORY_COST": env.int("ARGON2_MEMORY_COST", default=102400),
+    "ARGON2_PARALLELISM": env.int("ARGON2_PARALLELISM", default=8),
+}
+
+# async 로그인, 회원가입 뷰에서 비밀번호 hash 를 계산하는 thread 수
+PASSWORD_HASHING_WORKERS = env.int(
+    "PASSWORD_HASHING_WORKERS",
+    default=os.cpu_count() or 1,
+)
+
+
+# 목록, 상세 조회 응답 cache
+# CACHES 에 설정한 cache 중 ALIAS 의 cache 를 사용한다. (CACHES 가 없으면 local-memory cache)
+# 목록은 팀별로, 상세 조회는 객체별로 version 을 두어 데이터가 바뀌면 version 이 올라가 바로 반영되고,
+# 이전 응답은 TIMEOUT(초) 후 사라진다.
+# 작성자의 username, team 이 바뀌면 그 유저가 작성한 업무의 version 도 함께 올라간다.
+
+RESPONSE_CACHE = {
+    "ALIAS": env("RESPONSE_CACHE_ALIAS", default="default"),
+    "LIST_TIMEOUT": env.int("LIST_RESPONSE_CACHE_TIMEOUT", default=300),
+    "DETAIL_TIMEOUT": env.int("DETAIL_RESPONSE_CACHE_TIMEOUT", default=300),
+    # 팀별, 객체별 version 을 보관하는 시간(초). LIST_TIMEOUT, DETAIL_TIMEOUT 보다 길게 둔다.
+    # 지나면 새 version 을 만들어 이전 응답 cache 를 사용하지 않을 뿐 잘못된 응답을 보내지는 않는다.
+    "VERSION_TIMEOUT": env.int("RESPONSE_CACHE_VERSION_TIMEOUT", default=3600),
+    # 같은 목록 응답을 만드는 요청을 기다리는 최대 시간(초). 지나면 직접 응답을 만든다.
+    "SINGLE_FLIGHT_TIMEOUT": env.float(
+        "LIST_RESPONSE_SINGLE_FLIGHT_TIMEOUT", default=5.0
+    ),
+}
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
@@ -144,14 +203,29 @@ SPECTACULAR_SETTINGS = {
 }
 
 
+# access token 에 team claim 을 담고, 인증 시 DB 조회 없이 token 으로 유저를 만든다.
+AUTH_TOKEN_TEAM_CLAIM = env.bool("AUTH_TOKEN_TEAM_CLAIM", default=False)
+
 REST_FRAMEWORK = {
     # YOUR SETTINGS
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "common.authentication.TeamClaimJWTAuthentication"
+        if AUTH_TOKEN_TEAM_CLAIM
+        else "common.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    # orjson 이 설치되어 있으면 JSON 을 orjson 으로 읽고 쓰며, 없으면 DRF 의 기본 구현을 사용한다.
+    "DEFAULT_RENDERER_CLASSES": (
+        "common.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "common.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
 SIMPLE_JWT = {
@@ -182,3 +256,34 @@ SIMPLE_JWT = {
 }
 
 APPEND_SLASH = False
+
+# 인증된 User 를 보관하는 process 내부 cache (common.authentication.CachedJWTAuthentication)
+# - MAXSIZE: 보관할 최대 User 수
+# - TTL: 다른 process 에서 변경된 User 가 반영되기까지의 최대 시간(초)
+AUTH_USER_CACHE = {
+    "MAXSIZE": env.int("AUTH_USER_CACHE_MAXSIZE", default=10000),
+    "TTL": env.int("AUTH_USER_CACHE_TTL", default=60),
+}
+
+# 서명 검증을 마친 access token 을 보관하는 process 내부 cache
+# - MAXSIZE: 보관할 최대 token 수 (각 token 은 exp 까지만 보관)
+AUTH_TOKEN_CACHE = {
+    "MAXSIZE": env.int("AUTH_TOKEN_CACHE_MAXSIZE", default=10000),
+}
+
+# 하위 업무에 따른 업무 자동 완료 처리 방식
+# - signal: post_save/post_delete receiver 가 commit 시점에 변화량을 모아 반영한다.
+# - trigger: migration 으로 설치한 DB trigger 가 반영한다. (SQLite, MySQL)
+SUBTASK_COMPLETION_ENGINE = env("SUBTASK_COMPLETION_ENGINE", default="signal")
+
+# 폐기된 token 목록 (common.revocation.TokenRevocationList)
+# - BLOOM_CAPACITY, BLOOM_ERROR_RATE: 메모리에 둘 Bloom filter 의 크기와 오탐률
+# - SYNC_INTERVAL: 다른 process 에서 폐기한 token 을 불러오는 주기(초)
+#   동기화는 주기가 지난 뒤의 첫 요청에서 실행되므로, 짧게 하면 폐기가 빨리 반영되는 대신
+#   그 요청이 조회 query 1번만큼 느려지는 횟수가 늘어난다.
+# 테이블의 만료된 폐기 내역은 purge_revoked_tokens 명령을 주기적으로 실행하여 삭제한다.
+TOKEN_REVOCATION = {
+    "BLOOM_CAPACITY": env.int("TOKEN_REVOCATION_BLOOM_CAPACITY", default=100000),
+    "BLOOM_ERROR_RATE": env.float("TOKEN_REVOCATION_BLOOM_ERROR_RATE", default=0.001),
+    "SYNC_INTERVAL": env.int("TOKEN_REVOCATION_SYNC_INTERVAL", default=30),
+}
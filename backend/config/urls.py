@@ -26,6 +26,11 @@ from rest_framework_simplejwt.views import (
 )
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from accounts.serializers import (
+    TeamTokenObtainPairSerializer,
+    TeamTokenRefreshSerializer,
+)
+
 from config.settings.base import API_V1_PREFIX
 
 urlpatterns = [
@@ -39,9 +44,17 @@ urlpatterns = [
         name="api-swagger-ui",
     ),
     # simplejwt,
-    path("api/token", TokenObtainPairView.as_view(), name="token_obtain_pair"),
+    path(
+        "api/token",
+        TokenObtainPairView.as_view(serializer_class=TeamTokenObtainPairSerializer),
+        name="token_obtain_pair",
+    ),
     path("api/token/verification", TokenVerifyView.as_view(), name="token_verify"),
-    path("api/token/refresh-token", TokenRefreshView.as_view(), name="token_refresh"),
+    path(
+        "api/token/refresh-token",
+        TokenRefreshView.as_view(serializer_class=TeamTokenRefreshSerializer),
+        name="token_refresh",
+    ),
     # locals
     path(f"{API_V1_PREFIX}/accounts", include("accounts.urls")),
     path(f"{API_V1_PREFIX}/tasks", include("tasks.urls")),
@@ -0,0 +1,28 @@
+import pytest
+
+from common.response_cache import get_response_cache
+from common.revocation import revocation_list
+
+
+@pytest.fixture(autouse=True)
+def synced_revocation_list(request, django_db_setup, django_db_blocker):
+    """폐기된 token 목록을 테스트 전에 미리 불러온다.
+    요청 중에 주기적으로 실행되는 동기화 query 가 테스트의 query 수에 섞이지 않게 한다.
+    DB 를 사용하지 않는 테스트는 요청도 보내지 않으므로 불러오지 않는다.
+    """
+    uses_db = request.node.get_closest_marker("django_db") or {
+        "db",
+        "transactional_db",
+    } & set(request.fixturenames)
+    if not uses_db:
+        return
+
+    with django_db_blocker.unblock():
+        revocation_list.clear()
+        revocation_list.sync()
+
+
+@pytest.fixture(autouse=True)
+def cleared_response_cache():
+    """DB 는 테스트마다 초기화되므로 이전 테스트에서 저장된 목록 응답도 지운다."""
+    get_response_cache().clear()
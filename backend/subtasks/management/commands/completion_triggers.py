@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from subtasks.triggers import drop_completion_triggers, install_completion_triggers
+
+
+class Command(BaseCommand):
+    help = "하위 업무에 따른 업무 자동 완료 처리 trigger 를 설치하거나 제거합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=["install", "drop"])
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, action: str, database: str, **options):
+        connection = connections[database]
+
+        if action == "install":
+            install_completion_triggers(connection)
+            message = "Completion triggers installed."
+        else:
+            drop_completion_triggers(connection)
+            message = "Completion triggers dropped."
+
+        self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,75 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:19
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("tasks", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SubTask",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "team",
+                    models.CharField(
+                        choices=[
+                            ("Danbie", "단비"),
+                            ("Darae", "다래"),
+                            ("Blabla", "블라블라"),
+                            ("Cheollo", "철로"),
+                            ("Dangi", "땅이"),
+                            ("Haetae", "해태"),
+                            ("Supi", "수피"),
+                        ],
+                        max_length=10,
+                        verbose_name="팀 소속",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "modified_at",
+                    models.DateTimeField(auto_now=True, verbose_name="생성일"),
+                ),
+                (
+                    "is_completed",
+                    models.BooleanField(default=False, verbose_name="완료 유무"),
+                ),
+                (
+                    "completed_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="완료일"),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="subtasks",
+                        to="tasks.task",
+                        verbose_name="상위 업무",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "하위업무 내역",
+                "verbose_name_plural": "하위업무 목록",
+                "db_table": "subtasks",
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("subtasks", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="subtask",
+            index=models.Index(
+                fields=["team", "created_at"], name="subtasks_team_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="subtask",
+            index=models.Index(
+                fields=["task", "is_completed"], name="subtasks_task_completed_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations
+
+from subtasks.triggers import (
+    drop_completion_triggers,
+    install_completion_triggers,
+    is_trigger_engine,
+)
+
+
+def install_triggers(apps, schema_editor):
+    # SUBTASK_COMPLETION_ENGINE 이 trigger 인 경우에만 설치한다.
+    # 이후 설정을 바꾸면 `manage.py completion_triggers` 로 설치하거나 제거한다.
+    if is_trigger_engine():
+        install_completion_triggers(schema_editor.connection)
+
+
+def drop_triggers(apps, schema_editor):
+    drop_completion_triggers(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("subtasks", "0002_subtask_indexes"),
+        ("tasks", "0003_subtask_counters"),
+    ]
+
+    operations = [
+        migrations.RunPython(install_triggers, drop_triggers),
+    ]
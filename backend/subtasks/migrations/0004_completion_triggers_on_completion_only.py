@@ -0,0 +1,19 @@
+from django.db import migrations
+
+from subtasks.triggers import install_completion_triggers, is_trigger_engine
+
+
+def reinstall_triggers(apps, schema_editor):
+    # 하위 업무를 삭제하거나 옮길 때는 업무를 완료 처리하지 않도록 trigger 를 다시 설치한다.
+    if is_trigger_engine():
+        install_completion_triggers(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("subtasks", "0003_completion_triggers"),
+    ]
+
+    operations = [
+        migrations.RunPython(reinstall_triggers, migrations.RunPython.noop),
+    ]
@@ -1,13 +1,212 @@
-from django.db.models.signals import post_save
+from collections import Counter
+from typing import Dict, Iterable, List
+
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from django.db.models import Max, QuerySet
+from django.db import connections, models, router, transaction
 from django.utils import timezone
-from django.db import models
 
 
+from common.enums import CompletionOutcome, MarkAsCompletion
 from common.models import BaseModel
+from subtasks.propagation import (
+    propagate_subtask_completion,
+    propagate_subtask_delta,
+    propagate_subtask_refresh,
+)
+from subtasks.triggers import is_trigger_engine
+from tasks.cache_invalidation import invalidate_task_caches
 from tasks.models import Task
 
 
+class SubTaskQuerySet(QuerySet):
+    def delete(self):
+        """삭제할 하위 업무를 먼저 잠가, 삭제 signal 이 받는 완료 유무가 삭제 시점의 값이 되도록 한다."""
+        if is_trigger_engine():
+            return super().delete()
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            list(self.select_for_update().values_list("pk", flat=True))
+            return super().delete()
+
+
+class SubTaskManager(models.Manager.from_queryset(SubTaskQuerySet)):
+    def bulk_create_for_task(self, task: Task, rows: List[dict]) -> List["SubTask"]:
+        """한 업무의 하위 업무 여러 개를 하나의 transaction 에서 한 번의 INSERT 문으로 생성한다.
+        bulk_create 는 signal 을 보내지 않으므로 상위 업무의 하위 업무 수는 한 번에 반영한다.
+
+        생성된 pk 를 INSERT 문에서 돌려받을 수 없는 DB(MySQL)는 상위 업무를 잠근 뒤 INSERT 하고,
+        INSERT 전보다 큰 pk 를 가진 상위 업무의 하위 업무를 다시 조회하여 pk 를 채운다.
+        상위 업무를 잠근 동안 다른 transaction 은 이 업무에 하위 업무를 추가할 수 없으므로
+        다시 조회한 하위 업무는 모두 이번에 생성한 하위 업무이다.
+
+        Args:
+
+            - task (Task): 상위 업무
+            - rows (List[dict]): 검증된 하위 업무 정보 목록
+
+        Returns:
+
+            - List[SubTask]: pk 가 포함된 생성된 하위 업무 목록
+        """
+        subtasks = [self.model(task=task, **row) for row in rows]
+
+        with transaction.atomic(using=self.db):
+            if connections[self.db].features.can_return_rows_from_bulk_insert:
+                self.bulk_create(subtasks)
+            else:
+                self.bulk_create_and_select(task, subtasks)
+
+            propagate_subtask_delta(
+                task.id,
+                total_delta=len(subtasks),
+                open_delta=sum(not subtask.is_completed for subtask in subtasks),
+                using=self.db,
+            )
+            invalidate_task_caches(task_ids=[task.id], using=self.db)
+
+        for subtask in subtasks:
+            subtask.remember_loaded_state()
+
+        return subtasks
+
+    def bulk_create_and_select(self, task: Task, subtasks: List["SubTask"]) -> None:
+        # 상위 업무를 잠그면 다른 transaction 의 하위 업무 INSERT 는 외래 키 확인에서 commit 까지 기다린다.
+        list(
+            Task.objects.db_manager(self.db)
+            .select_for_update()
+            .filter(pk=task.pk)
+            .values_list("pk", flat=True),
+        )
+        last_pk = self.filter(task=task).aggregate(last_pk=Max("pk"))["last_pk"] or 0
+
+        self.bulk_create(subtasks)
+
+        # 하나의 INSERT 문으로 생성된 행의 pk 는 행 순서대로 증가한다.
+        created_pks = (
+            self.filter(task=task, pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+
+        for subtask, pk in zip(subtasks, created_pks, strict=True):
+            subtask.pk = pk
+            subtask._state.adding = False
+            subtask._state.db = self.db
+
+    def complete_for_team(
+        self,
+        subtask_ids: Iterable[int],
+        team: str,
+    ) -> Dict[int, CompletionOutcome]:
+        """team 에 속한 미완료 하위 업무들을 하나의 조건부 UPDATE 문으로 완료 처리한다.
+        조회한 하위 업무는 commit 전까지 잠그며, 영향을 받은 상위 업무는 commit 시점에 한 번에 갱신한다.
+
+        Args:
+
+            - subtask_ids (Iterable[int]): 완료 처리할 하위 업무의 pk 목록
+            - team (str): 요청한 유저의 팀
+
+        Returns:
+
+            - Dict[int, CompletionOutcome]: 하위 업무 pk 별 처리 결과
+                - completed: 완료 처리됨
+                - already_completed: 이미 완료된 하위 업무
+                - forbidden: 다른 팀의 하위 업무
+                - not_found: 존재하지 않는 하위 업무
+        """
+        subtask_ids = list(dict.fromkeys(subtask_ids))
+
+        with transaction.atomic(using=self.db):
+            locked_rows = (
+                self.select_for_update()
+                .filter(pk__in=subtask_ids)
+                .values_list("pk", "team", "is_completed", "task_id")
+            )
+            rows = {pk: row for pk, *row in locked_rows}
+
+            outcomes = {}
+            completed_per_task = Counter()
+
+            for pk in subtask_ids:
+                if pk not in rows:
+                    outcomes[pk] = CompletionOutcome.not_found
+                    continue
+
+                subtask_team, is_completed, task_id = rows[pk]
+
+                if subtask_team != team:
+                    outcomes[pk] = CompletionOutcome.forbidden
+                elif is_completed:
+                    outcomes[pk] = CompletionOutcome.already_completed
+                else:
+                    outcomes[pk] = CompletionOutcome.completed
+                    completed_per_task[task_id] += 1
+
+            completed_ids = [
+                pk
+                for pk, outcome in outcomes.items()
+                if outcome == CompletionOutcome.completed
+            ]
+
+            if completed_ids:
+                now = timezone.now()
+                # update() 는 auto_now 필드를 갱신하지 않으므로 modified_at 도 함께 지정한다.
+                self.filter(pk__in=completed_ids, team=team, is_completed=False).update(
+                    is_completed=True,
+                    completed_at=now,
+                    modified_at=now,
+                )
+
+                for task_id, count in completed_per_task.items():
+                    propagate_subtask_delta(
+                        task_id,
+                        total_delta=0,
+                        open_delta=-count,
+                        completed=count,
+                        using=self.db,
+                    )
+
+                invalidate_task_caches(
+                    task_ids=completed_per_task,
+                    subtask_ids=completed_ids,
+                    using=self.db,
+                )
+
+        return outcomes
+
+    def mark_as_completion(self, subtask_id: int, team: str) -> int:
+        """team 의 미완료 하위 업무 하나를 조회 없이 하나의 조건부 UPDATE 문으로 완료 처리하고,
+        완료된 경우 상위 업무에 반영한다.
+
+        Args:
+
+            - subtask_id (int): 완료 처리할 하위 업무의 pk
+            - team (str): 요청한 유저의 팀
+
+        Returns:
+
+            - int: 완료 처리된 하위 업무 수 (0 또는 1)
+        """
+        now = timezone.now()
+
+        updated = self.filter(pk=subtask_id, team=team, is_completed=False).update(
+            **{
+                MarkAsCompletion.is_completed: True,
+                MarkAsCompletion.completed_at: now,
+            },
+            modified_at=now,
+        )
+
+        if updated:
+            propagate_subtask_completion(subtask_id, using=self.db)
+            # DB trigger 가 업무를 완료 처리하는 경우에도 응답 cache 는 여기서 무효화한다.
+            invalidate_task_caches(subtask_ids=[subtask_id], using=self.db)
+
+        return updated
+
+
 class SubTask(BaseModel):
     task = models.ForeignKey(
         Task,
@@ -16,26 +215,239 @@ class SubTask(BaseModel):
         related_name="subtasks",
     )
 
+    objects = SubTaskManager()
+
     def __str__(self) -> str:
         return f"SubTask(team={self.team}, is_completed={self.is_completed})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """DB에서 조회한 시점의 상위 업무와 완료 유무를 기록해 두고, 저장 시 하위 업무 수 변화량 계산에 사용한다."""
+        instance = super().from_db(db, field_names, values)
+        instance.remember_loaded_state()
+        return instance
+
+    def remember_loaded_state(self) -> None:
+        self._loaded_state = (
+            self.__dict__.get("task_id"),
+            self.__dict__.get("is_completed"),
+        )
+        self._loaded_completed_at = self.__dict__.get("completed_at")
+
+    def get_changed_counter_fields(self) -> set:
+        """조회 이후 바뀐 상위 업무와 완료 유무 필드. 조회 시점의 상태를 모르면 모두 바뀐 것으로 본다."""
+        loaded_task_id, loaded_is_completed = getattr(
+            self,
+            "_loaded_state",
+            (None, None),
+        )
+
+        if loaded_is_completed is None:
+            return {"task", "is_completed"}
+
+        changed_fields = set()
+        if self.__dict__.get("task_id") != loaded_task_id:
+            changed_fields.add("task")
+        if self.__dict__.get("is_completed") != loaded_is_completed:
+            changed_fields.add("is_completed")
+        return changed_fields
+
+    def lock_loaded_state(self, using: str) -> None:
+        """DB 의 하위 업무를 commit 전까지 잠그고, 현재 상위 업무와 완료 유무를 변화량 계산의 기준으로 삼는다.
+        동시에 같은 하위 업무를 저장하거나 삭제하는 요청은 앞선 요청이 commit 된 뒤의 값을 기준으로 계산한다.
+        """
+        row = (
+            type(self)
+            ._base_manager.using(using)
+            .select_for_update()
+            .filter(pk=self.pk)
+            .values_list("task_id", "is_completed")
+            .first()
+        )
+
+        if row is not None:
+            self._loaded_state = row
+
+    def save(self, *args, **kwargs):
+        """하위 업무를 수정할 때 상위 업무나 완료 유무를 바꾼 경우에만 하위 업무를 잠그고,
+        조회 시점이 아닌 DB 의 현재 상태를 기준으로 하위 업무 수 변화량을 계산한다.
+        바꾸지 않은 경우에는 잠그지 않고, 조회 이후 다른 요청이 바꿨을 수 있는 값을 덮어쓰지 않도록
+        상위 업무, 완료 유무와 완료일을 저장하지 않는다. DB trigger 가 반영하는 경우에는 잠그지 않는다.
+        """
+        if self._state.adding or self.pk is None:
+            return super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        changed_fields = self.get_changed_counter_fields()
+
+        if update_fields is not None:
+            saved_fields = set(update_fields)
+            if "task_id" in saved_fields:
+                saved_fields.add("task")
+            changed_fields &= saved_fields
+
+        if not changed_fields:
+            if update_fields is None:
+                excluded_fields = {"task", "is_completed"}
+                if self.__dict__.get("completed_at") == getattr(
+                    self,
+                    "_loaded_completed_at",
+                    None,
+                ):
+                    excluded_fields.add("completed_at")
+                deferred_fields = self.get_deferred_fields()
+                kwargs["update_fields"] = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key
+                    and field.name not in excluded_fields
+                    and field.attname not in deferred_fields
+                ]
+            return super().save(*args, **kwargs)
+
+        if is_trigger_engine():
+            return super().save(*args, **kwargs)
+
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+
+        with transaction.atomic(using=using, savepoint=False):
+            self.lock_loaded_state(using)
+            super().save(*args, **kwargs)
+
+    def delete(self, using=None, keep_parents=False):
+        if is_trigger_engine():
+            return super().delete(using=using, keep_parents=keep_parents)
+
+        using = using or router.db_for_write(type(self), instance=self)
+
+        with transaction.atomic(using=using, savepoint=False):
+            self.lock_loaded_state(using)
+            return super().delete(using=using, keep_parents=keep_parents)
+
     class Meta:
         db_table = "subtasks"
         verbose_name = "하위업무 내역"
         verbose_name_plural = "하위업무 목록"
+        indexes = [
+            # 하위 업무 목록 조회: team 으로 필터링하고 created_at 기준으로 정렬
+            models.Index(
+                fields=["team", "created_at"],
+                name="subtasks_team_created_idx",
+            ),
+            # 업무별 하위 업무 수 집계: 업무의 하위 업무 중 완료되지 않은 하위 업무 조회
+            models.Index(
+                fields=["task", "is_completed"],
+                name="subtasks_task_completed_idx",
+            ),
+        ]
 
 
 @receiver(post_save, sender=SubTask)
 def detect_subtask_and_mark_as_completion(
     sender,
     instance: SubTask,
+    created: bool,
+    using: str,
+    raw: bool = False,
     **kwargs,
 ):
-    task: Task = instance.task
+    """하위 업무가 추가되거나 완료 유무가 바뀌면 상위 업무의 하위 업무 수를 갱신한다.
+    미완료 하위 업무 수가 0이 되면 같은 UPDATE 문에서 상위 업무가 완료 처리된다.
+    transaction 안에서는 commit 시점에 영향을 받은 업무들을 모아 한 번에 갱신하며,
+    완료 유무가 바뀌지 않은 저장은 상위 업무를 갱신하지 않는다.
+    상위 업무를 갱신한 뒤에는 관련된 팀의 목록 응답 cache 를 무효화한다.
+    """
+    if raw:
+        return
+
+    previous_task_id, previous_is_completed = getattr(
+        instance,
+        "_loaded_state",
+        (None, None),
+    )
+    update_fields = kwargs.get("update_fields")
+    task_id, is_completed = instance.task_id, instance.is_completed
+
+    # update_fields 에 없는 값은 DB 에 저장되지 않았으므로 바뀌지 않은 것으로 본다.
+    if update_fields is not None and previous_is_completed is not None:
+        if not {"task", "task_id"} & update_fields:
+            task_id = previous_task_id
+        if "is_completed" not in update_fields:
+            is_completed = previous_is_completed
 
-    result = SubTask.objects.filter(task=task, is_completed=False).exists()
+    if not created and previous_is_completed is None:
+        # 조회 시점의 상태를 모르는 경우 DB의 하위 업무로 다시 집계한다.
+        propagate_subtask_refresh(task_id, using=using)
+    elif created or previous_task_id != task_id:
+        if not created:
+            propagate_subtask_delta(
+                previous_task_id,
+                total_delta=-1,
+                open_delta=-int(not previous_is_completed),
+                using=using,
+            )
+        propagate_subtask_delta(
+            task_id,
+            total_delta=1,
+            open_delta=int(not is_completed),
+            using=using,
+        )
+    elif previous_is_completed != is_completed:
+        propagate_subtask_delta(
+            task_id,
+            total_delta=0,
+            open_delta=int(previous_is_completed) - int(is_completed),
+            completed=int(is_completed),
+            using=using,
+        )
 
-    if not result:
-        task.is_completed = True
-        task.completed_at = timezone.localtime(timezone.now())
-        task.save()
+    # 팀이 바뀌기 전의 팀과 옮기기 전의 업무도 함께 무효화한다.
+    invalidate_task_caches(
+        task_ids=[instance.task_id, previous_task_id],
+        subtask_ids=[instance.pk],
+        teams=[instance.team, getattr(instance, "_loaded_team", None)],
+        using=using,
+    )
+
+    instance.remember_loaded_state()
+    instance._loaded_team = instance.team
+
+
+@receiver(post_delete, sender=SubTask)
+def detect_subtask_deletion(
+    sender,
+    instance: SubTask,
+    using: str,
+    origin=None,
+    **kwargs,
+):
+    """하위 업무가 삭제되면 상위 업무의 하위 업무 수를 갱신하고 목록 응답 cache 를 무효화한다.
+    상위 업무가 함께 삭제되는 경우에는 하위 업무 수를 갱신하지 않는다.
+
+    변화량은 삭제 전에 잠그고 조회한 DB 의 상태로 계산한다.
+    마지막 미완료 하위 업무를 삭제해도 상위 업무는 완료 처리하지 않는다.
+    """
+    task_id, is_completed = getattr(instance, "_loaded_state", (None, None))
+
+    deleted_with_task = isinstance(origin, Task) or (
+        isinstance(origin, QuerySet) and origin.model is Task
+    )
+
+    if not deleted_with_task and (task_id is None or is_completed is None):
+        # 삭제 시점의 상태를 모르는 경우 DB의 하위 업무로 다시 집계한다.
+        propagate_subtask_refresh(instance.task_id, using=using, complete=False)
+    elif not deleted_with_task:
+        propagate_subtask_delta(
+            task_id,
+            total_delta=-1,
+            open_delta=-int(not is_completed),
+            using=using,
+        )
+
+    # 삭제된 하위 업무의 팀은 조회로 알 수 없으므로 직접 전달한다.
+    invalidate_task_caches(
+        task_ids=[instance.task_id, task_id],
+        subtask_ids=[instance.pk],
+        teams=[instance.team],
+        using=using,
+    )
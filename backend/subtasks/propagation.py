@@ -0,0 +1,142 @@
+from collections import defaultdict
+from typing import Dict, List
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from common.transactions import get_commit_pending
+from subtasks.triggers import is_trigger_engine
+from tasks.models import Task
+
+
+class PendingPropagation:
+    """하나의 transaction 동안 하위 업무 변경으로 영향을 받은 업무들을 모아 둔다."""
+
+    def __init__(self):
+        self.deltas: Dict[int, List[int]] = defaultdict(lambda: [0, 0, 0])
+        # 다시 집계할 업무 pk 별 완료 처리 여부
+        self.refresh_task_ids: Dict[int, bool] = {}
+
+    def add_delta(
+        self,
+        task_id: int,
+        total_delta: int,
+        open_delta: int,
+        completed: int = 0,
+    ) -> None:
+        if task_id in self.refresh_task_ids:
+            if completed:
+                self.refresh_task_ids[task_id] = True
+            return
+        self.deltas[task_id][0] += total_delta
+        self.deltas[task_id][1] += open_delta
+        self.deltas[task_id][2] += completed
+
+    def add_refresh(self, task_id: int, complete: bool = True) -> None:
+        # 다시 집계하면 앞서 모아 둔 변화량도 반영되므로 변화량은 버린다.
+        delta = self.deltas.pop(task_id, None)
+        self.refresh_task_ids[task_id] = (
+            complete
+            or self.refresh_task_ids.get(task_id, False)
+            or bool(delta and delta[2])
+        )
+
+    def apply(self, using: str) -> None:
+        """모아 둔 업무들을 집계 방식별로 한 번의 UPDATE 문으로 반영한다."""
+        for complete in (True, False):
+            task_ids = [
+                task_id
+                for task_id, value in self.refresh_task_ids.items()
+                if value is complete
+            ]
+            if task_ids:
+                Task.objects.db_manager(using).refresh_subtask_counters(
+                    task_ids,
+                    complete=complete,
+                )
+        if self.deltas:
+            Task.objects.db_manager(using).apply_subtask_deltas(
+                {task_id: tuple(delta) for task_id, delta in self.deltas.items()},
+            )
+
+
+def get_pending_propagation(using: str) -> PendingPropagation:
+    """현재 transaction 의 PendingPropagation 을 반환한다. commit 시점에 한 번에 반영된다."""
+    return get_commit_pending("subtask_propagation", using, PendingPropagation)
+
+
+def propagate_subtask_delta(
+    task_id: int,
+    total_delta: int,
+    open_delta: int,
+    completed: int = 0,
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """하위 업무 수 변화량을 상위 업무에 반영한다.
+    완료 처리된 하위 업무가 있는 경우(completed)에만 상위 업무를 완료 처리할 수 있다.
+    transaction 안에서는 commit 시점까지 업무별로 모았다가 한 번에 반영한다.
+    DB trigger 가 반영하는 경우에는 아무것도 하지 않는다.
+    """
+    if (not total_delta and not open_delta) or is_trigger_engine():
+        return
+
+    if not transaction.get_connection(using).in_atomic_block:
+        Task.objects.db_manager(using).apply_subtask_deltas(
+            {task_id: (total_delta, open_delta, completed)},
+        )
+        return
+
+    get_pending_propagation(using).add_delta(
+        task_id,
+        total_delta,
+        open_delta,
+        completed,
+    )
+
+
+def propagate_subtask_refresh(
+    task_id: int,
+    using: str = DEFAULT_DB_ALIAS,
+    complete: bool = True,
+) -> None:
+    """상위 업무의 하위 업무 수를 DB 의 하위 업무로 다시 집계한다.
+    complete 가 False 이면 완료 처리하지 않는다. (하위 업무 삭제)
+    transaction 안에서는 commit 시점에 한 번에 반영한다.
+    DB trigger 가 반영하는 경우에는 아무것도 하지 않는다.
+    """
+    if is_trigger_engine():
+        return
+
+    if not transaction.get_connection(using).in_atomic_block:
+        Task.objects.db_manager(using).refresh_subtask_counters(
+            [task_id],
+            complete=complete,
+        )
+        return
+
+    get_pending_propagation(using).add_refresh(task_id, complete)
+
+
+def propagate_subtask_completion(
+    subtask_id: int, using: str = DEFAULT_DB_ALIAS
+) -> None:
+    """완료 처리된 하위 업무 하나를 상위 업무에 반영한다.
+    transaction 밖에서는 상위 업무의 pk 조회 없이 하나의 UPDATE 문으로 바로 반영한다.
+    transaction 안에서는 앞서 모아 둔 변화량과 함께 반영되도록 상위 업무를 조회해 모은다.
+    DB trigger 가 반영하는 경우에는 아무것도 하지 않는다.
+    """
+    if is_trigger_engine():
+        return
+
+    if not transaction.get_connection(using).in_atomic_block:
+        Task.objects.db_manager(using).apply_subtask_completion(subtask_id)
+        return
+
+    task_id = (
+        Task.objects.db_manager(using)
+        .filter(subtasks=subtask_id)
+        .values_list("pk", flat=True)
+        .first()
+    )
+
+    if task_id is not None:
+        get_pending_propagation(using).add_delta(task_id, 0, -1, 1)
@@ -1,10 +1,13 @@
 from rest_framework import serializers
 
+from common.serializers import CompiledListSerializer
+
 from subtasks.models import SubTask
 
 
 class SubtaskSerializer(serializers.ModelSerializer):
     class Meta:
+        list_serializer_class = CompiledListSerializer
         model = SubTask
         fields = [
             "id",
@@ -12,3 +15,16 @@ class SubtaskSerializer(serializers.ModelSerializer):
             "is_completed",
             "completed_at",
         ]
+
+
+# 한 번에 생성하거나 완료 처리할 수 있는 하위 업무의 최대 개수
+SUBTASK_BULK_CREATE_MAX_LENGTH = 100
+SUBTASK_BULK_COMPLETION_MAX_LENGTH = 100
+
+
+class SubtaskBulkCompletionSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=SUBTASK_BULK_COMPLETION_MAX_LENGTH,
+    )
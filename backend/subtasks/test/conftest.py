@@ -1,3 +1,4 @@
+from django.db import connection
 import pytest
 
 # flake8: noqa
@@ -18,6 +19,12 @@ from subtasks.serializers import SubtaskSerializer
 from common.models import Base
 from tasks.models import Task
 from subtasks.models import SubTask
+from subtasks.triggers import (
+    SIGNAL_ENGINE,
+    TRIGGER_ENGINE,
+    drop_completion_triggers,
+    install_completion_triggers,
+)
 
 
 @pytest.fixture(scope="function")
@@ -100,3 +107,22 @@ def fake_subtasks(
                 task=fake_another_task,  # CHELLO team
                 **serializer.data,
             )
+
+
+@pytest.fixture(scope="function", params=[SIGNAL_ENGINE, TRIGGER_ENGINE])
+def completion_engine(request, settings, transactional_db) -> str:
+    """업무 자동 완료 처리 방식별로 테스트를 실행한다.
+        trigger 방식은 테스트 DB에 trigger 를 설치하고, 테스트가 끝나면 제거한다.
+        테스트 데이터를 만드는 fixture 보다 먼저 요청해야 한다.
+
+    Returns:
+        str: 현재 테스트의 SUBTASK_COMPLETION_ENGINE 값
+    """
+    settings.SUBTASK_COMPLETION_ENGINE = request.param
+
+    if request.param == TRIGGER_ENGINE:
+        install_completion_triggers(connection)
+        yield request.param
+        drop_completion_triggers(connection)
+    else:
+        yield request.param
@@ -2,6 +2,7 @@ from rest_framework.test import APIClient
 from rest_framework import status
 from django.utils import timezone
 from django.urls import reverse
+from django.db import connection
 import pytest
 
 from common.models import Base
@@ -9,6 +10,34 @@ from tasks.models import Task
 from subtasks.models import SubTask
 
 
+@pytest.mark.django_db
+@pytest.mark.get_a_subtask
+def test_get_subtask_loads_object_once(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_subtask: SubTask,
+    django_assert_num_queries,
+):
+    url = reverse("subtask", args=[fake_subtask.id])
+
+    # 인증 유저 조회와 하위 업무 조회만 실행된다.
+    with django_assert_num_queries(2):
+        response = client.get(url, headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    # 수정은 한 번 조회한 객체를 그대로 UPDATE 하며, 인증 유저는 cache 에서 조회한다.
+    with django_assert_num_queries(2):
+        response = client.patch(
+            url,
+            {"team": Base.TeamChoices.DANBIE},
+            headers=fake_authorization_header,
+            content_type="application/json",
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+
+
 @pytest.mark.django_db
 @pytest.mark.get_a_subtask
 def test_get_subtask_if_success(
@@ -35,6 +64,41 @@ def test_get_subtask_if_success(
     assert response.data["completed_at"] is None
 
 
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.get_a_subtask
+def test_get_subtask_if_not_modified(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_subtask: SubTask,
+):
+    url = reverse("subtask", args=[fake_subtask.id])
+
+    response = client.get(url, headers=fake_authorization_header)
+    etag = response["ETag"]
+
+    response = client.get(
+        url,
+        headers={**fake_authorization_header, "If-None-Match": etag},
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # 완료 처리된 하위 업무는 modified_at 이 바뀌어 ETag 도 바뀐다.
+    client.patch(
+        reverse("subtask_completion", args=[fake_subtask.id]),
+        headers=fake_authorization_header,
+    )
+
+    response = client.get(
+        url,
+        headers={**fake_authorization_header, "If-None-Match": etag},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["is_completed"] is True
+    assert response["ETag"] != etag
+
+
 @pytest.mark.django_db
 @pytest.mark.get_a_subtask
 def test_get_subtask_if_not_exist_task(
@@ -81,6 +145,63 @@ def test_get_subtasks_if_success(
         assert len(response.data["results"]) == 10
 
 
+@pytest.mark.django_db
+@pytest.mark.get_subtasks
+def test_get_subtasks_by_cursor_if_success(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_subtasks: None,
+    django_assert_num_queries,
+):
+    url = f"{reverse('subtask_list')}?pagination=cursor"
+
+    subtask_ids = []
+    pages = []
+
+    while url is not None:
+        # 하위 업무 조회 (COUNT query 없음), 인증 유저는 첫 요청에서만 조회
+        with django_assert_num_queries(1 if pages else 2):
+            response = client.get(url, headers=fake_authorization_header)
+
+        assert response.status_code == status.HTTP_200_OK
+
+        assert "count" not in response.data
+        assert "previous" in response.data
+        assert "next" in response.data
+
+        pages.append(response.data)
+        subtask_ids += [subtask["id"] for subtask in response.data["results"]]
+        url = response.data["next"]
+
+    # fake_subtasks fixture에서 생성한 subtask 총 수 30개, REST FRAMEWORK PAGE SIZE: 10
+    assert [len(page["results"]) for page in pages] == [10, 10, 10]
+    assert pages[0]["previous"] is None
+
+    # 생성 날짜 기준 내림차순으로 중복 없이 조회
+    assert subtask_ids == sorted(subtask_ids, reverse=True)
+    assert len(set(subtask_ids)) == 30
+
+    # previous 링크로 직전 페이지를 다시 조회
+    response = client.get(pages[-1]["previous"], headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"] == pages[-2]["results"]
+
+
+@pytest.mark.django_db
+@pytest.mark.get_subtasks
+def test_get_subtasks_by_cursor_if_invalid_cursor(
+    client: APIClient(),
+    fake_authorization_header: dict,
+):
+    url = reverse("subtask_list")
+
+    response = client.get(f"{url}?cursor=invalid", headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.data["detail"] == "Invalid cursor"
+
+
 @pytest.mark.django_db
 @pytest.mark.create_a_subtask
 def test_create_subtask_if_success(
@@ -135,6 +256,129 @@ def test_create_subtask_if_not_found_task(
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.create_subtasks
+def test_create_subtasks_if_success(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    django_assert_max_num_queries,
+):
+    teams = [team for team, _ in Base.TeamChoices.choices] * 3
+    data_to_be_created = [{"team": team} for team in teams]
+
+    url = reverse("subtask_bulk_create", args=[fake_task.id])
+
+    # 하위 업무 수와 상관없이 업무 조회, INSERT, 업무 갱신과 transaction 처리만 실행된다.
+    with django_assert_max_num_queries(8):
+        response = client.post(
+            url,
+            data_to_be_created,
+            headers=fake_authorization_header,
+            content_type="application/json",
+        )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    assert len(response.data) == len(teams)
+    assert [subtask["team"] for subtask in response.data] == teams
+    assert all(subtask["id"] is not None for subtask in response.data)
+    assert SubTask.objects.filter(task=fake_task).count() == len(teams)
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_total == len(teams)
+    assert refreshed_task.subtask_open == len(teams)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.create_subtasks
+def test_create_subtasks_without_returning_rows(
+    fake_task: Task,
+    fake_subtask: SubTask,
+    monkeypatch,
+    django_assert_num_queries,
+):
+    # MySQL 처럼 INSERT 문에서 생성된 pk 를 돌려받을 수 없는 DB
+    monkeypatch.setattr(
+        type(connection.features),
+        "can_return_rows_from_bulk_insert",
+        False,
+    )
+
+    teams = [team for team, _ in Base.TeamChoices.choices] * 3
+
+    # 하위 업무 수와 상관없이 업무 잠금, 마지막 pk 조회, INSERT, pk 조회,
+    # 업무 갱신, 목록 cache 를 무효화할 팀 조회와 transaction 처리만 실행된다.
+    with django_assert_num_queries(8):
+        subtasks = SubTask.objects.bulk_create_for_task(
+            fake_task,
+            [{"team": team} for team in teams],
+        )
+
+    created_subtasks = SubTask.objects.filter(task=fake_task).exclude(
+        id=fake_subtask.id,
+    )
+
+    assert [subtask.id for subtask in subtasks] == [
+        subtask.id for subtask in created_subtasks.order_by("id")
+    ]
+    assert [subtask.team for subtask in subtasks] == teams
+    assert all(subtask._state.adding is False for subtask in subtasks)
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_total == len(teams) + 1
+    assert refreshed_task.subtask_open == len(teams) + 1
+
+
+@pytest.mark.django_db
+@pytest.mark.create_subtasks
+def test_create_subtasks_if_invalid(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+):
+    url = reverse("subtask_bulk_create", args=[fake_task.id])
+
+    # 하나라도 올바르지 않으면 아무것도 생성하지 않는다.
+    response = client.post(
+        url,
+        [{"team": Base.TeamChoices.DANBIE}, {"team": "unknown"}],
+        headers=fake_authorization_header,
+        content_type="application/json",
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert SubTask.objects.exists() is False
+
+    response = client.post(
+        url,
+        [],
+        headers=fake_authorization_header,
+        content_type="application/json",
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+@pytest.mark.create_subtasks
+def test_create_subtasks_if_not_found_task(
+    client: APIClient(),
+    fake_authorization_header: dict,
+):
+    not_existed_task_id = 1
+
+    url = reverse("subtask_bulk_create", args=[not_existed_task_id])
+
+    response = client.post(
+        url,
+        [{"team": Base.TeamChoices.DANBIE}],
+        headers=fake_authorization_header,
+        content_type="application/json",
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.django_db
 @pytest.mark.update_a_subtask
 def test_update_subtask_if_success(
@@ -360,6 +604,35 @@ def test_mark_as_completion_if_success(
     assert refreshed_task.is_completed is True
 
 
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.mark_as_completion
+def test_mark_as_completion_is_single_update(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    fake_subtask: SubTask,
+    django_assert_num_queries,
+):
+    url = reverse("subtask_completion", args=[fake_subtask.id])
+
+    # 인증 유저 조회, 완료 처리 UPDATE, 상위 업무 갱신, 목록 cache 를 무효화할 팀 조회만 실행된다.
+    with django_assert_num_queries(4):
+        response = client.patch(url, headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_open == 0
+    assert refreshed_task.is_completed is True
+
+    # 이미 완료된 하위 업무를 다시 요청해도 성공으로 응답하고 상위 업무는 바뀌지 않는다.
+    response = client.patch(url, headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert Task.objects.get(id=fake_task.id).subtask_open == 0
+
+
 @pytest.mark.django_db
 @pytest.mark.mark_as_completion
 def test_mark_as_completion_if_not_exist_task(
@@ -479,3 +752,82 @@ def test_delete_subtask_if_completed_subtask(
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.data["detail"] == "이미 완료된 하위업무이기 때문에 삭제할 수 없습니다."
     assert response.data["detail"].code == "COMPLETED_SUBTASK_ERROR"
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.mark_as_completion
+def test_bulk_mark_as_completion(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    fake_subtasks: None,
+    fake_another_subtask: SubTask,
+    django_assert_max_num_queries,
+):
+    subtask_ids = list(
+        SubTask.objects.filter(task=fake_task, team=Base.TeamChoices.DANBIE)
+        .order_by("id")
+        .values_list("id", flat=True),
+    )
+    already_completed_id = subtask_ids.pop()
+    already_completed_subtask = SubTask.objects.get(id=already_completed_id)
+    already_completed_subtask.is_completed = True
+    already_completed_subtask.save()
+    not_exist_subtask_id = 10000
+
+    url = reverse("subtask_bulk_completion")
+
+    # 하위 업무 수와 상관없이 잠금 조회, 완료 처리 UPDATE, 업무 갱신과 transaction 처리만 실행된다.
+    with django_assert_max_num_queries(8):
+        response = client.patch(
+            url,
+            {
+                "ids": [
+                    *subtask_ids,
+                    already_completed_id,
+                    fake_another_subtask.id,
+                    not_exist_subtask_id,
+                ],
+            },
+            headers=fake_authorization_header,
+            content_type="application/json",
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    outcomes = {result["id"]: result["outcome"] for result in response.data["results"]}
+
+    assert all(outcomes[id] == "completed" for id in subtask_ids)
+    assert outcomes[already_completed_id] == "already_completed"
+    assert outcomes[fake_another_subtask.id] == "forbidden"
+    assert outcomes[not_exist_subtask_id] == "not_found"
+
+    assert (
+        SubTask.objects.filter(id__in=subtask_ids, is_completed=False).exists() is False
+    )
+    assert SubTask.objects.get(id=fake_another_subtask.id).is_completed is False
+
+    # 다른 팀의 하위 업무 1개만 미완료로 남는다.
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_total == 16
+    assert refreshed_task.subtask_open == 1
+    assert refreshed_task.is_completed is False
+
+
+@pytest.mark.django_db
+@pytest.mark.mark_as_completion
+def test_bulk_mark_as_completion_if_invalid(
+    client: APIClient(),
+    fake_authorization_header: dict,
+):
+    url = reverse("subtask_bulk_completion")
+
+    response = client.patch(
+        url,
+        {"ids": []},
+        headers=fake_authorization_header,
+        content_type="application/json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,33 @@
+import pytest
+
+from common.models import Base
+from common.pagination import KeysetPagination
+from subtasks.models import SubTask
+from tasks.test.test_query_plan import assert_uses_index
+
+
+@pytest.mark.django_db
+@pytest.mark.query_plan
+def test_subtask_list_query_uses_index(fake_subtask: SubTask):
+    queryset = SubTask.objects.filter(team=Base.TeamChoices.DANBIE).order_by(
+        "-created_at",
+        "-id",
+    )
+
+    assert_uses_index(queryset)
+
+    # keyset 방식의 다음 페이지 조회
+    keyset_filter = KeysetPagination().build_keyset_filter(
+        [fake_subtask.created_at, fake_subtask.id],
+        KeysetPagination.ordering,
+    )
+
+    assert_uses_index(queryset.filter(keyset_filter))
+
+
+@pytest.mark.django_db
+@pytest.mark.query_plan
+def test_completion_signal_query_uses_index(fake_subtask: SubTask):
+    queryset = SubTask.objects.filter(task=fake_subtask.task, is_completed=False)
+
+    assert_uses_index(queryset)
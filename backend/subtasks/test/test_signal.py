@@ -1,11 +1,19 @@
+from django.test.utils import CaptureQueriesContext
+from django.db import connection, transaction
 from django.utils import timezone
 import pytest
 
+from common.models import Base
 from tasks.models import Task
 from subtasks.models import SubTask
+from subtasks.triggers import SIGNAL_ENGINE
 
+# 업무 자동 완료 처리 방식(signal, trigger)과 상관없이 같은 결과가 나와야 하므로 모든 테스트를 두 방식으로 실행한다.
+# signal 방식의 구현(변화량을 모아 반영하는 방식, query 수)을 확인하는 테스트만 signal 방식으로 실행한다.
+pytestmark = pytest.mark.usefixtures("completion_engine")
 
-@pytest.mark.django_db
+
+@pytest.mark.django_db(transaction=True)
 def test_signal_on_task_completion(
     fake_task: Task,
     fake_subtasks: None,
@@ -13,9 +21,8 @@ def test_signal_on_task_completion(
     assert fake_task.is_completed is False
     assert fake_task.completed_at is None
 
-    for id in range(1, 31):
-        selected_subtask = SubTask.objects.filter(id=id).last()
-
+    # 매개변수별로 테스트가 반복되면 pk 가 1부터 시작하지 않으므로 조회한 순서대로 완료 처리한다.
+    for selected_subtask in SubTask.objects.all():
         selected_subtask.is_completed = True
         selected_subtask.completed_at = timezone.localtime(timezone.now())
         selected_subtask.save()
@@ -24,3 +31,313 @@ def test_signal_on_task_completion(
 
     assert refreshed_task.is_completed is True
     assert refreshed_task.completed_at is not None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_signal_on_subtask_counters(
+    fake_task: Task,
+    fake_subtask: SubTask,
+    fake_another_subtask: SubTask,
+):
+    refreshed_task = Task.objects.filter(id=fake_task.id).last()
+
+    assert refreshed_task.subtask_total == 2
+    assert refreshed_task.subtask_open == 2
+
+    fake_subtask.is_completed = True
+    fake_subtask.completed_at = timezone.localtime(timezone.now())
+    fake_subtask.save()
+
+    refreshed_task = Task.objects.filter(id=fake_task.id).last()
+
+    assert refreshed_task.subtask_total == 2
+    assert refreshed_task.subtask_open == 1
+    assert refreshed_task.is_completed is False
+
+    # 마지막 미완료 하위 업무를 삭제해도 업무는 완료 처리하지 않는다.
+    fake_another_subtask.delete()
+
+    refreshed_task = Task.objects.filter(id=fake_task.id).last()
+
+    assert refreshed_task.subtask_total == 1
+    assert refreshed_task.subtask_open == 0
+    assert refreshed_task.is_completed is False
+    assert refreshed_task.completed_at is None
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("completion_engine", [SIGNAL_ENGINE], indirect=True)
+def test_signal_query_count_is_constant(
+    fake_task: Task,
+    fake_subtasks: None,
+    django_assert_num_queries,
+):
+    selected_subtask = SubTask.objects.filter(task=fake_task).last()
+
+    # 완료 유무가 바뀌지 않으면 하위 업무 저장과 목록 cache 를 무효화할 팀 조회만 실행한다.
+    with django_assert_num_queries(2):
+        selected_subtask.save()
+
+    # 완료 유무가 바뀌면 하위 업무를 잠그고 조회하여 저장하는 transaction 과
+    # 하위 업무 수와 상관없이 업무의 하위 업무 수 갱신만 추가로 실행된다.
+    selected_subtask.is_completed = True
+
+    with django_assert_num_queries(6):
+        selected_subtask.save()
+
+    refreshed_task = Task.objects.filter(id=fake_task.id).last()
+
+    assert refreshed_task.subtask_total == 15
+    assert refreshed_task.subtask_open == 14
+
+
+@pytest.mark.django_db(transaction=True)
+def test_task_save_does_not_overwrite_subtask_counters(
+    fake_task: Task,
+    fake_subtask: SubTask,
+):
+    # 하위 업무가 완료되기 전에 조회한 업무
+    stale_task = Task.objects.filter(id=fake_task.id).last()
+
+    fake_subtask.is_completed = True
+    fake_subtask.save()
+
+    stale_task.title = "updated title"
+    stale_task.save()
+
+    refreshed_task = Task.objects.filter(id=fake_task.id).last()
+
+    assert refreshed_task.title == "updated title"
+    assert refreshed_task.subtask_total == 1
+    assert refreshed_task.subtask_open == 0
+    assert refreshed_task.is_completed is True
+
+
+@pytest.mark.django_db(transaction=True)
+def test_signal_uses_current_state_of_stale_subtasks(
+    fake_task: Task,
+    fake_subtask: SubTask,
+    fake_another_subtask: SubTask,
+):
+    # 두 요청이 같은 미완료 하위 업무를 동시에 조회한 경우
+    first = SubTask.objects.get(id=fake_subtask.id)
+    second = SubTask.objects.get(id=fake_subtask.id)
+
+    first.is_completed = True
+    first.save()
+
+    second.is_completed = True
+    second.save()
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_total == 2
+    assert refreshed_task.subtask_open == 1
+    assert refreshed_task.is_completed is False
+
+    # 완료되기 전에 조회한 하위 업무를 삭제해도 완료된 하위 업무로 계산한다.
+    fake_subtask.delete()
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_total == 1
+    assert refreshed_task.subtask_open == 1
+
+    # 완료 유무를 저장하지 않는 update_fields 는 하위 업무 수를 바꾸지 않는다.
+    fake_another_subtask.is_completed = True
+    fake_another_subtask.save(update_fields=["team"])
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_open == 1
+    assert refreshed_task.is_completed is False
+
+    # 완료 유무를 바꾸지 않은 저장은 다른 요청이 완료 처리한 값을 덮어쓰지 않는다.
+    stale = SubTask.objects.get(id=fake_another_subtask.id)
+    SubTask.objects.mark_as_completion(stale.id, stale.team)
+
+    stale.team = Base.TeamChoices.DARAE
+    stale.save()
+
+    refreshed_subtask = SubTask.objects.get(id=stale.id)
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_subtask.team == Base.TeamChoices.DARAE
+    assert refreshed_subtask.is_completed is True
+    assert refreshed_subtask.completed_at is not None
+    assert refreshed_task.subtask_open == 0
+    assert refreshed_task.is_completed is True
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("completion_engine", [SIGNAL_ENGINE], indirect=True)
+def test_refresh_subtask_counters(
+    fake_task: Task,
+    fake_subtasks: None,
+):
+    # signal이 실행되지 않는 update()로 하위 업무를 모두 완료 처리
+    SubTask.objects.filter(task=fake_task).update(is_completed=True)
+
+    refreshed_task = Task.objects.filter(id=fake_task.id).last()
+
+    assert refreshed_task.subtask_open == 15
+    assert refreshed_task.is_completed is False
+
+    Task.objects.refresh_subtask_counters([fake_task.id])
+
+    refreshed_task = Task.objects.filter(id=fake_task.id).last()
+
+    assert refreshed_task.subtask_total == 15
+    assert refreshed_task.subtask_open == 0
+    assert refreshed_task.is_completed is True
+    assert refreshed_task.completed_at is not None
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("completion_engine", [SIGNAL_ENGINE], indirect=True)
+def test_signal_is_coalesced_per_transaction(
+    fake_task: Task,
+    fake_another_task: Task,
+    fake_subtasks: None,
+):
+    subtasks = list(SubTask.objects.all())
+
+    with CaptureQueriesContext(connection) as captured:
+        with transaction.atomic():
+            for subtask in subtasks:
+                subtask.is_completed = True
+                subtask.completed_at = timezone.localtime(timezone.now())
+                subtask.save()
+
+            # commit 전에는 업무에 반영되지 않는다.
+            assert Task.objects.filter(subtask_open=0).exists() is False
+
+    task_updates = [
+        query
+        for query in captured.captured_queries
+        if query["sql"].startswith('UPDATE "tasks"')
+    ]
+
+    # 30개의 하위 업무가 두 업무에 나뉘어 있어도 commit 시점에 한 번만 갱신한다.
+    assert len(task_updates) == 1
+
+    for task in Task.objects.filter(id__in=[fake_task.id, fake_another_task.id]):
+        assert task.subtask_total == 15
+        assert task.subtask_open == 0
+        assert task.is_completed is True
+        assert task.completed_at is not None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_signal_is_discarded_on_rollback(
+    fake_task: Task,
+    fake_subtask: SubTask,
+):
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            fake_subtask.is_completed = True
+            fake_subtask.save()
+            raise RuntimeError
+
+    refreshed_task = Task.objects.filter(id=fake_task.id).last()
+
+    assert refreshed_task.subtask_total == 1
+    assert refreshed_task.subtask_open == 1
+    assert refreshed_task.is_completed is False
+
+
+@pytest.mark.django_db(transaction=True)
+def test_signal_after_rollback_with_other_on_commit(
+    fake_task: Task,
+    fake_subtask: SubTask,
+    fake_another_subtask: SubTask,
+):
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            fake_subtask.is_completed = True
+            fake_subtask.save()
+            raise RuntimeError
+
+    # rollback 된 transaction 에서 모은 값은 다음 transaction 에서 사용하지 않는다.
+    with transaction.atomic():
+        transaction.on_commit(lambda: None)
+
+        subtask = SubTask.objects.get(id=fake_another_subtask.id)
+        subtask.is_completed = True
+        subtask.save()
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_total == 2
+    assert refreshed_task.subtask_open == 1
+    assert refreshed_task.is_completed is False
+
+
+@pytest.mark.django_db(transaction=True)
+def test_subtask_counters_on_reassign(
+    fake_task: Task,
+    fake_another_task: Task,
+    fake_subtask: SubTask,
+    fake_another_subtask: SubTask,
+):
+    fake_subtask.is_completed = True
+    fake_subtask.save()
+
+    # 마지막 미완료 하위 업무를 다른 업무로 옮겨도 기존 업무는 완료 처리하지 않는다.
+    fake_another_subtask.task = fake_another_task
+    fake_another_subtask.save()
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+    refreshed_another_task = Task.objects.get(id=fake_another_task.id)
+
+    assert refreshed_task.subtask_total == 1
+    assert refreshed_task.subtask_open == 0
+    assert refreshed_task.is_completed is False
+    assert refreshed_another_task.subtask_total == 1
+    assert refreshed_another_task.subtask_open == 1
+    assert refreshed_another_task.is_completed is False
+
+    # 옮긴 하위 업무를 완료하면 옮긴 업무가 완료 처리된다.
+    fake_another_subtask.is_completed = True
+    fake_another_subtask.save()
+
+    refreshed_another_task = Task.objects.get(id=fake_another_task.id)
+
+    assert refreshed_another_task.subtask_open == 0
+    assert refreshed_another_task.is_completed is True
+
+
+@pytest.mark.django_db(transaction=True)
+def test_subtask_counters_on_bulk_paths(
+    fake_task: Task,
+):
+    subtasks = SubTask.objects.bulk_create_for_task(
+        fake_task,
+        [{"team": Base.TeamChoices.DANBIE} for _ in range(3)]
+        + [{"team": Base.TeamChoices.DARAE, "is_completed": True}],
+    )
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_total == 4
+    assert refreshed_task.subtask_open == 3
+    assert refreshed_task.is_completed is False
+
+    SubTask.objects.complete_for_team(
+        [subtask.id for subtask in subtasks[:2]],
+        Base.TeamChoices.DANBIE,
+    )
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_open == 1
+    assert refreshed_task.is_completed is False
+
+    # QuerySet 으로 마지막 미완료 하위 업무를 삭제해도 완료 처리하지 않는다.
+    SubTask.objects.filter(id=subtasks[2].id).delete()
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_total == 3
+    assert refreshed_task.subtask_open == 0
+    assert refreshed_task.is_completed is False
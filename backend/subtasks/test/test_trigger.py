@@ -0,0 +1,81 @@
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+import pytest
+
+from tasks.models import Task
+from subtasks.models import SubTask
+from subtasks.triggers import TRIGGER_ENGINE
+
+
+@pytest.mark.parametrize("completion_engine", [TRIGGER_ENGINE], indirect=True)
+def test_trigger_keeps_counters_on_queryset_update(
+    completion_engine: str,
+    fake_task: Task,
+    fake_another_task: Task,
+    fake_subtasks: None,
+):
+    # signal 이 실행되지 않는 update() 도 trigger 가 업무에 반영한다.
+    SubTask.objects.filter(task=fake_task).update(is_completed=True)
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_total == 15
+    assert refreshed_task.subtask_open == 0
+    assert refreshed_task.is_completed is True
+    assert refreshed_task.completed_at is not None
+
+    # bulk_update 로 다른 업무의 하위 업무를 옮기는 경우
+    subtasks = list(SubTask.objects.filter(task=fake_another_task)[:5])
+    for subtask in subtasks:
+        subtask.task = fake_task
+    SubTask.objects.bulk_update(subtasks, ["task"])
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+    refreshed_another_task = Task.objects.get(id=fake_another_task.id)
+
+    assert refreshed_task.subtask_total == 20
+    assert refreshed_task.subtask_open == 5
+    assert refreshed_another_task.subtask_total == 10
+    assert refreshed_another_task.subtask_open == 10
+
+    # raw SQL 로 남은 하위 업무를 삭제하는 경우
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM subtasks WHERE task_id = %s",
+            [fake_another_task.id],
+        )
+
+    refreshed_another_task = Task.objects.get(id=fake_another_task.id)
+
+    assert refreshed_another_task.subtask_total == 0
+    assert refreshed_another_task.subtask_open == 0
+    assert refreshed_another_task.is_completed is False
+
+
+@pytest.mark.parametrize("completion_engine", [TRIGGER_ENGINE], indirect=True)
+def test_trigger_does_not_query_tasks_from_python(
+    completion_engine: str,
+    fake_task: Task,
+    fake_subtasks: None,
+):
+    subtasks = list(SubTask.objects.filter(task=fake_task))
+
+    with CaptureQueriesContext(connection) as captured:
+        for subtask in subtasks:
+            subtask.is_completed = True
+            subtask.save()
+
+    # 목록 cache 를 무효화할 팀 조회를 제외하면 하위 업무 저장마다 UPDATE "subtasks" 한 번만 실행된다.
+    queries = [
+        query["sql"]
+        for query in captured.captured_queries
+        if not query["sql"].startswith("SELECT")
+    ]
+
+    assert len(queries) == len(subtasks)
+    assert all(query.startswith('UPDATE "subtasks"') for query in queries)
+
+    refreshed_task = Task.objects.get(id=fake_task.id)
+
+    assert refreshed_task.subtask_open == 0
+    assert refreshed_task.is_completed is True
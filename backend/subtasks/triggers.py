@@ -0,0 +1,146 @@
+from django.conf import settings
+from django.db import NotSupportedError
+
+SIGNAL_ENGINE = "signal"
+TRIGGER_ENGINE = "trigger"
+
+TRIGGER_NAMES = (
+    "subtasks_completion_insert",
+    "subtasks_completion_update",
+    "subtasks_completion_move",
+    "subtasks_completion_delete",
+)
+
+# vendor 별 현재 시각(UTC)
+NOW = {
+    "sqlite": "strftime('%Y-%m-%d %H:%M:%f', 'now')",
+    "mysql": "UTC_TIMESTAMP(6)",
+}
+
+
+def is_trigger_engine() -> bool:
+    """업무 자동 완료 처리를 DB trigger 가 담당하는지 여부"""
+    return settings.SUBTASK_COMPLETION_ENGINE == TRIGGER_ENGINE
+
+
+def build_counter_update(
+    vendor: str,
+    task_id: str,
+    total: str,
+    open: str,
+    can_complete: bool = False,
+) -> str:
+    """TaskManager.apply_subtask_deltas 와 같은 규칙으로 업무 한 건의 하위 업무 수를 갱신하는 SQL.
+    하위 업무의 완료 유무가 바뀌는 경우(can_complete)에만 업무를 완료 처리한다.
+    MySQL은 SET 절을 왼쪽부터 차례로 적용하므로 변경 전 값을 참조하는 완료 처리를 먼저 둔다.
+    """
+    if not can_complete:
+        return (
+            "UPDATE tasks SET "
+            f"subtask_total = subtask_total + ({total}), "
+            f"subtask_open = subtask_open + ({open}) "
+            f"WHERE id = {task_id}"
+        )
+
+    completes = (
+        f"NOT is_completed AND subtask_open + ({open}) = 0 "
+        f"AND subtask_total + ({total}) > 0"
+    )
+    now = NOW[vendor]
+
+    return (
+        "UPDATE tasks SET "
+        f"completed_at = CASE WHEN {completes} THEN {now} ELSE completed_at END, "
+        f"modified_at = CASE WHEN {completes} THEN {now} ELSE modified_at END, "
+        f"is_completed = CASE WHEN {completes} THEN 1 ELSE is_completed END, "
+        f"subtask_total = subtask_total + ({total}), "
+        f"subtask_open = subtask_open + ({open}) "
+        f"WHERE id = {task_id}"
+    )
+
+
+def build_trigger_sql(vendor: str) -> list:
+    if vendor not in NOW:
+        raise NotSupportedError(
+            f"Subtask completion triggers are not supported on {vendor}.",
+        )
+
+    insert = build_counter_update(
+        vendor,
+        "NEW.task_id",
+        "1",
+        "NOT NEW.is_completed",
+    )
+    update = build_counter_update(
+        vendor,
+        "NEW.task_id",
+        "0",
+        "(NOT NEW.is_completed) - (NOT OLD.is_completed)",
+        can_complete=True,
+    )
+    move_out = build_counter_update(
+        vendor,
+        "OLD.task_id",
+        "-1",
+        "-(NOT OLD.is_completed)",
+    )
+    move_in = build_counter_update(
+        vendor,
+        "NEW.task_id",
+        "1",
+        "NOT NEW.is_completed",
+    )
+    delete = build_counter_update(
+        vendor,
+        "OLD.task_id",
+        "-1",
+        "-(NOT OLD.is_completed)",
+    )
+
+    if vendor == "sqlite":
+        return [
+            "CREATE TRIGGER subtasks_completion_insert AFTER INSERT ON subtasks "
+            f"FOR EACH ROW BEGIN {insert}; END",
+            "CREATE TRIGGER subtasks_completion_update "
+            "AFTER UPDATE OF is_completed ON subtasks FOR EACH ROW "
+            "WHEN OLD.task_id = NEW.task_id "
+            "AND OLD.is_completed <> NEW.is_completed "
+            f"BEGIN {update}; END",
+            "CREATE TRIGGER subtasks_completion_move "
+            "AFTER UPDATE OF task_id ON subtasks FOR EACH ROW "
+            "WHEN OLD.task_id <> NEW.task_id "
+            f"BEGIN {move_out}; {move_in}; END",
+            "CREATE TRIGGER subtasks_completion_delete AFTER DELETE ON subtasks "
+            f"FOR EACH ROW BEGIN {delete}; END",
+        ]
+
+    # MySQL은 trigger 에 WHEN 절이 없으므로 하나의 UPDATE trigger 안에서 분기한다.
+    return [
+        "CREATE TRIGGER subtasks_completion_insert AFTER INSERT ON subtasks "
+        f"FOR EACH ROW BEGIN {insert}; END",
+        "CREATE TRIGGER subtasks_completion_update AFTER UPDATE ON subtasks "
+        "FOR EACH ROW BEGIN "
+        "IF OLD.task_id = NEW.task_id "
+        f"AND OLD.is_completed <> NEW.is_completed THEN {update}; "
+        f"ELSEIF OLD.task_id <> NEW.task_id THEN {move_out}; {move_in}; "
+        "END IF; END",
+        "CREATE TRIGGER subtasks_completion_delete AFTER DELETE ON subtasks "
+        f"FOR EACH ROW BEGIN {delete}; END",
+    ]
+
+
+def install_completion_triggers(connection) -> None:
+    """하위 업무가 추가, 수정, 삭제될 때 상위 업무의 하위 업무 수와 완료 유무를 갱신하는 trigger 를 설치한다.
+    QuerySet.update(), bulk_update, raw SQL 로 하위 업무를 변경해도 업무가 함께 갱신된다.
+    """
+    drop_completion_triggers(connection)
+
+    with connection.cursor() as cursor:
+        for sql in build_trigger_sql(connection.vendor):
+            cursor.execute(sql)
+
+
+def drop_completion_triggers(connection) -> None:
+    with connection.cursor() as cursor:
+        for name in TRIGGER_NAMES:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
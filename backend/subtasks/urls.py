@@ -10,6 +10,16 @@ urlpatterns = [
         views.SubtaskCreateView.as_view(),
         name="subtask_create",
     ),
+    path(
+        "/tasks/<int:task_id>/subtasks/bulk",
+        views.SubtaskBulkCreateView.as_view(),
+        name="subtask_bulk_create",
+    ),
+    path(
+        "/subtasks/completion",
+        views.BulkMarkAsCompletionView.as_view(),
+        name="subtask_bulk_completion",
+    ),
     path("/subtasks/<int:pk>", views.SubtaskView.as_view(), name="subtask"),
     path(
         "/subtasks/<int:pk>/completion",
@@ -11,18 +11,33 @@ from rest_framework.generics import (
     CreateAPIView,
     ListAPIView,
 )
-from django.utils import timezone
 
+from common.conditional import ConditionalListMixin
+from common.negotiation import ColumnarMixin, MessagePackMixin
 from common.http_exceptions import CommonHttpException, CompletedSubtaskError
-from common.enums import MarkAsCompletion
+from common.pagination import CursorOptInPagination
 from common.permissions import IsAuthorized
+from common.response_cache import DetailCacheMixin, TeamListCacheMixin
+from common.sparse_fields import SparseFieldsMixin
 from tasks.models import Task
-from subtasks.serializers import SubtaskSerializer
+from subtasks.serializers import (
+    SubtaskSerializer,
+    SubtaskBulkCompletionSerializer,
+    SUBTASK_BULK_CREATE_MAX_LENGTH,
+)
 from subtasks.models import SubTask
 
 
-class SubTaskListView(ListAPIView):
+class SubTaskListView(
+    ColumnarMixin,
+    MessagePackMixin,
+    SparseFieldsMixin,
+    TeamListCacheMixin,
+    ConditionalListMixin,
+    ListAPIView,
+):
     serializer_class = SubtaskSerializer
+    pagination_class = CursorOptInPagination
     permission_classes = [IsAuthenticated]
 
     @extend_schema(
@@ -40,6 +55,21 @@ class SubTaskListView(ListAPIView):
         """로그인한 유저의 team에 해당되는 하위 업무들을 조회한다.
         Subtask의 모든 정보가 포함되어 전달된다.
         - id, team, is_completed, completed_at
+        응답은 팀별로 cache 되며, 팀과 관련된 업무나 하위 업무가 바뀌면 다시 조회한다.
+        응답의 ETag 를 If-None-Match 에 담아 요청하면 바뀌지 않은 경우 304 Not Modified 를 반환한다.
+
+        Args:
+
+            - page (int): 조회할 페이지 번호
+            - pagination (str): cursor 로 지정하면 count 없이 keyset 방식으로 조회
+            - cursor (str): keyset 방식 조회 시 next, previous 링크에 담겨 전달되는 값
+            - format (str): columnar 로 지정하면 results 를 필드별 값 목록으로 담아 전달
+            - fields (str): 응답에 담을 필드를 쉼표로 구분하여 지정. 지정하지 않으면 모든 필드를 전달
+
+        Raises:
+
+            - HTTPException (400 BAD REQUEST): fields 에 지정할 수 없는 필드가 있는 경우
+                - code: INVALID_FIELD_SELECTION_ERROR
 
         Returns:
 
@@ -54,15 +84,21 @@ class SubTaskListView(ListAPIView):
     def get_queryset(self) -> List[SubTask]:
         """
         Subtask에서 로그인한 유저의 팀에 해당하는 하위 업무들을 조회하여 생성 날짜를 기준으로 내림차순으로 반환
+        응답에 담는 필드와 ETag, cursor 에 필요한 column 만 조회한다.
         """
         return (
             SubTask.objects.filter(team=self.request.user.team)
-            .order_by("-created_at")
-            .all()
+            .order_by("-created_at", "-id")
+            .only(
+                "id",
+                "created_at",
+                "modified_at",
+                *self.get_selected_fields(("team", "is_completed", "completed_at")),
+            )
         )
 
 
-class SubtaskCreateView(CreateAPIView):
+class SubtaskCreateView(MessagePackMixin, CreateAPIView):
     serializer_class = SubtaskSerializer
     permission_classes = [IsAuthenticated]
     selected_task = None
@@ -116,37 +152,98 @@ class SubtaskCreateView(CreateAPIView):
         serializer.save(task=self.selected_task)
 
 
-class SubtaskView(RetrieveUpdateDestroyAPIView):
-    queryset = SubTask.objects.all()
+class SubtaskBulkCreateView(MessagePackMixin, APIView):
     serializer_class = SubtaskSerializer
-    permission_classes = [IsAuthenticated, IsAuthorized]
+    permission_classes = [IsAuthenticated]
 
-    def check_and_handle_not_found_error(
-        self,
-        request: Request,
-        pk: int,
-    ) -> SubTask:
-        """pk에 해당하는 Subtask가 존재하면 조회된 Subtask를 반환하고 없으면 에러를 발생시킨다.
+    @extend_schema(
+        tags=["Subtask"],
+        request=SubtaskSerializer(many=True),
+        responses=SubtaskSerializer(many=True),
+        summary="하위 업무 일괄 추가 - task 정보와 추가할 하위 업무 목록 필요",
+    )
+    def post(self, request: Request, task_id: int) -> Response:
+        """주어진 task 에 여러 팀의 하위 업무를 한 번에 추가한다.
+        모든 하위 업무를 함께 검증한 후 하나의 transaction 에서 생성하며, 하나라도 올바르지 않으면 생성하지 않는다.
 
         Args:
 
-            - request (Request): Request 정보
-            - pk (int): Subtask의 pk
+            - task_id (int): api path parameter로 전달
+
+            - request body (list): 추가할 하위 업무 목록 (최대 100개)
+                - team (str): 소속 팀
+                    - DANBIE: "단비"
+                    - DARAE: "다래"
+                    - BLABLA: "블라블라"
+                    - CHEOLLO: "철로"
+                    - DANGI: "땅이"
+                    - HAETAE: "해태"
+                    - SUPI: "수피"
+
+        Raises:
+
+            - HTTPException (400 BAD REQUEST): 목록이 비어 있거나 올바르지 않은 하위 업무가 있는 경우
+
+            - HTTPException (404 NOT FOUND): task_id에 해당되는 task를 못 찾을 경우
+                - code: TASK_NOT_FOUND_ERROR
+
+        Returns:
+
+            - Response (201 CREATED): 새로 생성된 Subtask 목록을 직렬화하여 전달
+        """
+        selected_task = Task.objects.filter(id=task_id).last()
+        if not selected_task:
+            raise CommonHttpException.TASK_NOT_FOUND_ERROR
+
+        serializer = self.serializer_class(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=SUBTASK_BULK_CREATE_MAX_LENGTH,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        subtasks = SubTask.objects.bulk_create_for_task(
+            selected_task,
+            serializer.validated_data,
+        )
+
+        return Response(
+            self.serializer_class(subtasks, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class SubtaskView(MessagePackMixin, DetailCacheMixin, RetrieveUpdateDestroyAPIView):
+    queryset = SubTask.objects.all()
+    # cache 된 응답은 하위 업무의 팀으로 권한을 확인한다.
+    detail_cache_fields = ("id", "team", "task_id", "modified_at")
+    serializer_class = SubtaskSerializer
+    permission_classes = [IsAuthenticated, IsAuthorized]
+
+    def get_object(self) -> SubTask:
+        """pk에 해당하는 하위 업무(Subtask)를 한 번만 조회하고 권한을 확인한다.
+        조회한 객체는 응답 직렬화와 권한 확인에 그대로 사용된다.
 
         Raises:
 
+            - HTTPException (403 FORBIDDEN): 권한이 없는 경우
+                - code: permission_denied
+
             - HTTPException (404 NOT FOUND): pk에 해당되는 subtask를 못 찾을 경우
                 - code: SUBTASK_NOT_FOUND_ERROR
 
         Returns:
 
-            - SubTask: 조회된 Subtask 정보 반환
+            - SubTask: 조회된 SubTask 정보 반환
         """
-        selected_subtask = SubTask.objects.filter(pk=pk).last()
-
-        if not selected_subtask:
+        try:
+            selected_subtask = self.get_queryset().get(pk=self.kwargs["pk"])
+        except SubTask.DoesNotExist:
             raise CommonHttpException.SUBTASK_NOT_FOUND_ERROR
 
+        self.check_object_permissions(self.request, selected_subtask)
+
         return selected_subtask
 
     @extend_schema(
@@ -163,6 +260,9 @@ class SubtaskView(RetrieveUpdateDestroyAPIView):
         **kwargs,
     ) -> SubtaskSerializer:
         """pk에 해당하는 특정 하위 업무 Subtask를 조회한다.
+        응답의 ETag 를 If-None-Match 에 담거나 Last-Modified 를 If-Modified-Since 에 담아 요청하면
+        바뀌지 않은 경우 직렬화하지 않고 304 Not Modified 를 반환한다.
+        응답은 객체별로 cache 되며, cache 된 권한 정보로 DB 조회 없이 권한을 확인한다.
 
         Args:
 
@@ -177,7 +277,6 @@ class SubtaskView(RetrieveUpdateDestroyAPIView):
 
             - Response (200 OK): pk에 해당하는 Subtask를 직렬화하여 반환
         """
-        self.check_and_handle_not_found_error(request, pk)
         return super().get(request, *args, **kwargs)
 
     @extend_schema(
@@ -213,7 +312,6 @@ class SubtaskView(RetrieveUpdateDestroyAPIView):
 
             - Response (204 NO CONTENT): 성공 메세지 반환
         """
-        self.check_and_handle_not_found_error(request, pk)
         return super().delete(request, pk, *args, **kwargs)
 
     def perform_destroy(self, instance: SubTask):
@@ -253,7 +351,6 @@ class SubtaskView(RetrieveUpdateDestroyAPIView):
         Returns:
             - Response (200 OK): 수정된 하위업무를 직렬화하여 반환
         """
-        self.check_and_handle_not_found_error(request, pk)
         return super().put(request, *args, **kwargs)
 
     @extend_schema(
@@ -283,11 +380,10 @@ class SubtaskView(RetrieveUpdateDestroyAPIView):
 
             - Response (200 OK): 수정된 하위업무를 직렬화하여 반환
         """
-        self.check_and_handle_not_found_error(request, pk)
         return super().patch(request, *args, **kwargs)
 
 
-class MarkAsCompletionView(APIView):
+class MarkAsCompletionView(MessagePackMixin, APIView):
     serializer_class = SubtaskSerializer
     permission_classes = [IsAuthenticated]
 
@@ -300,6 +396,7 @@ class MarkAsCompletionView(APIView):
     def patch(self, request: Request, pk: int) -> Response:
         """pk 정보에 해당되는 하위 업무(Subtask)의 완료 유무 상태(is_completed)를 완료 상태로 변경한다.
         단 유저의 팀과 하위 업무의 팀이 동일한 팀이어야 한다.
+        하나의 조건부 UPDATE 문으로 처리하며, 이미 완료된 하위 업무를 다시 요청해도 성공으로 응답한다.
 
         Args:
 
@@ -317,28 +414,66 @@ class MarkAsCompletionView(APIView):
 
             - Response (200 OK): 성공 메세지 반환
         """
-        selected_subtask = SubTask.objects.filter(id=pk).last()
+        updated = SubTask.objects.mark_as_completion(pk, request.user.team)
 
-        if not selected_subtask:
-            raise CommonHttpException.SUBTASK_NOT_FOUND_ERROR
+        if not updated:
+            # 완료 처리되지 않은 이유를 확인한다. 이미 완료된 하위 업무라면 그대로 성공으로 응답한다.
+            team = SubTask.objects.filter(id=pk).values_list("team", flat=True).first()
 
-        if selected_subtask.team != request.user.team:
-            raise exceptions.PermissionDenied
+            if team is None:
+                raise CommonHttpException.SUBTASK_NOT_FOUND_ERROR
 
-        initial_data = {
-            MarkAsCompletion.is_completed: True,
-            MarkAsCompletion.completed_at: timezone.localtime(timezone.now()),
-        }
+            if team != request.user.team:
+                raise exceptions.PermissionDenied
 
-        serializer = self.serializer_class(
-            selected_subtask,
-            data=initial_data,
-            partial=True,
+        return Response(
+            {"message": "success to mark as completion"},
+            status=status.HTTP_200_OK,
         )
+
+
+class BulkMarkAsCompletionView(MessagePackMixin, APIView):
+    serializer_class = SubtaskBulkCompletionSerializer
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        tags=["Subtask"],
+        request=SubtaskBulkCompletionSerializer,
+        summary="일괄 완료표시 - 같은 팀에 한해서 주어진 하위 업무들을 한 번에 완료 상태로 변경",
+    )
+    def patch(self, request: Request) -> Response:
+        """ids 에 해당되는 하위 업무들 중 유저의 팀과 같은 팀의 미완료 하위 업무를 한 번에 완료 상태로 변경한다.
+        일부 하위 업무를 완료 처리할 수 없더라도 나머지는 완료 처리하며, 하위 업무별 처리 결과를 반환한다.
+
+        Args:
+
+            - ids (List[int]): 완료 처리할 하위 업무의 pk 목록 (최대 100개)
+
+        Raises:
+
+            - HTTPException (400 BAD REQUEST): ids 가 비어 있거나 올바르지 않은 경우
+
+        Returns:
+
+            - Response (200 OK): 하위 업무별 처리 결과 반환
+                - completed: 완료 처리됨
+                - already_completed: 이미 완료된 하위 업무
+                - forbidden: 다른 팀의 하위 업무
+                - not_found: 존재하지 않는 하위 업무
+        """
+        serializer = self.serializer_class(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+
+        outcomes = SubTask.objects.complete_for_team(
+            serializer.validated_data["ids"],
+            request.user.team,
+        )
 
         return Response(
-            {"message": "success to mark as completion"},
+            {
+                "results": [
+                    {"id": pk, "outcome": outcome} for pk, outcome in outcomes.items()
+                ],
+            },
             status=status.HTTP_200_OK,
         )
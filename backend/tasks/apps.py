@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "tasks"
+
+    def ready(self):
+        # 업무가 바뀌면 목록, 상세 조회 응답 cache 를 무효화하도록 signal receiver 를 연결한다.
+        import tasks.cache_invalidation  # noqa: F401
@@ -0,0 +1,142 @@
+from typing import Iterable, Set
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from common.response_cache import bump_detail_versions, bump_team_versions
+from common.transactions import get_commit_pending
+from tasks.models import Task
+
+# 업무 목록에는 업무의 팀과 하위 업무의 팀이 모두 보이므로,
+# 업무나 하위 업무가 바뀌면 그 업무의 팀과 모든 하위 업무의 팀의 목록 version 을 올린다.
+# 상세 조회 응답은 바뀐 업무, 하위 업무와 하위 업무 변경으로 완료 처리될 수 있는 상위 업무의 version 을 올린다.
+# 하위 업무의 변경은 subtasks.models 의 signal receiver 와 manager 에서 반영한다.
+# 업무 응답에는 작성자 정보도 담기므로 유저가 바뀌면 그 유저가 작성한 업무도 함께 반영한다.
+
+
+class PendingInvalidation:
+    """하나의 transaction 동안 응답 cache 를 무효화할 업무, 하위 업무, 팀을 모아 둔다."""
+
+    def __init__(self):
+        self.task_ids: Set[int] = set()
+        self.subtask_ids: Set[int] = set()
+        self.teams: Set[str] = set()
+
+    def add(
+        self,
+        task_ids: Iterable[int],
+        subtask_ids: Iterable[int],
+        teams: Iterable[str],
+    ) -> None:
+        self.task_ids.update(task_id for task_id in task_ids if task_id is not None)
+        self.subtask_ids.update(subtask_ids)
+        self.teams.update(team for team in teams if team)
+
+    def apply(self, using: str) -> None:
+        """영향을 받은 업무와 팀을 한 번의 query 로 모아 version 을 올린다."""
+        task_ids = set(self.task_ids)
+        teams = set(self.teams)
+
+        if self.task_ids or self.subtask_ids:
+            condition = Q(pk__in=self.task_ids)
+            if self.subtask_ids:
+                condition |= Q(
+                    pk__in=Task.objects.filter(
+                        subtasks__in=self.subtask_ids,
+                    ).values("pk"),
+                )
+
+            for task_id, task_team, subtask_team in (
+                Task.objects.db_manager(using)
+                .filter(condition)
+                .values_list("pk", "team", "subtasks__team")
+                .distinct()
+            ):
+                task_ids.add(task_id)
+                teams.update(team for team in (task_team, subtask_team) if team)
+
+        bump_team_versions(teams)
+        bump_detail_versions(Task, task_ids)
+        bump_detail_versions(
+            Task._meta.get_field("subtasks").related_model,
+            self.subtask_ids,
+        )
+
+
+def invalidate_task_caches(
+    task_ids: Iterable[int] = (),
+    subtask_ids: Iterable[int] = (),
+    teams: Iterable[str] = (),
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """업무와 하위 업무의 변경을 목록, 상세 조회 응답 cache 에 반영한다.
+    transaction 안에서는 commit 시점까지 모았다가 한 번에 반영하여,
+    commit 전의 데이터가 새 version 으로 저장되지 않게 한다.
+
+    Args:
+
+        - task_ids (Iterable[int]): 변경된 업무의 pk 목록
+        - subtask_ids (Iterable[int]): 변경된 하위 업무의 pk 목록 (상위 업무는 조회하여 함께 반영)
+        - teams (Iterable[str]): 삭제되었거나 팀이 바뀌어 조회로 알 수 없는 팀 목록
+        - using (str): DB alias
+    """
+    if not transaction.get_connection(using).in_atomic_block:
+        pending = PendingInvalidation()
+        pending.add(task_ids, subtask_ids, teams)
+        pending.apply(using)
+        return
+
+    get_commit_pending("task_cache_invalidation", using, PendingInvalidation).add(
+        task_ids,
+        subtask_ids,
+        teams,
+    )
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_task_caches_on_task_change(sender, instance: Task, using: str, **kwargs):
+    # 삭제된 업무와 팀이 바뀌기 전의 팀은 조회로 알 수 없으므로 팀을 직접 전달한다.
+    invalidate_task_caches(
+        task_ids=[instance.pk],
+        teams=[instance.team, getattr(instance, "_loaded_team", None)],
+        using=using,
+    )
+    instance._loaded_team = instance.team
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_task_caches_on_user_change(
+    sender,
+    instance,
+    created: bool,
+    using: str,
+    raw: bool = False,
+    **kwargs,
+):
+    """업무 응답에 담기는 작성자 정보(RENDERED_FIELDS)가 바뀐 경우에만 작성한 업무의 cache 를 무효화한다.
+    로그인 시 비밀번호 hash 를 다시 저장하는 경우처럼 다른 필드만 저장하면 무효화하지 않는다.
+    """
+    # 새로 만든 유저가 작성한 업무는 없다.
+    if created or raw:
+        return
+
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not set(sender.RENDERED_FIELDS) & update_fields:
+        return
+
+    rendered_fields = instance.get_rendered_fields()
+    if getattr(instance, "_loaded_rendered_fields", None) == rendered_fields:
+        return
+
+    instance._loaded_rendered_fields = rendered_fields
+
+    invalidate_task_caches(
+        task_ids=Task.objects.db_manager(using)
+        .filter(create_user=instance)
+        .values_list("pk", flat=True),
+        using=using,
+    )
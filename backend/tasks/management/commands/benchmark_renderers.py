@@ -0,0 +1,100 @@
+from io import BytesIO
+from time import perf_counter
+from unittest import mock
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from common.parsers import FastJSONParser
+from common.renderers import ColumnarRenderer, FastJSONRenderer, orjson
+from common.serializers import CompiledListSerializer
+from tasks.management.commands.benchmark_serializers import build_tasks
+from tasks.serializers import TaskSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "업무 목록 응답 data 를 DRF 의 JSONRenderer, JSONParser 와 "
+        "FastJSONRenderer, FastJSONParser 로 변환하는 시간을 측정하고, "
+        "JSON 과 열 단위(columnar) 응답의 직렬화 시간과 크기를 비교합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--subtasks", type=int, default=3, help="업무당 하위 업무 수")
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, rows: int, subtasks: int, repeat: int, **options):
+        if orjson is None:
+            self.stdout.write("orjson is not installed. FastJSON* falls back to DRF.")
+
+        data = {
+            "count": rows,
+            "results": TaskSerializer(build_tasks(rows, subtasks), many=True).data,
+        }
+        content = JSONRenderer().render(data)
+
+        if FastJSONRenderer().render(data) != content:
+            raise CommandError("FastJSONRenderer output differs from JSONRenderer")
+
+        self.stdout.write(f"payload: {rows} tasks, {len(content) / 1024:,.0f} KiB")
+
+        for label, renderer in (("drf", JSONRenderer()), ("fast", FastJSONRenderer())):
+            elapsed = measure(lambda: renderer.render(data), repeat)
+            self.write_result("render", label, elapsed, rows)
+
+        for label, parser in (("drf", JSONParser()), ("fast", FastJSONParser())):
+            elapsed = measure(lambda: parser.parse(BytesIO(content)), repeat)
+            self.write_result("parse", label, elapsed, rows)
+
+        self.benchmark_export(build_tasks(rows, subtasks), repeat)
+
+    def benchmark_export(self, tasks: list, repeat: int) -> None:
+        """목록 응답 전체(직렬화와 렌더링)를 행 단위 JSON 과 열 단위 응답으로 만드는 시간과 크기를 비교한다."""
+
+        def export_drf() -> bytes:
+            with mock.patch.object(
+                CompiledListSerializer,
+                "to_representation",
+                serializers.ListSerializer.to_representation,
+            ):
+                return JSONRenderer().render(TaskSerializer(tasks, many=True).data)
+
+        def export_json() -> bytes:
+            return FastJSONRenderer().render(TaskSerializer(tasks, many=True).data)
+
+        def export_columnar() -> bytes:
+            data = TaskSerializer(tasks, many=True, context={"columnar": True}).data
+            return ColumnarRenderer().render(data)
+
+        for label, export in (
+            ("drf", export_drf),
+            ("json", export_json),
+            ("columnar", export_columnar),
+        ):
+            elapsed = measure(export, repeat)
+            self.stdout.write(
+                f"export  {label:<8} {elapsed * 1000:8.1f} ms "
+                f"{len(export()) / 1024:10,.0f} KiB",
+            )
+
+    def write_result(self, name: str, label: str, elapsed: float, rows: int) -> None:
+        self.stdout.write(
+            f"{name:<7} {label:<5} {elapsed * 1000:8.1f} ms "
+            f"{rows / elapsed:12,.0f} tasks/sec",
+        )
+
+
+def measure(func, repeat: int) -> float:
+    """func 를 repeat 번 실행하여 가장 짧은 시간을 반환한다."""
+    best = None
+
+    for _ in range(repeat):
+        started_at = perf_counter()
+        func()
+        elapsed = perf_counter() - started_at
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
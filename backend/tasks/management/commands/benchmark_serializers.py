@@ -0,0 +1,106 @@
+from time import perf_counter
+from unittest import mock
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from common.models import Base
+from common.serializers import CompiledListSerializer
+from accounts.models import User
+from subtasks.models import SubTask
+from subtasks.serializers import SubtaskSerializer
+from tasks.models import Task
+from tasks.serializers import TaskSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "업무 목록과 하위 업무 목록 응답을 DRF serializer 와 CompiledListSerializer 로 직렬화하여 "
+        "초당 직렬화한 객체 수를 출력합니다. DB 는 조회하지 않고 메모리의 객체를 사용합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--subtasks", type=int, default=3, help="업무당 하위 업무 수")
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, rows: int, subtasks: int, repeat: int, **options):
+        tasks = build_tasks(rows, subtasks)
+        all_subtasks = [subtask for task in tasks for subtask in task.subtasks.all()]
+
+        for name, serializer_class, objects in (
+            ("tasks", TaskSerializer, tasks),
+            ("subtasks", SubtaskSerializer, all_subtasks),
+        ):
+            self.benchmark(name, serializer_class, objects, repeat)
+
+    def benchmark(self, name: str, serializer_class, objects: list, repeat: int):
+        with mock.patch.object(
+            CompiledListSerializer,
+            "to_representation",
+            serializers.ListSerializer.to_representation,
+        ):
+            drf_elapsed, drf_content = measure(serializer_class, objects, repeat)
+
+        elapsed, content = measure(serializer_class, objects, repeat)
+
+        if content != drf_content:
+            raise CommandError(f"{name}: compiled output differs from DRF output")
+
+        for label, seconds in (("drf", drf_elapsed), ("compiled", elapsed)):
+            self.stdout.write(
+                f"{name:<8} {label:<8} {len(objects) / seconds:12,.0f} objects/sec "
+                f"({seconds * 1000:8.1f} ms / {len(objects)} objects)",
+            )
+
+        self.stdout.write(f"{name:<8} speedup  {drf_elapsed / elapsed:12.1f}x")
+
+
+def measure(serializer_class, objects: list, repeat: int) -> tuple:
+    """직렬화에 걸린 가장 짧은 시간과 JSON 으로 렌더링한 결과를 반환한다."""
+    best = None
+
+    for _ in range(repeat):
+        started_at = perf_counter()
+        data = serializer_class(objects, many=True).data
+        elapsed = perf_counter() - started_at
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best, JSONRenderer().render(data)
+
+
+def build_tasks(rows: int, subtasks_per_task: int) -> list:
+    teams = Base.TeamChoices.values
+    now = timezone.now()
+    users = [
+        User(id=index + 1, username=f"user-{index}", team=team)
+        for index, team in enumerate(teams)
+    ]
+
+    tasks = []
+    for index in range(rows):
+        task = Task(
+            id=index + 1,
+            create_user=users[index % len(users)],
+            team=teams[index % len(teams)],
+            is_completed=index % 2 == 0,
+            completed_at=now if index % 2 == 0 else None,
+        )
+        # prefetch_related("subtasks") 로 조회한 것처럼 하위 업무를 담아 둔다.
+        task._prefetched_objects_cache = {
+            "subtasks": [
+                SubTask(
+                    id=index * subtasks_per_task + offset + 1,
+                    task=task,
+                    team=teams[(index + offset) % len(teams)],
+                    is_completed=task.is_completed,
+                    completed_at=task.completed_at,
+                )
+                for offset in range(subtasks_per_task)
+            ],
+        }
+        tasks.append(task)
+
+    return tasks
@@ -0,0 +1,77 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:19
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Task",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "team",
+                    models.CharField(
+                        choices=[
+                            ("Danbie", "단비"),
+                            ("Darae", "다래"),
+                            ("Blabla", "블라블라"),
+                            ("Cheollo", "철로"),
+                            ("Dangi", "땅이"),
+                            ("Haetae", "해태"),
+                            ("Supi", "수피"),
+                        ],
+                        max_length=10,
+                        verbose_name="팀 소속",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "modified_at",
+                    models.DateTimeField(auto_now=True, verbose_name="생성일"),
+                ),
+                (
+                    "is_completed",
+                    models.BooleanField(default=False, verbose_name="완료 유무"),
+                ),
+                (
+                    "completed_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="완료일"),
+                ),
+                ("title", models.CharField(max_length=100, verbose_name="업무 제목")),
+                ("content", models.TextField(max_length=1000, verbose_name="업무 내용")),
+                (
+                    "create_user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="작성자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "업무 내역",
+                "verbose_name_plural": "업무 목록",
+                "db_table": "tasks",
+            },
+        ),
+    ]
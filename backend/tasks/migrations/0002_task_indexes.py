@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["team", "created_at"], name="tasks_team_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:22
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_subtask_counters(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    SubTask = apps.get_model("subtasks", "SubTask")
+
+    subtasks = SubTask.objects.filter(task=OuterRef("pk")).order_by().values("task")
+
+    Task.objects.update(
+        subtask_total=Coalesce(
+            Subquery(subtasks.annotate(count=Count("pk")).values("count")),
+            0,
+        ),
+        subtask_open=Coalesce(
+            Subquery(
+                subtasks.filter(is_completed=False)
+                .annotate(count=Count("pk"))
+                .values("count"),
+            ),
+            0,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0002_task_indexes"),
+        ("subtasks", "0002_subtask_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="subtask_open",
+            field=models.PositiveIntegerField(default=0, verbose_name="미완료 하위 업무 수"),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="subtask_total",
+            field=models.PositiveIntegerField(default=0, verbose_name="하위 업무 수"),
+        ),
+        migrations.RunPython(fill_subtask_counters, migrations.RunPython.noop),
+    ]
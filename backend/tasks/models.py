@@ -1,9 +1,170 @@
+from functools import reduce
+from operator import or_
+from typing import Dict, Tuple
+
 from django.db import models
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.db.models.lookups import Exact, GreaterThan
 from django.conf import settings
+from django.utils import timezone
 
 from common.models import BaseModel
 
 
+class TaskManager(models.Manager):
+    def apply_subtask_deltas(self, deltas: Dict[int, Tuple[int, int, int]]) -> int:
+        """업무별 하위 업무 수(subtask_total)와 미완료 하위 업무 수(subtask_open)의 변화량을
+        하나의 UPDATE 문으로 F expression을 사용해 반영한다.
+        하위 업무가 완료 처리된 업무 중 반영 후 미완료 하위 업무가 없는 업무는 같은 UPDATE 문에서 완료 처리한다.
+        하위 업무를 삭제하거나 옮겨서 미완료 하위 업무가 없어진 업무는 완료 처리하지 않는다.
+
+        Args:
+
+            - deltas (Dict[int, Tuple[int, int, int]]): 업무 pk 별 변화량
+                - (하위 업무 수 변화량, 미완료 하위 업무 수 변화량, 완료 처리된 하위 업무 수)
+
+        Returns:
+
+            - int: 갱신된 업무 수
+        """
+        deltas = {task_id: delta for task_id, delta in deltas.items() if any(delta[:2])}
+
+        if not deltas:
+            return 0
+
+        now = timezone.now()
+
+        # 변경 후 미완료 하위 업무가 없고 하위 업무는 남아 있는 경우 (변경 전 값 기준)
+        completes = Q(is_completed=False) & reduce(
+            or_,
+            (
+                Q(
+                    pk=task_id,
+                    subtask_open=-open_delta,
+                    subtask_total__gt=-total_delta,
+                )
+                for task_id, (total_delta, open_delta, completed) in deltas.items()
+                if completed
+            ),
+            Q(pk__in=[]),
+        )
+
+        def shift(field_name: str, index: int) -> Case:
+            output_field = self.model._meta.get_field(field_name)
+            return Case(
+                *(
+                    When(pk=task_id, then=F(field_name) + delta[index])
+                    for task_id, delta in deltas.items()
+                ),
+                default=F(field_name),
+                output_field=output_field,
+            )
+
+        # MySQL은 SET 절을 왼쪽부터 차례로 적용하므로 변경 전 값을 참조하는 완료 처리를 먼저 둔다.
+        return self.filter(pk__in=deltas).update(
+            completed_at=Case(
+                When(completes, then=Value(now)),
+                default=F("completed_at"),
+            ),
+            modified_at=Case(
+                When(completes, then=Value(now)),
+                default=F("modified_at"),
+            ),
+            is_completed=Case(
+                When(completes, then=Value(True)),
+                default=F("is_completed"),
+            ),
+            subtask_total=shift("subtask_total", 0),
+            subtask_open=shift("subtask_open", 1),
+        )
+
+    def apply_subtask_completion(self, subtask_id: int) -> int:
+        """하위 업무 하나가 완료되었을 때 상위 업무의 미완료 하위 업무 수를 1 줄인다.
+        상위 업무의 pk 를 조회하지 않고 하위 업무의 pk 로 찾아 하나의 UPDATE 문으로 반영하며,
+        남은 미완료 하위 업무가 없으면 같은 UPDATE 문에서 완료 처리한다.
+
+        Args:
+
+            - subtask_id (int): 완료된 하위 업무의 pk
+
+        Returns:
+
+            - int: 갱신된 업무 수
+        """
+        now = timezone.now()
+        completes = Q(is_completed=False, subtask_open=1, subtask_total__gt=0)
+
+        return self.filter(subtasks=subtask_id).update(
+            completed_at=Case(
+                When(completes, then=Value(now)),
+                default=F("completed_at"),
+            ),
+            modified_at=Case(
+                When(completes, then=Value(now)),
+                default=F("modified_at"),
+            ),
+            is_completed=Case(
+                When(completes, then=Value(True)),
+                default=F("is_completed"),
+            ),
+            subtask_open=F("subtask_open") - 1,
+        )
+
+    def refresh_subtask_counters(self, task_ids, complete: bool = True) -> int:
+        """하위 업무를 다시 집계하여 업무의 하위 업무 수를 맞추고, 미완료 하위 업무가 없으면 완료 처리한다.
+        조회 시점의 하위 업무 상태를 알 수 없어 변화량을 계산할 수 없을 때 사용한다.
+
+        Args:
+
+            - task_ids (Iterable[int]): 다시 집계할 업무의 pk 목록
+            - complete (bool): False 이면 하위 업무 수만 맞추고 완료 처리하지 않는다. (하위 업무 삭제)
+
+        Returns:
+
+            - int: 갱신된 업무 수
+        """
+        subtask_model = self.model._meta.get_field("subtasks").related_model
+        subtasks = subtask_model.objects.filter(task=OuterRef("pk")).order_by()
+
+        def count(queryset):
+            counted = (
+                queryset.values("task").annotate(count=Count("pk")).values("count")
+            )
+            return Coalesce(Subquery(counted), 0)
+
+        total_count = count(subtasks)
+        open_count = count(subtasks.filter(is_completed=False))
+
+        if not complete:
+            return self.filter(pk__in=task_ids).update(
+                subtask_total=total_count,
+                subtask_open=open_count,
+            )
+
+        now = timezone.now()
+        completes = (
+            Exact(open_count, 0) & GreaterThan(total_count, 0) & Q(is_completed=False)
+        )
+
+        return self.filter(pk__in=task_ids).update(
+            completed_at=Case(
+                When(completes, then=Value(now)),
+                default=F("completed_at"),
+            ),
+            modified_at=Case(
+                When(completes, then=Value(now)),
+                default=F("modified_at"),
+            ),
+            is_completed=Case(
+                When(completes, then=Value(True)),
+                default=F("is_completed"),
+            ),
+            subtask_total=total_count,
+            subtask_open=open_count,
+        )
+
+
 class Task(BaseModel):
     create_user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -12,11 +173,59 @@ class Task(BaseModel):
     )
     title = models.CharField(verbose_name="업무 제목", max_length=100)
     content = models.TextField(verbose_name="업무 내용", max_length=1000)
+    subtask_total = models.PositiveIntegerField(verbose_name="하위 업무 수", default=0)
+    subtask_open = models.PositiveIntegerField(
+        verbose_name="미완료 하위 업무 수",
+        default=0,
+    )
+
+    # 하위 업무 수는 TaskManager 에서 F expression 으로만 갱신한다.
+    SUBTASK_COUNTER_FIELDS = ("subtask_total", "subtask_open")
+    # 하위 업무에 의해 자동으로 완료 처리될 수 있는 필드
+    COMPLETION_FIELDS = ("is_completed", "completed_at")
+
+    objects = TaskManager()
 
     def __str__(self) -> str:
         return f"Task(team={self.team}, is_completed={self.is_completed})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_completion = {
+            name: instance.__dict__.get(name) for name in cls.COMPLETION_FIELDS
+        }
+        return instance
+
+    def save(self, *args, **kwargs):
+        """업무를 수정할 때는 조회 이후 하위 업무에 의해 바뀌었을 수 있는 값을 덮어쓰지 않는다.
+        하위 업무 수는 항상 제외하고, 완료 유무와 완료일은 직접 변경한 경우에만 저장한다.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            loaded_completion = getattr(self, "_loaded_completion", {})
+            excluded_fields = set(self.SUBTASK_COUNTER_FIELDS) | {
+                name
+                for name, value in loaded_completion.items()
+                if self.__dict__.get(name) == value
+            }
+            deferred_fields = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in excluded_fields
+                and field.attname not in deferred_fields
+            ]
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = "tasks"
         verbose_name = "업무 내역"
         verbose_name_plural = "업무 목록"
+        indexes = [
+            # 업무 목록 조회: team 으로 필터링하고 created_at 기준으로 정렬
+            models.Index(
+                fields=["team", "created_at"],
+                name="tasks_team_created_idx",
+            ),
+        ]
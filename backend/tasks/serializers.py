@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from common.serializers import CompiledListSerializer
+
 from accounts.serializers import UserSerializer
 from subtasks.serializers import SubtaskSerializer
 from tasks.models import Task
@@ -10,6 +12,7 @@ class TaskSerializer(serializers.ModelSerializer):
     subtasks = SubtaskSerializer(many=True, read_only=True)
 
     class Meta:
+        list_serializer_class = CompiledListSerializer
         model = Task
         fields = [
             "id",
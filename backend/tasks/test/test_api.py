@@ -1,5 +1,9 @@
+from datetime import timedelta
+
 from rest_framework.test import APIClient
 from rest_framework import status
+from django.db import transaction
+from django.db.models import F
 from django.urls import reverse
 import pytest
 
@@ -8,7 +12,39 @@ from subtasks.test.conftest import fake_subtasks
 
 from common.utils import random_lower_string
 from common.models import Base
+from common.response_cache import get_response_cache
+from accounts.models import User
 from tasks.models import Task
+from tasks.serializers import TaskDetailSerializer, TaskSerializer
+from subtasks.models import SubTask
+
+
+@pytest.mark.django_db
+@pytest.mark.get_a_task
+def test_get_task_loads_object_once(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    django_assert_num_queries,
+):
+    url = reverse("task", args=[fake_task.id])
+
+    # 인증 유저 조회와 작성자를 포함한 업무 조회만 실행된다.
+    with django_assert_num_queries(2):
+        response = client.get(url, headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    # 수정은 한 번 조회한 객체를 그대로 UPDATE 하며, 인증 유저는 cache 에서 조회한다.
+    with django_assert_num_queries(2):
+        response = client.patch(
+            url,
+            {"team": Base.TeamChoices.DANBIE},
+            headers=fake_authorization_header,
+            content_type="application/json",
+        )
+
+    assert response.status_code == status.HTTP_200_OK
 
 
 @pytest.mark.django_db
@@ -43,6 +79,98 @@ def test_get_task_if_success(
     assert response.data["completed_at"] is None
 
 
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.get_a_task
+def test_get_task_if_not_modified(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    monkeypatch,
+):
+    url = reverse("task", args=[fake_task.id])
+
+    response = client.get(url, headers=fake_authorization_header)
+
+    etag = response["ETag"]
+    last_modified = response["Last-Modified"]
+
+    # validator 가 일치하면 직렬화하지 않고 304 로 응답한다.
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            TaskDetailSerializer,
+            "to_representation",
+            lambda *args: pytest.fail("serialized"),
+        )
+
+        response = client.get(
+            url,
+            headers={**fake_authorization_header, "If-None-Match": etag},
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert response.content == b""
+
+        response = client.get(
+            url,
+            headers={**fake_authorization_header, "If-Modified-Since": last_modified},
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # 수정되면 ETag 가 바뀐다.
+    client.patch(
+        url,
+        {"title": "updated title"},
+        headers=fake_authorization_header,
+        content_type="application/json",
+    )
+
+    response = client.get(
+        url,
+        headers={**fake_authorization_header, "If-None-Match": etag},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+    assert response.data["title"] == "updated title"
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.get_a_task
+def test_get_task_last_modified_includes_create_user(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+):
+    url = reverse("task", args=[fake_task.id])
+
+    response = client.get(url, headers=fake_authorization_header)
+    last_modified = response["Last-Modified"]
+
+    # 업무는 그대로이고 응답에 담기는 작성자 정보만 바뀐 경우
+    User.objects.filter(id=fake_task.create_user_id).update(
+        modified_at=F("modified_at") + timedelta(seconds=10),
+    )
+    get_response_cache().clear()
+
+    response = client.get(
+        url,
+        headers={**fake_authorization_header, "If-Modified-Since": last_modified},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Last-Modified"] != last_modified
+
+    # 작성자를 pk 로 전달하면 작성자 정보는 Last-Modified 에 반영하지 않는다.
+    response = client.get(
+        f"{url}?expand=",
+        headers={**fake_authorization_header, "If-Modified-Since": last_modified},
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
 @pytest.mark.django_db
 @pytest.mark.get_a_task
 def test_get_task_if_not_exist_task(
@@ -68,7 +196,9 @@ def test_get_tasks_if_success(
 ):
     url = reverse("task_list")
 
-    for page_number in range(1, 6):
+    task_ids = []
+
+    for page_number in range(1, 3):
         response = client.get(
             f"{url}?page={page_number}",
             headers=fake_authorization_header,
@@ -78,8 +208,8 @@ def test_get_tasks_if_success(
         assert "count" in response.data
 
         # fake_tasks에서 30개가 생성되지만 인증 정보에 담긴 직원의 팀과 동일한 업무 소속은 15개.
-        # fake_subtasks에서 인증 정보에 담긴 직원의 팀과 동일한 하위 업무 30개.
-        assert response.data["count"] == 45
+        # fake_subtasks에서 인증 정보에 담긴 직원의 팀과 동일한 하위 업무를 가진 업무 2개.
+        assert response.data["count"] == 17
 
         assert "previous" in response.data
 
@@ -88,7 +218,129 @@ def test_get_tasks_if_success(
         assert "results" in response.data
 
         # REST FRAMEWORK의 PAGE 사이즈가 10
-        assert len(response.data["results"]) == 10 if page_number != 5 else 5
+        assert len(response.data["results"]) == (10 if page_number == 1 else 7)
+
+        task_ids += [task["id"] for task in response.data["results"]]
+
+    # 하위 업무 수와 상관없이 업무는 한 번씩만 조회된다.
+    assert len(task_ids) == len(set(task_ids))
+
+
+@pytest.mark.django_db
+@pytest.mark.get_tasks
+def test_get_tasks_query_count_is_constant(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_user: dict,
+    fake_task: Task,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    url = reverse("task_list")
+
+    # 인증 유저 조회, count, 작성자를 join한 업무 조회, 하위 업무 prefetch
+    expected_num_queries = 4
+
+    with django_assert_num_queries(expected_num_queries):
+        response = client.get(url, headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["count"] == 1
+
+    # 업무와 하위 업무 수를 늘려도 한 페이지에 필요한 query 수는 동일하다.
+    # commit 시점에 팀의 목록 cache 가 무효화되므로 다시 조회한다.
+    with django_capture_on_commit_callbacks(execute=True), transaction.atomic():
+        for _ in range(20):
+            task = Task.objects.create(
+                create_user=fake_user["user_object"],
+                title=random_lower_string(k=10),
+                content=random_lower_string(k=10),
+                team=Base.TeamChoices.DANBIE,
+            )
+            for _ in range(5):
+                SubTask.objects.create(task=task, team=Base.TeamChoices.DANBIE)
+
+    # 인증 유저는 첫 요청 이후 cache 에서 조회하므로 users 조회가 빠진다.
+    with django_assert_num_queries(expected_num_queries - 1):
+        response = client.get(url, headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["count"] == 21
+    assert len(response.data["results"]) == 10
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.get_tasks
+def test_get_tasks_if_not_modified(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    monkeypatch,
+    django_assert_num_queries,
+):
+    url = reverse("task_list")
+    subtask = SubTask.objects.create(task=fake_task, team=Base.TeamChoices.DANBIE)
+
+    response = client.get(url, headers=fake_authorization_header)
+
+    etag = response["ETag"]
+    conditional_header = {**fake_authorization_header, "If-None-Match": etag}
+
+    # cache 된 응답도 ETag 를 확인하여 query 없이 304 로 응답한다.
+    with django_assert_num_queries(0):
+        response = client.get(url, headers=conditional_header)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # cache 가 없어도 페이지만 조회하고 직렬화하지 않는다.
+    get_response_cache().clear()
+
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            TaskSerializer,
+            "to_representation",
+            lambda *args: pytest.fail("serialized"),
+        )
+        response = client.get(url, headers=conditional_header)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # 응답에 담기는 하위 업무가 바뀌면 ETag 도 바뀐다.
+    subtask.is_completed = True
+    subtask.save()
+
+    response = client.get(url, headers=conditional_header)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+    assert "Last-Modified" not in response
+
+
+@pytest.mark.django_db
+@pytest.mark.get_tasks
+def test_get_tasks_by_cursor_if_success(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_tasks: None,
+    fake_subtasks: None,
+):
+    url = f"{reverse('task_list')}?pagination=cursor"
+
+    task_ids = []
+
+    while url is not None:
+        response = client.get(url, headers=fake_authorization_header)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+
+        task_ids += [task["id"] for task in response.data["results"]]
+        url = response.data["next"]
+
+    # page 번호 방식과 동일하게 17개의 업무가 생성 날짜 기준 내림차순으로 한 번씩 조회된다.
+    assert len(task_ids) == 17
+    assert len(set(task_ids)) == 17
+    assert task_ids == sorted(task_ids, reverse=True)
 
 
 @pytest.mark.django_db
@@ -256,6 +508,32 @@ def test_mark_as_completion_if_success(
     assert refreshed_task.is_completed is True
 
 
+@pytest.mark.django_db
+@pytest.mark.mark_as_completion
+def test_mark_as_completion_is_single_update(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    django_assert_num_queries,
+):
+    url = reverse("task_completion", args=[fake_task.id])
+
+    # 인증 유저 조회와 완료 처리 UPDATE 만 실행된다.
+    with django_assert_num_queries(2) as captured:
+        response = client.patch(url, headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "content" not in captured.captured_queries[-1]["sql"]
+
+    completed_task = Task.objects.get(id=fake_task.id)
+
+    # 이미 완료된 업무를 다시 요청해도 성공으로 응답하고 완료일은 바뀌지 않는다.
+    response = client.patch(url, headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert Task.objects.get(id=fake_task.id).completed_at == completed_task.completed_at
+
+
 @pytest.mark.django_db
 @pytest.mark.mark_as_completion
 def test_mark_as_completion_if_not_exist_task(
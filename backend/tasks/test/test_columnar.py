@@ -0,0 +1,134 @@
+from rest_framework.test import APIClient
+from rest_framework import status
+from django.urls import reverse
+from django.utils import timezone
+import orjson
+import pytest
+
+# flake8: noqa
+from subtasks.test.conftest import fake_subtasks
+
+from common.columnar import OFFSETS, to_columnar
+from common.renderers import ColumnarRenderer
+from common.serializers import compile_columns, get_columnar_schema
+from tasks.management.commands.benchmark_serializers import build_tasks
+from tasks.serializers import TaskSerializer
+from subtasks.models import SubTask
+
+
+def from_columnar(table: dict) -> list:
+    """열 단위 형식을 다시 dict 목록으로 바꾼다."""
+    columns = table["columns"]
+    length = len(columns[0]) if columns else 0
+    nested = {name: from_columnar(rows) for name, rows in table["tables"].items()}
+
+    rows = [{} for _ in range(length)]
+    for name, column in zip(table["fields"], columns):
+        for index, value in enumerate(column):
+            if name in nested and table["tables"][name]["kind"] == OFFSETS:
+                stop = column[index + 1] if index + 1 < length else len(nested[name])
+                value = nested[name][value:stop]
+            elif name in nested and value is not None:
+                value = nested[name][value]
+
+            rows[index][name] = value
+
+    return rows
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["task_list", "subtask_list"])
+def test_columnar_list_response_round_trips_to_json(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_subtasks: None,
+    url_name: str,
+):
+    SubTask.objects.filter(id__in=SubTask.objects.values("id")[:5]).update(
+        is_completed=True,
+        completed_at=timezone.now(),
+    )
+    url = reverse(url_name)
+
+    json_response = client.get(url, headers=fake_authorization_header)
+    response = client.get(f"{url}?format=columnar", headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == ColumnarRenderer.media_type
+    assert len(response.content) < len(json_response.content)
+
+    data = orjson.loads(response.content)
+    results = data.pop("results")
+    expected = json_response.json()
+
+    assert from_columnar(results) == expected.pop("results")
+    # pagination 링크에도 응답 형식이 유지된다.
+    if expected["next"] is not None:
+        expected["next"] = expected["next"].replace("?", "?format=columnar&")
+
+    assert data == expected
+
+
+def test_compiled_columns_are_identical_to_converted_rows():
+    tasks = build_tasks(rows=50, subtasks_per_task=2)
+    # 여러 업무가 같은 작성자를 가지므로 작성자 표에는 작성자마다 한 번만 담긴다.
+    columns = compile_columns(TaskSerializer())(tasks)
+    rows = TaskSerializer(tasks, many=True).data
+
+    assert columns == to_columnar(rows)
+    assert len(columns["tables"]["create_user"]["columns"][0]) < len(tasks)
+    assert from_columnar(columns) == orjson.loads(orjson.dumps(rows))
+
+    # 행 목록을 받은 renderer 도 같은 형식으로 만든다.
+    assert orjson.loads(ColumnarRenderer().render(rows)) == orjson.loads(
+        orjson.dumps(columns),
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["task_list", "subtask_list"])
+def test_columnar_empty_page_has_all_fields(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    url_name: str,
+):
+    response = client.get(
+        f"{reverse(url_name)}?format=columnar",
+        headers=fake_authorization_header,
+    )
+    results = orjson.loads(response.content)["results"]
+
+    # 행이 없어도 필드 이름과 표를 담고, 열은 비어 있다.
+    assert response.status_code == status.HTTP_200_OK
+    assert results["fields"]
+    assert results["columns"] == [[] for _ in results["fields"]]
+    if url_name == "task_list":
+        assert results == compile_columns(TaskSerializer())([])
+        assert results["tables"]["subtasks"]["fields"]
+
+
+class FakeTaskListView:
+    def get_serializer(self, *args, **kwargs):
+        return TaskSerializer(*args, many=True, **kwargs)
+
+
+def test_converted_empty_rows_are_identical_to_compiled_columns():
+    # 하위 업무가 없는 업무도 하위 업무 표의 필드 이름을 담는다.
+    tasks = build_tasks(rows=3, subtasks_per_task=0)
+    schema = get_columnar_schema(TaskSerializer())
+    rows = TaskSerializer(tasks, many=True).data
+
+    for objects, page in ((tasks, rows), ([], [])):
+        columns = compile_columns(TaskSerializer())(objects)
+        assert columns == to_columnar(page, schema)
+        assert orjson.loads(
+            ColumnarRenderer().render(
+                page, renderer_context={"view": FakeTaskListView()}
+            ),
+        ) == orjson.loads(orjson.dumps(columns))
+
+
+def test_columnar_renderer_keeps_non_dict_lists():
+    # dict 목록이 아닌 응답은 JSON 응답과 같다.
+    for data in (["title", "content"], [1, 2], [{"id": 1}, "id"]):
+        assert orjson.loads(ColumnarRenderer().render(data)) == data
@@ -0,0 +1,190 @@
+from rest_framework.test import APIClient
+from rest_framework import status
+from django.urls import reverse
+import pytest
+
+# flake8: noqa
+from subtasks.test.conftest import completion_engine, fake_subtask
+
+from accounts.enums import TokenInformation
+from accounts.models import User
+from common.response_cache import detail_version_key, get_response_cache
+from tasks.models import Task
+from subtasks.models import SubTask
+
+
+def get_authorization_header(client: APIClient, user: dict) -> dict:
+    response = client.post(reverse("login"), user["login_data"])
+
+    access_token = response.data[TokenInformation.token][TokenInformation.access_token]
+
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.get_a_task
+def test_task_detail_is_served_from_cache_with_permission_check(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    fake_another_user: dict,
+    django_assert_num_queries,
+):
+    url = reverse("task", args=[fake_task.id])
+
+    response = client.get(url, headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    with django_assert_num_queries(0):
+        cached_response = client.get(url, headers=fake_authorization_header)
+
+    assert cached_response.status_code == status.HTTP_200_OK
+    assert cached_response.data == response.data
+    assert cached_response["ETag"] == response["ETag"]
+
+    # cache 된 응답도 업무를 작성하지 않은 유저에게는 보내지 않는다.
+    another_header = get_authorization_header(client, fake_another_user)
+
+    response = client.get(url, headers=another_header)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.get_a_subtask
+def test_detail_cache_is_invalidated_by_completion(
+    completion_engine: str,
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    fake_subtask: SubTask,
+):
+    task_url = reverse("task", args=[fake_task.id])
+    subtask_url = reverse("subtask", args=[fake_subtask.id])
+
+    response = client.get(task_url, headers=fake_authorization_header)
+    assert response.data["is_completed"] is False
+
+    response = client.get(subtask_url, headers=fake_authorization_header)
+    assert response.data["is_completed"] is False
+
+    response = client.patch(
+        reverse("subtask_completion", args=[fake_subtask.id]),
+        headers=fake_authorization_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    # 하위 업무와 함께 자동으로 완료 처리된 상위 업무도 바로 반영된다.
+    response = client.get(subtask_url, headers=fake_authorization_header)
+    assert response.data["is_completed"] is True
+
+    response = client.get(task_url, headers=fake_authorization_header)
+    assert response.data["is_completed"] is True
+
+    SubTask.objects.get(id=fake_subtask.id).delete()
+
+    response = client.get(subtask_url, headers=fake_authorization_header)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.get_tasks
+def test_response_caches_are_invalidated_by_bulk_completion(
+    completion_engine: str,
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    fake_subtask: SubTask,
+):
+    # trigger 가 업무를 완료 처리하는 경우에도 manager 가 응답 cache 를 무효화한다.
+    task_url = reverse("task", args=[fake_task.id])
+    list_url = reverse("task_list")
+
+    response = client.get(task_url, headers=fake_authorization_header)
+    assert response.data["is_completed"] is False
+
+    response = client.get(list_url, headers=fake_authorization_header)
+    assert response.data["results"][0]["is_completed"] is False
+
+    response = client.patch(
+        reverse("subtask_bulk_completion"),
+        {"ids": [fake_subtask.id]},
+        headers=fake_authorization_header,
+        content_type="application/json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    response = client.get(task_url, headers=fake_authorization_header)
+    assert response.data["is_completed"] is True
+
+    response = client.get(list_url, headers=fake_authorization_header)
+    assert response.data["results"][0]["is_completed"] is True
+
+    SubTask.objects.bulk_create_for_task(
+        Task.objects.get(id=fake_task.id),
+        [{"team": fake_subtask.team}],
+    )
+
+    response = client.get(list_url, headers=fake_authorization_header)
+    assert len(response.data["results"][0]["subtasks"]) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.get_a_task
+def test_detail_cache_is_invalidated_by_create_user_change(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_user: dict,
+    fake_task: Task,
+):
+    url = reverse("task", args=[fake_task.id])
+
+    response = client.get(url, headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    etag = response["ETag"]
+    version_key = detail_version_key(Task, fake_task.id)
+    version = get_response_cache().get(version_key)
+
+    # 응답에 담기지 않는 필드만 저장하면 (로그인 시 비밀번호 hash 갱신) 무효화하지 않는다.
+    user = User.objects.get(id=fake_user["user_object"].id)
+    user.set_password(fake_user["login_data"]["password"])
+    user.save(update_fields=["password"])
+    user.save()
+
+    assert get_response_cache().get(version_key) == version
+
+    user.username = "renamed-user"
+    user.save()
+
+    # 작성자 정보가 바뀌면 cache 된 응답과 ETag 를 다시 사용하지 않는다.
+    response = client.get(
+        url,
+        headers={**fake_authorization_header, "If-None-Match": etag},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["create_user"]["username"] == "renamed-user"
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+@pytest.mark.get_a_task
+def test_detail_version_is_not_created_for_missing_object(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+):
+    missing_id = fake_task.id + 1000
+
+    response = client.get(
+        reverse("task", args=[missing_id]),
+        headers=fake_authorization_header,
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert get_response_cache().get(detail_version_key(Task, missing_id)) is None
@@ -0,0 +1,309 @@
+import threading
+import time
+
+from rest_framework.test import APIClient
+from rest_framework import status
+from django.urls import reverse
+import pytest
+
+# flake8: noqa
+from subtasks.test.conftest import fake_subtask
+
+from common.models import Base
+from common.response_cache import (
+    get_response_cache,
+    get_team_version,
+    list_single_flight,
+    team_version_key,
+)
+from common.single_flight import SingleFlight
+from tasks.models import Task
+from subtasks.models import SubTask
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.get_tasks
+def test_task_list_is_served_from_cache_until_team_version_changes(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    django_assert_num_queries,
+):
+    url = reverse("task_list")
+    executions = list_single_flight.stats()["executions"]
+
+    response = client.get(url, headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    with django_assert_num_queries(0):
+        cached_response = client.get(url, headers=fake_authorization_header)
+
+    # cache 가 없을 때만 single flight 로 응답을 만든다.
+    assert list_single_flight.stats()["executions"] == executions + 1
+
+    assert cached_response.status_code == status.HTTP_200_OK
+    assert cached_response.data == response.data
+
+    # query params 가 다르면 따로 저장된다.
+    cursor_response = client.get(
+        f"{url}?pagination=cursor",
+        headers=fake_authorization_header,
+    )
+
+    assert "count" not in cursor_response.data
+
+    versions = {team: get_team_version(team) for team in Base.TeamChoices.values}
+
+    # 다른 팀의 하위 업무가 추가되면 업무를 보는 두 팀의 version 만 바뀐다.
+    subtask = SubTask.objects.create(task=fake_task, team=Base.TeamChoices.CHEOLLO)
+
+    changed_teams = {
+        team for team, version in versions.items() if get_team_version(team) != version
+    }
+
+    assert changed_teams == {Base.TeamChoices.DANBIE, Base.TeamChoices.CHEOLLO}
+
+    response = client.get(url, headers=fake_authorization_header)
+
+    assert [row["id"] for row in response.data["results"][0]["subtasks"]] == [
+        subtask.id,
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.get_subtasks
+def test_subtask_list_cache_is_invalidated_by_completion(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    fake_subtask: SubTask,
+):
+    subtask_list_url = reverse("subtask_list")
+    task_list_url = reverse("task_list")
+
+    response = client.get(subtask_list_url, headers=fake_authorization_header)
+    assert response.data["results"][0]["is_completed"] is False
+
+    response = client.get(task_list_url, headers=fake_authorization_header)
+    assert response.data["results"][0]["is_completed"] is False
+
+    response = client.patch(
+        reverse("subtask_completion", args=[fake_subtask.id]),
+        headers=fake_authorization_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    # 하위 업무와 함께 자동으로 완료 처리된 상위 업무도 바로 반영된다.
+    response = client.get(subtask_list_url, headers=fake_authorization_header)
+    assert response.data["results"][0]["is_completed"] is True
+
+    response = client.get(task_list_url, headers=fake_authorization_header)
+    assert response.data["results"][0]["is_completed"] is True
+    assert response.data["results"][0]["subtasks"][0]["is_completed"] is True
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.get_subtasks
+def test_list_cache_with_configured_cache_backend(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_subtask: SubTask,
+    settings,
+    tmp_path,
+    django_assert_num_queries,
+):
+    settings.CACHES = {
+        **settings.CACHES,
+        "lists": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(tmp_path),
+        },
+    }
+    settings.RESPONSE_CACHE = {**settings.RESPONSE_CACHE, "ALIAS": "lists"}
+
+    url = reverse("subtask_list")
+
+    client.get(url, headers=fake_authorization_header)
+
+    with django_assert_num_queries(0):
+        response = client.get(url, headers=fake_authorization_header)
+
+    assert response.data["count"] == 1
+
+    fake_subtask.delete()
+
+    response = client.get(url, headers=fake_authorization_header)
+
+    assert response.data["count"] == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.get_subtasks
+def test_team_version_expires_after_version_timeout(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_subtask: SubTask,
+    settings,
+    django_assert_num_queries,
+):
+    settings.RESPONSE_CACHE = {**settings.RESPONSE_CACHE, "VERSION_TIMEOUT": 1}
+
+    url = reverse("subtask_list")
+    key = team_version_key(fake_subtask.team)
+
+    client.get(url, headers=fake_authorization_header)
+    version = get_response_cache().get(key)
+
+    assert version is not None
+
+    # version 도 TIMEOUT 이 지나면 사라지고, 다시 만든 version 으로는 이전 응답을 조회하지 않는다.
+    time.sleep(1.1)
+
+    assert get_response_cache().get(key) is None
+
+    with django_assert_num_queries(2):
+        response = client.get(url, headers=fake_authorization_header)
+
+    assert response.data["count"] == 1
+    assert get_response_cache().get(key) > version
+
+
+@pytest.mark.django_db
+@pytest.mark.get_subtasks
+def test_list_response_is_shared_with_waiting_request(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_subtask: SubTask,
+    monkeypatch,
+):
+    url = reverse("subtask_list")
+    response = client.get(url, headers=fake_authorization_header)
+    get_response_cache().clear()
+
+    # 먼저 요청한 응답을 기다린 요청은 DB 조회 없이 그 응답 data 를 사용한다.
+    monkeypatch.setattr(
+        list_single_flight,
+        "do",
+        lambda key, func: (response.data, response["ETag"]),
+    )
+
+    shared_response = client.get(url, headers=fake_authorization_header)
+
+    assert shared_response.status_code == status.HTTP_200_OK
+    assert shared_response.data == response.data
+
+    shared_response = client.get(
+        url,
+        headers={**fake_authorization_header, "If-None-Match": response["ETag"]},
+    )
+
+    assert shared_response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def run_in_threads(count: int, target) -> tuple:
+    results = [None] * count
+
+    def run(index: int):
+        results[index] = target()
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+
+    return threads, results
+
+
+def wait_until(predicate) -> None:
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_single_flight_shares_one_execution():
+    single_flight = SingleFlight(timeout=5)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def render():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return {"count": 1}
+
+    leader, leader_results = run_in_threads(1, lambda: single_flight.do("key", render))
+    started.wait()
+
+    waiters, results = run_in_threads(4, lambda: single_flight.do("key", render))
+    wait_until(lambda: single_flight.stats()["waiting"] == 4)
+
+    release.set()
+    for thread in leader + waiters:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == leader_results * 4
+    assert single_flight.stats() == {
+        "executions": 1,
+        "coalesced": 4,
+        "timeouts": 0,
+        "waiting": 0,
+        "in_flight": 0,
+    }
+
+    # 계산이 끝난 key 는 다시 실행된다.
+    single_flight.do("key", render)
+
+    assert len(calls) == 2
+
+
+def test_single_flight_falls_back_after_timeout():
+    single_flight = SingleFlight(timeout=0.01)
+    started, release = threading.Event(), threading.Event()
+
+    def render():
+        started.set()
+        release.wait()
+        return "leader"
+
+    leader, _ = run_in_threads(1, lambda: single_flight.do("key", render))
+    started.wait()
+
+    # 기다리는 시간이 지나면 직접 계산한다.
+    assert single_flight.do("key", lambda: "own") == "own"
+
+    release.set()
+    leader[0].join()
+
+    assert single_flight.stats()["timeouts"] == 1
+    assert single_flight.stats()["executions"] == 2
+
+
+def test_single_flight_shares_error():
+    single_flight = SingleFlight(timeout=5)
+    started, release = threading.Event(), threading.Event()
+
+    def render():
+        started.set()
+        release.wait()
+        raise ValueError("failed")
+
+    def do():
+        try:
+            return single_flight.do("key", render)
+        except ValueError as error:
+            return str(error)
+
+    leader, leader_results = run_in_threads(1, do)
+    started.wait()
+
+    waiters, results = run_in_threads(2, do)
+    wait_until(lambda: single_flight.stats()["waiting"] == 2)
+
+    release.set()
+    for thread in leader + waiters:
+        thread.join()
+
+    assert leader_results + results == ["failed"] * 3
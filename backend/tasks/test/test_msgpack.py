@@ -0,0 +1,120 @@
+from rest_framework.test import APIClient
+from rest_framework import status
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+import pytest
+
+# flake8: noqa
+from subtasks.test.conftest import fake_subtask
+
+from common import negotiation
+from common.models import Base
+from tasks.models import Task
+from subtasks.models import SubTask
+
+MSGPACK = "application/msgpack"
+
+
+def decode_timestamps(data):
+    """JSON 응답의 _at 으로 끝나는 값을 datetime 으로 바꿔 MessagePack 응답과 비교한다."""
+    if isinstance(data, dict):
+        return {
+            key: (
+                parse_datetime(value)
+                if key.endswith("_at") and isinstance(value, str)
+                else decode_timestamps(value)
+            )
+            for key, value in data.items()
+        }
+
+    if isinstance(data, list):
+        return [decode_timestamps(item) for item in data]
+
+    return data
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name",
+    ["task_list", "subtask_list", "task", "subtask"],
+)
+def test_msgpack_response_round_trips_to_json(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    fake_subtask: SubTask,
+    url_name: str,
+):
+    msgpack = pytest.importorskip("msgpack")
+
+    SubTask.objects.filter(id=fake_subtask.id).update(
+        is_completed=True,
+        completed_at=timezone.now(),
+    )
+    args = {"task": [fake_task.id], "subtask": [fake_subtask.id]}.get(url_name, [])
+    url = reverse(url_name, args=args)
+
+    json_response = client.get(url, headers=fake_authorization_header)
+    msgpack_response = client.get(
+        url,
+        headers={**fake_authorization_header, "Accept": MSGPACK},
+    )
+
+    assert json_response["Content-Type"] == "application/json"
+    assert msgpack_response.status_code == status.HTTP_200_OK
+    assert msgpack_response["Content-Type"] == MSGPACK
+    # JSON 과 MessagePack 응답은 서로 다른 ETag 를 가진다.
+    assert msgpack_response["ETag"] != json_response["ETag"]
+
+    data = msgpack.unpackb(msgpack_response.content, timestamp=3)
+
+    assert data == decode_timestamps(json_response.json())
+
+
+@pytest.mark.django_db
+@pytest.mark.create_a_task
+def test_create_task_with_msgpack_body(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_user: dict,
+):
+    msgpack = pytest.importorskip("msgpack")
+
+    response = client.post(
+        reverse("task_create"),
+        msgpack.packb(
+            {"title": "업무", "content": "내용", "team": Base.TeamChoices.DANBIE}
+        ),
+        content_type=MSGPACK,
+        headers={**fake_authorization_header, "Accept": MSGPACK},
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert msgpack.unpackb(response.content)["title"] == "업무"
+
+    response = client.post(
+        reverse("task_create"),
+        b"\xc1",
+        content_type=MSGPACK,
+        headers=fake_authorization_header,
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+@pytest.mark.get_tasks
+def test_msgpack_is_not_acceptable_without_msgpack(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    monkeypatch,
+):
+    monkeypatch.setattr(negotiation, "msgpack", None)
+
+    response = client.get(
+        reverse("task_list"),
+        headers={**fake_authorization_header, "Accept": MSGPACK},
+    )
+
+    assert response.status_code == status.HTTP_406_NOT_ACCEPTABLE
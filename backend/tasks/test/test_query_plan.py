@@ -0,0 +1,29 @@
+import re
+
+import pytest
+
+from common.models import Base
+from subtasks.models import SubTask
+from tasks.views import TaskListView
+
+
+def assert_uses_index(queryset) -> None:
+    """sqlite의 EXPLAIN QUERY PLAN 결과에 table 전체를 읽는 SCAN이 없고 index로 조회하는지 확인한다."""
+    query_plan = queryset.explain()
+
+    assert re.search(r"\bSCAN (tasks|subtasks|users)\b", query_plan) is None, query_plan
+    assert "USING INDEX" in query_plan or "PRIMARY KEY" in query_plan, query_plan
+
+
+@pytest.mark.django_db
+@pytest.mark.query_plan
+def test_task_list_query_uses_index():
+    view = TaskListView()
+    view.user_team = Base.TeamChoices.DANBIE
+
+    queryset = view.get_queryset()
+
+    # 업무 목록, count, 하위 업무 prefetch query
+    assert_uses_index(queryset)
+    assert_uses_index(queryset.order_by())
+    assert_uses_index(SubTask.objects.filter(task_id__in=[1, 2, 3]))
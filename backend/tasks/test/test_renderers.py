@@ -0,0 +1,74 @@
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from io import BytesIO
+from zoneinfo import ZoneInfo
+
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from django.utils.translation import gettext_lazy
+import pytest
+
+from common import parsers, renderers
+from common.models import Base
+from common.parsers import FastJSONParser
+from common.renderers import FastJSONRenderer
+from tasks.management.commands.benchmark_serializers import build_tasks
+from tasks.serializers import TaskSerializer
+
+PAYLOAD = {
+    "team": Base.TeamChoices.DANBIE,
+    "created_at": datetime(2023, 11, 20, 9, 30, 0, 123456, tzinfo=dt_timezone.utc),
+    "completed_at": datetime(2023, 11, 20, 18, 30, tzinfo=ZoneInfo("Asia/Seoul")),
+    "naive_at": datetime(2023, 11, 20, 9, 30),
+    "ratio": Decimal("0.5"),
+    "message": gettext_lazy("success"),
+    "detail": ErrorDetail("업무를 찾을 수 없습니다.", code="TASK_NOT_FOUND"),
+    "separators": "line\u2028paragraph\u2029",
+    "errors": {0: ["invalid"]},
+    "empty": None,
+}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        PAYLOAD,
+        TaskSerializer(build_tasks(rows=20, subtasks_per_task=2), many=True).data,
+        # orjson 이 처리하지 못하는 값은 DRF 의 JSONRenderer 로 만든다.
+        {"big": 2**70},
+    ],
+)
+def test_fast_json_renderer_output_is_identical_to_drf(data):
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_fast_json_renderer_falls_back_without_orjson(monkeypatch):
+    monkeypatch.setattr(renderers, "orjson", None)
+
+    assert FastJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+    # 들여쓰기를 요청하면 DRF 의 JSONRenderer 로 만든다.
+    monkeypatch.undo()
+    media_type = "application/json; indent=4"
+
+    assert FastJSONRenderer().render(PAYLOAD, media_type) == JSONRenderer().render(
+        PAYLOAD,
+        media_type,
+    )
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+def test_fast_json_parser(monkeypatch, orjson_installed: bool):
+    if not orjson_installed:
+        monkeypatch.setattr(parsers, "orjson", None)
+
+    content = '{"title": "업무", "ids": [1, 2], "team": "단비"}'.encode()
+
+    assert FastJSONParser().parse(BytesIO(content)) == JSONParser().parse(
+        BytesIO(content),
+    )
+
+    for invalid in (b'{"title": ', b'{"ratio": NaN}'):
+        with pytest.raises(ParseError):
+            FastJSONParser().parse(BytesIO(invalid))
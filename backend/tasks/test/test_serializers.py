@@ -0,0 +1,61 @@
+from unittest import mock
+
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from django.utils import timezone
+import pytest
+
+# flake8: noqa
+from subtasks.test.conftest import fake_subtasks
+
+from common.serializers import CompiledListSerializer
+from tasks.management.commands.benchmark_serializers import build_tasks
+from tasks.serializers import TaskSerializer
+from tasks.models import Task
+from subtasks.serializers import SubtaskSerializer
+from subtasks.models import SubTask
+
+
+def render(serializer_class, objects) -> bytes:
+    return JSONRenderer().render(serializer_class(objects, many=True).data)
+
+
+def render_with_drf(serializer_class, objects) -> bytes:
+    with mock.patch.object(
+        CompiledListSerializer,
+        "to_representation",
+        serializers.ListSerializer.to_representation,
+    ):
+        return render(serializer_class, objects)
+
+
+@pytest.mark.django_db
+@pytest.mark.get_tasks
+@pytest.mark.parametrize("time_zone", ["Asia/Seoul", "UTC"])
+def test_compiled_list_output_is_identical_to_drf(
+    fake_subtasks: None,
+    settings,
+    time_zone: str,
+):
+    settings.TIME_ZONE = time_zone
+    SubTask.objects.filter(id__in=SubTask.objects.values("id")[:10]).update(
+        is_completed=True,
+        completed_at=timezone.now(),
+    )
+
+    tasks = list(
+        Task.objects.select_related("create_user").prefetch_related("subtasks"),
+    )
+    subtasks = list(SubTask.objects.all())
+
+    assert render(TaskSerializer, tasks) == render_with_drf(TaskSerializer, tasks)
+    assert render(SubtaskSerializer, subtasks) == render_with_drf(
+        SubtaskSerializer,
+        subtasks,
+    )
+
+
+def test_compiled_list_output_is_identical_to_drf_without_db():
+    tasks = build_tasks(rows=100, subtasks_per_task=2)
+
+    assert render(TaskSerializer, tasks) == render_with_drf(TaskSerializer, tasks)
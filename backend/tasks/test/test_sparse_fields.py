@@ -0,0 +1,184 @@
+from rest_framework.test import APIClient
+from rest_framework import status
+from django.urls import reverse
+import pytest
+
+# flake8: noqa
+from subtasks.test.conftest import fake_subtask
+
+from tasks.models import Task
+from subtasks.models import SubTask
+
+
+def get_sql(captured) -> list:
+    return [query["sql"] for query in captured.captured_queries]
+
+
+@pytest.mark.django_db
+@pytest.mark.get_tasks
+def test_get_tasks_with_fields_skips_join_and_prefetch(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    fake_subtask: SubTask,
+    django_assert_num_queries,
+):
+    url = reverse("task_list")
+
+    # 인증 유저 조회, count, 업무 조회만 실행되고 작성자 join 과 하위 업무 prefetch 는 생략된다.
+    with django_assert_num_queries(3) as captured:
+        response = client.get(
+            f"{url}?fields=id,is_completed",
+            headers=fake_authorization_header,
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"] == [{"id": fake_task.id, "is_completed": False}]
+
+    task_query = get_sql(captured)[-1]
+    assert "JOIN" not in task_query
+    assert '"tasks"."content"' not in task_query
+    assert '"tasks"."team"' not in task_query.split("WHERE")[0]
+
+
+@pytest.mark.django_db
+@pytest.mark.get_tasks
+@pytest.mark.parametrize("response_format", ["json", "columnar"])
+def test_get_tasks_without_expand_returns_pks(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_user: dict,
+    fake_task: Task,
+    fake_subtask: SubTask,
+    django_assert_num_queries,
+    response_format: str,
+):
+    url = reverse("task_list")
+
+    # 작성자는 join 하지 않고, 하위 업무는 pk 만 prefetch 한다.
+    with django_assert_num_queries(4) as captured:
+        response = client.get(
+            f"{url}?fields=id,create_user,subtasks&expand=&format={response_format}",
+            headers=fake_authorization_header,
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    task_query, subtask_query = get_sql(captured)[-2:]
+    assert "JOIN" not in task_query
+    assert '"subtasks"."team"' not in subtask_query
+
+    expected = {
+        "id": fake_task.id,
+        "create_user": fake_user["user_object"].id,
+        "subtasks": [fake_subtask.id],
+    }
+    if response_format == "json":
+        assert response.data["results"] == [expected]
+    else:
+        assert response.data["results"]["fields"] == list(expected)
+        assert response.data["results"]["columns"] == [
+            [value] for value in expected.values()
+        ]
+
+    # expand 로 지정한 필드만 객체로 담는다.
+    response = client.get(
+        f"{url}?expand=subtasks",
+        headers=fake_authorization_header,
+    )
+    result = response.data["results"][0]
+
+    assert result["create_user"] == fake_user["user_object"].id
+    assert result["subtasks"][0]["id"] == fake_subtask.id
+
+
+@pytest.mark.django_db
+@pytest.mark.get_a_task
+def test_get_task_with_fields(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_user: dict,
+    fake_task: Task,
+    django_assert_num_queries,
+):
+    url = reverse("task", args=[fake_task.id])
+
+    full_response = client.get(url, headers=fake_authorization_header)
+
+    with django_assert_num_queries(1) as captured:
+        response = client.get(
+            f"{url}?fields=id,title,create_user&expand=",
+            headers=fake_authorization_header,
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {
+        "id": fake_task.id,
+        "title": fake_task.title,
+        "create_user": fake_user["user_object"].id,
+    }
+    assert "JOIN" not in get_sql(captured)[0]
+    assert '"tasks"."content"' not in get_sql(captured)[0]
+
+    # 고른 필드가 다른 응답은 따로 cache 되고 ETag 도 다르다.
+    assert response["ETag"] != full_response["ETag"]
+    assert client.get(url, headers=fake_authorization_header).data == full_response.data
+
+
+@pytest.mark.django_db
+@pytest.mark.get_subtasks
+def test_get_subtasks_with_fields(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_subtask: SubTask,
+):
+    response = client.get(
+        f"{reverse('subtask_list')}?fields=id",
+        headers=fake_authorization_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"] == [{"id": fake_subtask.id}]
+
+
+@pytest.mark.django_db
+@pytest.mark.get_tasks
+@pytest.mark.parametrize("query", ["fields=", "fields=,"])
+def test_get_with_empty_fields_returns_all_fields(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    fake_subtask: SubTask,
+    query: str,
+):
+    # 빈 fields 는 지정하지 않은 것으로 보고 모든 필드를 담는다.
+    for url in (reverse("task_list"), reverse("task", args=[fake_task.id])):
+        full_response = client.get(url, headers=fake_authorization_header)
+        response = client.get(f"{url}?{query}", headers=fake_authorization_header)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == full_response.data
+        assert response.data != {}
+
+
+@pytest.mark.django_db
+@pytest.mark.get_tasks
+@pytest.mark.parametrize(
+    "query",
+    ["fields=id,password", "expand=team", "expand=subtasks"],
+)
+def test_get_with_invalid_field_selection(
+    client: APIClient(),
+    fake_authorization_header: dict,
+    fake_task: Task,
+    query: str,
+):
+    # 업무 상세 조회는 하위 업무를 담지 않으므로 expand 에 지정할 수 없다.
+    url = reverse("task", args=[fake_task.id])
+    if query != "expand=subtasks":
+        url = reverse("task_list")
+
+    response = client.get(f"{url}?{query}", headers=fake_authorization_header)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["detail"].code == "INVALID_FIELD_SELECTION_ERROR"
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from drf_spectacular.utils import extend_schema
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
@@ -10,18 +12,45 @@ from rest_framework.generics import (
     ListAPIView,
 )
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 
+from common.conditional import ConditionalListMixin
+from common.negotiation import ColumnarMixin, MessagePackMixin
 from common.http_exceptions import CommonHttpException
 from common.enums import MarkAsCompletion
+from common.pagination import CursorOptInPagination
 from common.permissions import IsAuthorized
+from common.response_cache import DetailCacheMixin, TeamListCacheMixin
+from common.sparse_fields import SparseFieldsMixin
+from accounts.serializers import UserSerializer
 from tasks.serializers import TaskSerializer, TaskDetailSerializer
+from tasks.cache_invalidation import invalidate_task_caches
 from tasks.models import Task
+from subtasks.models import SubTask
+from subtasks.serializers import SubtaskSerializer
+
+
+# 응답에 담는 작성자, 하위 업무의 column 과 ETag 에 사용하는 modified_at
+CREATE_USER_COLUMNS = (
+    "create_user",
+    *(f"create_user__{name}" for name in UserSerializer.Meta.fields),
+    "create_user__modified_at",
+)
+SUBTASK_COLUMNS = (*SubtaskSerializer.Meta.fields, "task_id", "modified_at")
 
 
-class TaskListView(ListAPIView):
+class TaskListView(
+    ColumnarMixin,
+    MessagePackMixin,
+    SparseFieldsMixin,
+    TeamListCacheMixin,
+    ConditionalListMixin,
+    ListAPIView,
+):
     serializer_class = TaskSerializer
+    pagination_class = CursorOptInPagination
     permission_classes = [IsAuthenticated]
+    expandable_fields = ("create_user", "subtasks")
     user_team = None
 
     @extend_schema(
@@ -33,6 +62,22 @@ class TaskListView(ListAPIView):
     def get(self, request, *args, **kwargs) -> TaskSerializer:
         """로그인한 유저의 team에 해당되는 업무와 하위 업무들을 조회한다.
         하위 업무 정보에는 id, 완료 유무, 완료 날짜, 팀 정보가 포함된다.
+        응답은 팀별로 cache 되며, 팀과 관련된 업무나 하위 업무가 바뀌면 다시 조회한다.
+        응답의 ETag 를 If-None-Match 에 담아 요청하면 바뀌지 않은 경우 304 Not Modified 를 반환한다.
+
+        Args:
+
+            - page (int): 조회할 페이지 번호
+            - pagination (str): cursor 로 지정하면 count 없이 keyset 방식으로 조회
+            - cursor (str): keyset 방식 조회 시 next, previous 링크에 담겨 전달되는 값
+            - format (str): columnar 로 지정하면 results 를 필드별 값 목록으로 담아 전달
+            - fields (str): 응답에 담을 필드를 쉼표로 구분하여 지정. 지정하지 않으면 모든 필드를 전달
+            - expand (str): create_user, subtasks 중 객체로 담을 필드를 지정. 나머지는 pk 로 전달
+
+        Raises:
+
+            - HTTPException (400 BAD REQUEST): fields, expand 에 지정할 수 없는 필드가 있는 경우
+                - code: INVALID_FIELD_SELECTION_ERROR
 
         Returns:
 
@@ -42,12 +87,65 @@ class TaskListView(ListAPIView):
         return super().get(request, *args, **kwargs)
 
     def get_queryset(self):
-        return Task.objects.prefetch_related("subtasks").filter(
-            Q(team=self.user_team) | Q(subtasks__team=self.user_team),
-        )
-
-
-class TaskCreateView(CreateAPIView):
+        """
+        유저의 팀이 담당하는 업무와, 유저의 팀이 담당하는 하위 업무를 가진 업무를 생성 날짜 기준 내림차순으로 반환
+        하위 업무 조건은 join 대신 subquery로 처리하여 업무가 중복되지 않도록 하고,
+        작성자는 같은 query에서 join하고 하위 업무는 한 번의 query로 prefetch 한다.
+        응답에 담는 필드의 column 만 조회하며, 작성자와 하위 업무를 담지 않으면 join 과 prefetch 도 생략한다.
+        """
+        subtask_task_ids = SubTask.objects.filter(team=self.user_team).values("task_id")
+
+        queryset = Task.objects.filter(
+            Q(team=self.user_team) | Q(pk__in=subtask_task_ids),
+        ).order_by("-created_at", "-id")
+
+        # ETag 와 cursor 에 필요한 column
+        columns = [
+            "id",
+            "created_at",
+            "modified_at",
+            *self.get_selected_fields(("team", "is_completed", "completed_at")),
+        ]
+
+        if self.is_field_expanded("create_user"):
+            queryset = queryset.select_related("create_user")
+            columns.extend(CREATE_USER_COLUMNS)
+        elif self.is_field_selected("create_user"):
+            columns.append("create_user")
+
+        if self.is_field_expanded("subtasks"):
+            subtasks = SubTask.objects.only(*SUBTASK_COLUMNS)
+        elif self.is_field_selected("subtasks"):
+            subtasks = SubTask.objects.only("id", "task_id")
+        else:
+            subtasks = None
+
+        if subtasks is not None:
+            queryset = queryset.prefetch_related(
+                Prefetch("subtasks", queryset=subtasks)
+            )
+
+        return queryset.only(*columns)
+
+    def get_etag_parts(self, instance: Task) -> tuple:
+        """응답에 함께 담기는 작성자와 prefetch 한 하위 업무의 변경도 ETag 에 반영한다."""
+        parts = list(super().get_etag_parts(instance))
+
+        if self.is_field_expanded("create_user"):
+            parts.append(instance.create_user.modified_at.isoformat())
+
+        if self.is_field_expanded("subtasks"):
+            parts.extend(
+                f"{subtask.pk}@{subtask.modified_at.isoformat()}"
+                for subtask in instance.subtasks.all()
+            )
+        elif self.is_field_selected("subtasks"):
+            parts.extend(subtask.pk for subtask in instance.subtasks.all())
+
+        return tuple(parts)
+
+
+class TaskCreateView(MessagePackMixin, CreateAPIView):
     serializer_class = TaskDetailSerializer
     permission_classes = [IsAuthenticated]
 
@@ -87,29 +185,57 @@ class TaskCreateView(CreateAPIView):
         return super().post(request, *args, **kwargs)
 
     def perform_create(self, serializer):
-        serializer.save(create_user=self.request.user)
+        # token 으로 만든 유저일 수 있으므로 User 객체 대신 pk 로 지정한다.
+        serializer.save(create_user_id=self.request.user.id)
 
 
-class TaskView(RetrieveUpdateDestroyAPIView):
-    queryset = Task.objects.all()
+class TaskView(
+    MessagePackMixin,
+    SparseFieldsMixin,
+    DetailCacheMixin,
+    RetrieveUpdateDestroyAPIView,
+):
+    # 응답의 작성자 정보와 권한 확인에 사용하는 작성자를 함께 조회한다.
+    queryset = Task.objects.select_related("create_user")
+    # cache 된 응답은 작성자 pk 로 권한을 확인한다.
+    detail_cache_fields = ("id", "team", "create_user_id", "modified_at")
     serializer_class = TaskDetailSerializer
     permission_classes = [IsAuthenticated, IsAuthorized]
+    expandable_fields = ("create_user",)
 
-    def check_and_handle_not_found_error(
-        self,
-        request: Request,
-        pk: int,
-    ) -> Task:
-        """pk에 해당하는 하위 업무(Task)가 존재하면 조회된 업무를 반환하고 없으면 에러를 발생시킨다.
-
-        Args:
-
-            - request (Request): Request 정보
-
-            - pk (int): Task의 pk
+    def get_queryset(self):
+        """조회 요청은 응답에 담는 필드와 권한 확인, cache 에 필요한 column 만 조회한다.
+        작성자를 객체로 담지 않으면 join 하지 않는다.
+        """
+        if self.get_field_selection() is None:
+            return super().get_queryset()
+
+        columns = [
+            "id",
+            "team",
+            "create_user",
+            "modified_at",
+            *self.get_selected_fields(
+                ("title", "content", "is_completed", "completed_at")
+            ),
+        ]
+        queryset = Task.objects.all()
+
+        if self.is_field_expanded("create_user"):
+            queryset = queryset.select_related("create_user")
+            columns.extend(CREATE_USER_COLUMNS)
+
+        return queryset.only(*columns)
+
+    def get_object(self) -> Task:
+        """pk에 해당하는 업무(Task)를 한 번만 조회하고 권한을 확인한다.
+        조회한 객체는 응답 직렬화와 권한 확인에 그대로 사용된다.
 
         Raises:
 
+            - HTTPException (403 FORBIDDEN): 권한이 없는 경우
+                - code: permission_denied
+
             - HTTPException (404 NOT FOUND): pk에 해당되는 task를 못 찾을 경우
                 - code: TASK_NOT_FOUND_ERROR
 
@@ -117,13 +243,32 @@ class TaskView(RetrieveUpdateDestroyAPIView):
 
             - Task: 조회된 Task 정보 반환
         """
-        selected_task = Task.objects.filter(pk=pk).last()
-
-        if not selected_task:
+        try:
+            selected_task = self.get_queryset().get(pk=self.kwargs["pk"])
+        except Task.DoesNotExist:
             raise CommonHttpException.TASK_NOT_FOUND_ERROR
 
+        self.check_object_permissions(self.request, selected_task)
+
         return selected_task
 
+    def get_etag_parts(self, instance: Task) -> tuple:
+        # 응답에 담기는 작성자 정보가 바뀐 경우도 반영한다.
+        if not self.is_field_expanded("create_user"):
+            return super().get_etag_parts(instance)
+
+        return (
+            *super().get_etag_parts(instance),
+            instance.create_user.modified_at.isoformat(),
+        )
+
+    def get_last_modified(self, instance: Task) -> datetime:
+        # ETag 와 같이 응답에 담기는 작성자 정보가 바뀐 시각도 반영한다.
+        if not self.is_field_expanded("create_user"):
+            return super().get_last_modified(instance)
+
+        return max(instance.modified_at, instance.create_user.modified_at)
+
     @extend_schema(
         tags=["Task"],
         request=TaskDetailSerializer,
@@ -138,13 +283,21 @@ class TaskView(RetrieveUpdateDestroyAPIView):
         **kwargs,
     ) -> TaskDetailSerializer:
         """pk에 해당하는 특정 업무(Task)를 조회한다.
+        응답의 ETag 를 If-None-Match 에 담거나 Last-Modified 를 If-Modified-Since 에 담아 요청하면
+        바뀌지 않은 경우 직렬화하지 않고 304 Not Modified 를 반환한다.
+        응답은 객체별로 cache 되며, cache 된 권한 정보로 DB 조회 없이 권한을 확인한다.
 
         Args:
 
             - pk (int): Task의 pk로 패스 파라미터에 담아 전달한다.
+            - fields (str): 응답에 담을 필드를 쉼표로 구분하여 지정. 지정하지 않으면 모든 필드를 전달
+            - expand (str): create_user 를 지정하지 않으면 작성자를 pk 로 전달. 지정하지 않으면 객체로 전달
 
         Raises:
 
+            - HTTPException (400 BAD REQUEST): fields, expand 에 지정할 수 없는 필드가 있는 경우
+                - code: INVALID_FIELD_SELECTION_ERROR
+
             - HTTPException (404 NOT FOUND): pk에 해당되는 task를 못 찾을 경우
                 - code: TASK_NOT_FOUND_ERROR
 
@@ -152,7 +305,6 @@ class TaskView(RetrieveUpdateDestroyAPIView):
 
             - Response (200 OK): pk에 해당하는 task를 직렬화하여 반환
         """
-        self.check_and_handle_not_found_error(request, pk)
         return super().get(request, *args, **kwargs)
 
     @extend_schema(
@@ -186,7 +338,6 @@ class TaskView(RetrieveUpdateDestroyAPIView):
 
             - Response (204 NO CONTENT): 성공 메세지 반환
         """
-        self.check_and_handle_not_found_error(request, pk)
         return super().delete(request, pk, *args, **kwargs)
 
     @extend_schema(
@@ -222,7 +373,6 @@ class TaskView(RetrieveUpdateDestroyAPIView):
 
             - Response (200 OK): 수정된 업무를 직렬화하여 반환
         """
-        self.check_and_handle_not_found_error(request, pk)
         return super().put(request, *args, **kwargs)
 
     @extend_schema(
@@ -258,11 +408,10 @@ class TaskView(RetrieveUpdateDestroyAPIView):
 
             - Response (200 OK): 수정된 업무를 직렬화하여 반환
         """
-        self.check_and_handle_not_found_error(request, pk)
         return super().patch(request, *args, **kwargs)
 
 
-class MarkAsCompletionView(APIView):
+class MarkAsCompletionView(MessagePackMixin, APIView):
     serializer_class = TaskDetailSerializer
     permission_classes = [IsAuthenticated]
 
@@ -275,6 +424,7 @@ class MarkAsCompletionView(APIView):
     def patch(self, request: Request, pk: int) -> Response:
         """pk 정보에 해당되는 Task의 완료 유무 상태(is_completed)를 완료 상태로 변경한다.
         직접 완료처리를 하는 것 외에도 하위 업무 모두가 완료처리 되면 업무도 완료처리 된다.
+        하나의 조건부 UPDATE 문으로 처리하며, 이미 완료된 업무를 다시 요청해도 성공으로 응답한다.
 
         Args:
 
@@ -292,26 +442,36 @@ class MarkAsCompletionView(APIView):
 
             - Response (200 OK): 성공 메세지 반환
         """
-        selected_task = Task.objects.filter(id=pk).last()
-
-        if not selected_task:
-            raise CommonHttpException.TASK_NOT_FOUND_ERROR
-
-        if selected_task.create_user.id != request.user.id:
-            raise exceptions.PermissionDenied
-
-        initial_data = {
-            MarkAsCompletion.is_completed: True,
-            MarkAsCompletion.completed_at: timezone.localtime(timezone.now()),
-        }
-
-        serializer = self.serializer_class(
-            selected_task,
-            data=initial_data,
-            partial=True,
+        now = timezone.now()
+
+        # 작성자의 미완료 업무인 경우에만 완료 처리하고, 내용 등 다른 필드는 다시 쓰지 않는다.
+        updated = Task.objects.filter(
+            id=pk,
+            create_user_id=request.user.id,
+            is_completed=False,
+        ).update(
+            **{
+                MarkAsCompletion.is_completed: True,
+                MarkAsCompletion.completed_at: now,
+            },
+            modified_at=now,
         )
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+
+        if updated:
+            invalidate_task_caches(task_ids=[pk])
+        else:
+            # 완료 처리되지 않은 이유를 확인한다. 이미 완료된 업무라면 그대로 성공으로 응답한다.
+            create_user_id = (
+                Task.objects.filter(id=pk)
+                .values_list("create_user_id", flat=True)
+                .first()
+            )
+
+            if create_user_id is None:
+                raise CommonHttpException.TASK_NOT_FOUND_ERROR
+
+            if create_user_id != request.user.id:
+                raise exceptions.PermissionDenied
 
         return Response(
             {"message": "success to mark as completion"},